@@ -0,0 +1,308 @@
+"""
+Benchmarks do gerador de horários.
+
+Subcomandos:
+
+- substituicao: executa o AG com cada estratégia de substituição (mesma seed,
+  mesma população e mesmo número de gerações) e reporta o orçamento de
+  avaliações e a velocidade de convergência de cada uma
+- solver: compara o AG com o backend exato CP-SAT no mesmo tempo de parede
+  (e o CP-SAT partindo da melhor solução do AG)
+- jobs: executa vários jobs do AG ao mesmo tempo, cada um com um pool do
+  tamanho da máquina (como vários main.py) e com o orçamento de workers
+  dividido pelo JobScheduler, e compara o tempo total e a vazão
+- crossover: executa o AG com cada operador de crossover (mesmas seeds) e
+  compara o tempo e as avaliações até um alvo de fitness comum
+
+Uso:
+    python benchmark.py substituicao --generations 200
+    python benchmark.py substituicao --strategies geracional steady_state --seeds 13 14 15
+    python benchmark.py solver --generations 1000
+    python benchmark.py jobs --jobs 4 --generations 100
+    python benchmark.py crossover --generations 500 --seeds 13 14 15
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+import numpy as np
+
+
+def _avaliacoes_ate_alvo(best_fitness_history, avaliacoes_por_geracao, alvo):
+    """Avaliações (ou tempo) gastos até o melhor fitness atingir o alvo (None se não atingiu)."""
+    for best, aval in zip(best_fitness_history, avaliacoes_por_geracao):
+        if best >= alvo:
+            return aval
+    return None
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    from src.genetic_algorithm import ESTRATEGIAS_SUBSTITUICAO
+    from src.crossover import OPERADORES_CROSSOVER
+    
+    parser = argparse.ArgumentParser(description="Benchmarks do gerador de horários")
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+    
+    substituicao = sub.add_parser(
+        "substituicao", help="Compara as estratégias de substituição do AG por avaliações de fitness"
+    )
+    substituicao.add_argument("--generations", type=int, default=200, help="Gerações por execução")
+    substituicao.add_argument("--population", type=int, default=None,
+                              help="Tamanho da população (padrão: POPULATION_SIZE)")
+    substituicao.add_argument("--strategies", nargs="+", choices=ESTRATEGIAS_SUBSTITUICAO,
+                              default=list(ESTRATEGIAS_SUBSTITUICAO), help="Estratégias comparadas")
+    substituicao.add_argument("--seeds", nargs="+", type=int, default=None,
+                              help="Seeds das repetições (padrão: RANDOM_SEED)")
+    
+    solver = sub.add_parser("solver", help="Compara o AG com o backend CP-SAT no mesmo tempo")
+    solver.add_argument("--generations", type=int, default=1000,
+                        help="Gerações do AG; o CP-SAT recebe o mesmo tempo de parede")
+    solver.add_argument("--population", type=int, default=None,
+                        help="Tamanho da população (padrão: POPULATION_SIZE)")
+    
+    jobs = sub.add_parser("jobs", help="Compara jobs concorrentes com e sem orçamento de workers")
+    jobs.add_argument("--jobs", type=int, default=4, help="Jobs submetidos ao mesmo tempo")
+    jobs.add_argument("--generations", type=int, default=100, help="Gerações de cada job")
+    jobs.add_argument("--population", type=int, default=None,
+                      help="Tamanho da população (padrão: POPULATION_SIZE)")
+    jobs.add_argument("--budget", type=int, default=None,
+                      help="Orçamento de workers (padrão: número de CPUs)")
+    
+    crossover = sub.add_parser("crossover", help="Compara os operadores de crossover pelo tempo até um alvo")
+    crossover.add_argument("--generations", type=int, default=500, help="Gerações por execução")
+    crossover.add_argument("--population", type=int, default=None,
+                           help="Tamanho da população (padrão: POPULATION_SIZE)")
+    crossover.add_argument("--operators", nargs="+", choices=OPERADORES_CROSSOVER,
+                           default=list(OPERADORES_CROSSOVER), help="Operadores comparados")
+    crossover.add_argument("--seeds", nargs="+", type=int, default=None,
+                           help="Seeds das repetições (padrão: RANDOM_SEED)")
+    crossover.add_argument("--target", type=float, default=None,
+                           help="Fitness alvo (padrão: pior fitness final entre as execuções)")
+    return parser.parse_args(argv)
+
+
+def _carregar_toolbox(**opcoes):
+    """Carrega a instância (cache) e configura o toolbox do AG (opcoes vão para setup_deap_toolbox)."""
+    from src.cache import load_cached_problem
+    from src.genetic_algorithm import setup_deap_toolbox
+    
+    problem, problem_path, _ = load_cached_problem()
+    toolbox = setup_deap_toolbox(
+        chromosome_size=problem.chromosome_size,
+        valid_slot_ids=problem.valid_slot_ids,
+        expanded_disciplines=problem.expanded_disciplines,
+        slot_mapping=problem.slot_mapping,
+        disciplinas_unicas=problem.disciplinas,
+        problem_path=problem_path,
+        **opcoes
+    )
+    return problem, toolbox
+
+
+def benchmark_substituicao(args) -> None:
+    """Executa cada estratégia de substituição e imprime a tabela comparativa."""
+    from src import config
+    from src.genetic_algorithm import run_genetic_algorithm
+    
+    _, toolbox = _carregar_toolbox()
+    population_size = args.population or config.POPULATION_SIZE
+    seeds = args.seeds or [config.RANDOM_SEED]
+    
+    execucoes = {}
+    for estrategia in args.strategies:
+        for seed in seeds:
+            random.seed(seed)
+            np.random.seed(seed)
+            inicio = time.time()
+            _, best_hist, _, _, top_fitnesses, stats = run_genetic_algorithm(
+                toolbox,
+                population_size=population_size,
+                num_generations=args.generations,
+                estrategia=estrategia,
+                verbose=False
+            )
+            execucoes.setdefault(estrategia, []).append(
+                (top_fitnesses[0], best_hist, stats, time.time() - inicio)
+            )
+            print(f"{estrategia:>18} | seed {seed}: {top_fitnesses[0]:.0f} "
+                  f"({stats['avaliacoes']} avaliações)")
+    
+    # Alvo comum: o pior resultado final entre todas as execuções, atingido por todas
+    alvo = min(fit for runs in execucoes.values() for fit, _, _, _ in runs)
+    
+    print(f"\nAlvo de convergência: {alvo:.0f} (pior fitness final entre as execuções)\n")
+    print(f"{'Estratégia':>18} | {'Fitness':>9} | {'Avaliações':>10} | "
+          f"{'Aval. até alvo':>14} | {'Aval. até melhor':>16} | {'Tempo (s)':>9}")
+    for estrategia, runs in execucoes.items():
+        ate_alvo = [_avaliacoes_ate_alvo(hist, stats["avaliacoes_por_geracao"], alvo)
+                    for _, hist, stats, _ in runs]
+        print(f"{estrategia:>18} | "
+              f"{np.mean([r[0] for r in runs]):>9.0f} | "
+              f"{np.mean([r[2]['avaliacoes'] for r in runs]):>10.0f} | "
+              f"{np.mean([a for a in ate_alvo if a is not None]):>14.0f} | "
+              f"{np.mean([r[2]['avaliacoes_ate_melhor'] for r in runs]):>16.0f} | "
+              f"{np.mean([r[3] for r in runs]):>9.1f}")
+
+
+def benchmark_solver(args) -> None:
+    """Compara AG e CP-SAT no mesmo tempo de parede."""
+    from src import config
+    from src.cpsat import HAS_ORTOOLS, solve_cpsat
+    from src.genetic_algorithm import run_genetic_algorithm
+    
+    if not HAS_ORTOOLS:
+        print("O benchmark solver requer o OR-Tools: pip install ortools")
+        return
+    
+    problem, toolbox = _carregar_toolbox()
+    random.seed(config.RANDOM_SEED)
+    np.random.seed(config.RANDOM_SEED)
+    
+    inicio = time.time()
+    _, best_hist, _, top_individuals, top_fitnesses, stats = run_genetic_algorithm(
+        toolbox,
+        population_size=args.population or config.POPULATION_SIZE,
+        num_generations=args.generations,
+        verbose=False
+    )
+    tempo_ag = time.time() - inicio
+    print(f"AG: {top_fitnesses[0]:.0f} em {tempo_ag:.1f}s ({args.generations} gerações)")
+    
+    cpsat = solve_cpsat(problem.disciplinas, problem.slots, tempo_limite=tempo_ag)
+    print(f"CP-SAT: {cpsat.fitness} em {cpsat.tempo:.1f}s (status {cpsat.status}, "
+          f"limite superior {cpsat.limite})")
+    
+    hibrido = solve_cpsat(problem.disciplinas, problem.slots, tempo_limite=tempo_ag,
+                          dica=top_individuals[0])
+    print(f"CP-SAT a partir do AG: {hibrido.fitness} em {hibrido.tempo:.1f}s (status {hibrido.status})")
+    
+    # Alvo comum: o pior resultado final entre os dois métodos independentes
+    finais = [top_fitnesses[0]] + ([cpsat.fitness] if cpsat.fitness is not None else [])
+    alvo = min(finais)
+    ag_ate_alvo = _avaliacoes_ate_alvo(best_hist, stats["tempo_por_geracao"], alvo)
+    cpsat_ate_alvo = next((t for t, fit in cpsat.historico if fit >= alvo), None)
+    
+    def _fmt(valor, formato):
+        return format(valor, formato) if valor is not None else "-"
+    
+    print(f"\nAlvo: {alvo:.0f} (pior fitness final entre AG e CP-SAT)\n")
+    print(f"{'Método':>22} | {'Fitness':>9} | {'Tempo até alvo (s)':>18} | {'Tempo total (s)':>15}")
+    print(f"{'AG':>22} | {top_fitnesses[0]:>9.0f} | {_fmt(ag_ate_alvo, '>18.1f')} | {tempo_ag:>15.1f}")
+    print(f"{'CP-SAT':>22} | {_fmt(cpsat.fitness, '>9.0f')} | {_fmt(cpsat_ate_alvo, '>18.1f')} | {cpsat.tempo:>15.1f}")
+    print(f"{'CP-SAT a partir do AG':>22} | {_fmt(hibrido.fitness, '>9.0f')} | {'-':>18} | "
+          f"{tempo_ag + hibrido.tempo:>15.1f}")
+
+
+async def _executar_jobs(problem_path, parametros, num_jobs, orcamento, workers_por_job):
+    """Submete num_jobs jobs iguais e aguarda todos; retorna (tempo total, jobs)."""
+    from src.scheduler import JobScheduler
+    
+    escalonador = JobScheduler(orcamento=orcamento, workers_por_job=workers_por_job,
+                               fila_maxima=num_jobs)
+    await escalonador.iniciar()
+    inicio = time.time()
+    jobs = [escalonador.submeter("benchmark", problem_path, dict(parametros, seed=i))
+            for i in range(num_jobs)]
+    for job in jobs:
+        await escalonador.aguardar(job.id)
+    total = time.time() - inicio
+    await escalonador.encerrar()
+    return total, jobs
+
+
+def benchmark_jobs(args) -> None:
+    """Compara vários jobs com pools do tamanho da máquina e com o orçamento dividido."""
+    from src import config
+    from src.cache import load_cached_problem
+    
+    _, problem_path, _ = load_cached_problem()
+    cpus = os.cpu_count() or 1
+    orcamento = args.budget or cpus
+    parametros = {"mode": "ga", "generations": args.generations,
+                  "population": args.population or config.POPULATION_SIZE}
+    
+    cenarios = [
+        # Como vários main.py: todos iniciam juntos, cada um com um pool de todos os núcleos
+        ("sem orçamento", args.jobs * cpus, cpus),
+        # Orçamento dividido: a soma dos workers em execução não passa do orçamento
+        ("orçamento dividido", orcamento, max(1, orcamento // args.jobs)),
+    ]
+    print(f"{args.jobs} jobs de {args.generations} gerações | {cpus} CPUs | orçamento {orcamento}\n")
+    print(f"{'Cenário':>20} | {'Workers/job':>11} | {'Tempo total (s)':>15} | "
+          f"{'Jobs/min':>8} | {'Espera média (s)':>16} | {'Execução média (s)':>18}")
+    for nome, orcamento_cenario, workers in cenarios:
+        total, jobs = asyncio.run(_executar_jobs(problem_path, parametros, args.jobs,
+                                                 orcamento_cenario, workers))
+        falhas = [job for job in jobs if job.status != "concluido"]
+        if falhas:
+            print(f"{nome:>20} | {len(falhas)} job(s) sem sucesso: {falhas[0].erro}")
+            continue
+        print(f"{nome:>20} | {workers:>11} | {total:>15.1f} | {60 * len(jobs) / total:>8.2f} | "
+              f"{np.mean([job.tempo_espera for job in jobs]):>16.1f} | "
+              f"{np.mean([job.tempo_execucao for job in jobs]):>18.1f}")
+
+
+def benchmark_crossover(args) -> None:
+    """Executa cada operador de crossover e imprime o tempo e as avaliações até o alvo."""
+    from src import config
+    from src.genetic_algorithm import run_genetic_algorithm
+    
+    population_size = args.population or config.POPULATION_SIZE
+    seeds = args.seeds or [config.RANDOM_SEED]
+    
+    execucoes = {}
+    for operador in args.operators:
+        _, toolbox = _carregar_toolbox(crossover=operador)
+        for seed in seeds:
+            random.seed(seed)
+            np.random.seed(seed)
+            _, best_hist, _, _, top_fitnesses, stats = run_genetic_algorithm(
+                toolbox,
+                population_size=population_size,
+                num_generations=args.generations,
+                verbose=False
+            )
+            execucoes.setdefault(operador, []).append((top_fitnesses[0], best_hist, stats))
+            print(f"{operador:>12} | seed {seed}: {top_fitnesses[0]:.0f} "
+                  f"({stats['tempo_por_geracao'][-1]:.1f} s)")
+    
+    alvo = args.target
+    if alvo is None:
+        alvo = min(fit for runs in execucoes.values() for fit, _, _ in runs)
+    
+    print(f"\nAlvo: {alvo:.0f}\n")
+    print(f"{'Operador':>12} | {'Fitness':>9} | {'Atingiram':>9} | "
+          f"{'Tempo até alvo (s)':>18} | {'Aval. até alvo':>14}")
+    for operador, runs in execucoes.items():
+        tempos = [_avaliacoes_ate_alvo(hist, stats["tempo_por_geracao"], alvo) for _, hist, stats in runs]
+        avaliacoes = [_avaliacoes_ate_alvo(hist, stats["avaliacoes_por_geracao"], alvo)
+                      for _, hist, stats in runs]
+        atingiram = [i for i, t in enumerate(tempos) if t is not None]
+        tempo_medio = np.mean([tempos[i] for i in atingiram]) if atingiram else float("nan")
+        aval_media = np.mean([avaliacoes[i] for i in atingiram]) if atingiram else float("nan")
+        print(f"{operador:>12} | "
+              f"{np.mean([r[0] for r in runs]):>9.0f} | "
+              f"{len(atingiram):>4}/{len(runs):<4} | "
+              f"{tempo_medio:>18.1f} | "
+              f"{aval_media:>14.0f}")
+
+
+def main(argv=None):
+    """Executa o benchmark escolhido."""
+    args = _parse_args(argv)
+    if args.benchmark == "crossover":
+        benchmark_crossover(args)
+    elif args.benchmark == "jobs":
+        benchmark_jobs(args)
+    elif args.benchmark == "solver":
+        benchmark_solver(args)
+    else:
+        benchmark_substituicao(args)
+
+
+if __name__ == "__main__":
+    main()
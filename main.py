@@ -4,37 +4,515 @@ Gerador de Horários com Algoritmo Genético
 
 Sistema de geração automática de horários para o curso de Ciência da Computação
 da UTFPR - Santa Helena, utilizando Algoritmos Genéticos.
+
+As dependências pesadas (deap, numpy, matplotlib, tabulate, pandas) são
+importadas apenas quando necessárias, para que execuções curtas e processos
+de avaliação paralela iniciem rapidamente.
 """
 
 import sys
-import random
 import time
-import numpy as np
-from pathlib import Path
+import argparse
 from collections import Counter
+from pathlib import Path
+
+
+# Módulos importados por etapa, na ordem em que o programa precisa deles.
+# Os módulos de renderização ficam por último: só são carregados na exportação.
+ETAPAS_IMPORTACAO = [
+    ("configuração", ["src.config"]),
+    ("carregamento de dados", ["src.data_loader", "src.cache"]),
+    ("avaliador (workers)", ["src.fitness"]),
+    ("algoritmo genético", ["src.genetic_algorithm"]),
+    ("decodificação e saída", ["src.decoder", "src.output_manager", "src.visualization"]),
+    ("console", ["rich.console"]),
+    ("renderização (adiada)", ["tabulate", "matplotlib.pyplot"]),
+    ("pandas (fallback opcional)", ["pandas"]),
+]
 
-# Importar módulos do projeto
-from src.config import RANDOM_SEED
-from src.data_loader import load_and_validate_csv
-from src.chromosome import build_chromosome_template, create_slot_mapping
-from src.genetic_algorithm import setup_deap_toolbox, run_genetic_algorithm
-from src.decoder import decode_schedule, get_fitness_details
-from src.visualization import print_schedule, export_html, plot_fitness_evolution
-from src.output_manager import OutputManager
-from src import config
-
-# Verificar se rich está disponível
-try:
-    from rich.console import Console
-    console = Console()
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
-
-
-def main():
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Gerador de horários com Algoritmo Genético"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Mede o tempo de importação de cada etapa e encerra sem executar o AG"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["ga", "nsga2", "nsga3", "cpsat", "sa", "tabu", "decomposicao"],
+        default="ga",
+        help="ga: AG mono-objetivo com pesos PESO_*; nsga2/nsga3: frente de Pareto "
+             "entre blocos, distribuição e lacunas (conflitos como restrição); "
+             "cpsat: modelo exato com o CP-SAT do OR-Tools (requer ortools); "
+             "sa/tabu: Simulated Annealing ou Busca Tabu com avaliação incremental; "
+             "decomposicao: um AG por período em paralelo, coordenados pelos professores "
+             "compartilhados (--generations, --population e --workers valem por período)"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=None,
+        help="Iterações dos modos sa/tabu (padrão: SA_ITERACOES/TABU_ITERACOES em src/config.py)"
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="Tempo máximo de busca do modo cpsat em segundos "
+             "(padrão: CPSAT_TEMPO_LIMITE em src/config.py)"
+    )
+    parser.add_argument(
+        "--generations",
+        type=int,
+        default=None,
+        help="Número de gerações (padrão: NUM_GENERATIONS em src/config.py)"
+    )
+    parser.add_argument(
+        "--population",
+        type=int,
+        default=None,
+        help="Tamanho da população (padrão: POPULATION_SIZE em src/config.py)"
+    )
+    parser.add_argument(
+        "--replacement",
+        choices=["geracional", "mu_mais_lambda", "mu_virgula_lambda", "steady_state"],
+        default=None,
+        help="Estratégia de substituição da população no modo ga "
+             "(padrão: ESTRATEGIA_SUBSTITUICAO em src/config.py)"
+    )
+    parser.add_argument(
+        "--representation",
+        choices=["slots", "blocos", "permutacao"],
+        default=None,
+        help="Codificação do cromossomo no modo ga: um gene por aula (slots), por bloco "
+             "de 2-3 aulas consecutivas (blocos) ou ordem de prioridade dos blocos com "
+             "decodificador guloso sem conflitos (permutacao) "
+             "(padrão: REPRESENTACAO em src/config.py)"
+    )
+    parser.add_argument(
+        "--crossover",
+        choices=["dois_pontos", "disciplinas", "periodos", "pmx", "ordenado"],
+        default=None,
+        help="Operador de crossover no modo ga; pmx e ordenado são da representação por permutação "
+             "(padrão: OPERADOR_CROSSOVER ou CROSSOVER_PERMUTACAO em src/config.py)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processos de avaliação dos modos ga, nsga2 e nsga3 (padrão: AVALIACAO_WORKERS em src/config.py, "
+             "todos os núcleos; 1 = sem pool)"
+    )
+    parser.add_argument(
+        "--lexicographic-bound",
+        type=float,
+        default=None,
+        help="Avaliação lexicográfica no modo ga: acima desta penalidade de conflitos, "
+             "as penalidades de qualidade não são calculadas "
+             "(padrão: LIMITE_PENALIDADE_CRITICA em src/config.py)"
+    )
+    parser.add_argument(
+        "--canonical",
+        action="store_true",
+        help="Genomas canônicos no modo ga: ordena as aulas de cada disciplina e "
+             "reaproveita o fitness de horários repetidos (padrão: GENOMA_CANONICO em src/config.py)"
+    )
+    parser.add_argument(
+        "--warm-start",
+        metavar="CAMINHO",
+        default=None,
+        help="Replaneja a partir de uma execução anterior: top_individuals.pkl, "
+             "schedule_rank_N.json ou o diretório outputs/run_* (modos ga, sa, tabu e cpsat)"
+    )
+    parser.add_argument(
+        "--rank",
+        type=int,
+        default=1,
+        help="Horário da execução anterior usado no --warm-start (1 = melhor)"
+    )
+    parser.add_argument(
+        "--deviation-weight",
+        type=int,
+        default=None,
+        help="Penalidade por aula deslocada em relação ao horário do --warm-start "
+             "(padrão: PESO_DESVIO em src/config.py; 0 = desativada)"
+    )
+    parser.add_argument(
+        "--csv-dir",
+        default="CSVs",
+        help="Diretório com horarios.csv e os arquivos de disciplinas: disciplinas.csv e/ou "
+             "disciplinas_<CURSO>.csv (vários cursos reunidos em uma instância)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignora o cache de instâncias compiladas e lê os CSVs diretamente"
+    )
+    return parser.parse_args(argv)
+
+
+def _load_console():
+    """Retorna um Console do rich, ou None se a biblioteca não estiver instalada."""
+    try:
+        from rich.console import Console
+        return Console()
+    except ImportError:
+        return None
+
+
+def _profile_startup() -> None:
+    """
+    Imprime o tempo de importação de cada etapa do programa.
+    
+    Cada etapa é medida na ordem em que o programa a carrega, portanto o tempo
+    de um módulo já importado por uma etapa anterior aparece como zero. O custo
+    de um worker de avaliação é medido em um processo novo, como no modo spawn.
+    """
+    import importlib
+    import subprocess
+    
+    inicio_total = time.perf_counter()
+    print("\nPerfil de inicialização (tempos de importação)")
+    print("=" * 60)
+    print(f"{'Etapa':<30} {'Módulos':>8} {'Tempo (ms)':>12}")
+    print("-" * 60)
+    
+    for etapa, modulos in ETAPAS_IMPORTACAO:
+        inicio = time.perf_counter()
+        carregados = 0
+        for nome in modulos:
+            if nome in sys.modules:
+                continue
+            try:
+                importlib.import_module(nome)
+                carregados += 1
+            except ImportError:
+                pass
+        elapsed_ms = (time.perf_counter() - inicio) * 1000
+        print(f"{etapa:<30} {carregados:>8} {elapsed_ms:>12.1f}")
+    
+    print("-" * 60)
+    print(f"{'Total':<30} {len(sys.modules):>8} {(time.perf_counter() - inicio_total) * 1000:>12.1f}")
+    
+    # Custo de importação em um worker recém-criado (modo spawn)
+    codigo = (
+        "import sys, time; t = time.perf_counter(); import src.fitness; "
+        "print((time.perf_counter() - t) * 1000, "
+        "any(m in sys.modules for m in ('pandas', 'matplotlib', 'tabulate', 'deap')))"
+    )
+    try:
+        saida = subprocess.run(
+            [sys.executable, "-c", codigo],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        pesados = " (carrega bibliotecas pesadas!)" if saida[1] == "True" else ""
+        print(f"\nWorker de avaliação (processo novo): {float(saida[0]):.1f} ms{pesados}")
+    except (subprocess.CalledProcessError, IndexError, ValueError):
+        print("\nNão foi possível medir a importação do worker de avaliação.")
+
+
+def _run_multiobjective(args, problem, console) -> None:
+    """Executa o modo multiobjetivo e salva a frente de Pareto com os horários decodificados."""
+    from src import config
+    from src.fitness import OBJETIVOS, evaluate_fitness
+    from src.multiobjective import setup_nsga_toolbox, run_nsga
+    from src.decoder import decode_schedule, get_fitness_details
+    from src.visualization import print_schedule
+    from src.output_manager import OutputManager
+    
+    HAS_RICH = console is not None
+    expanded_disciplines = problem.expanded_disciplines
+    slot_mapping = problem.slot_mapping
+    
+    toolbox = setup_nsga_toolbox(
+        chromosome_size=problem.chromosome_size,
+        valid_slot_ids=problem.valid_slot_ids,
+        expanded_disciplines=expanded_disciplines,
+        slot_mapping=slot_mapping,
+        disciplinas_unicas=problem.disciplinas,
+        variante=args.mode
+    )
+    
+    population_size = args.population or config.POPULATION_SIZE
+    num_generations = args.generations or config.NUM_GENERATIONS
+    
+    start_time = time.time()
+    num_workers = args.workers or config.AVALIACAO_WORKERS
+    frente, historico = run_nsga(toolbox, population_size=population_size,
+                                 num_generations=num_generations, num_workers=num_workers)
+    execution_time = time.time() - start_time
+    
+    # Decodificar cada solução da frente; o fitness escalar (pesos atuais) serve de referência
+    solutions = []
+    for ind in frente:
+        fitness = evaluate_fitness(ind, expanded_disciplines, slot_mapping, problem.disciplinas)[0]
+        solutions.append({
+            "objectives": dict(zip(OBJETIVOS, (float(v) for v in ind.fitness.values))),
+            "violation": float(ind.violacao),
+            "fitness": float(fitness),
+            "chromosome": list(ind),
+            "schedule": decode_schedule(ind, expanded_disciplines, slot_mapping),
+        })
+    solutions.sort(key=lambda s: -s["fitness"])
+    
+    print(f"\n{'#':>3} | {'Violação':>8} | " + " | ".join(f"{n:>12}" for n in OBJETIVOS) + f" | {'Fitness':>8}")
+    for i, sol in enumerate(solutions, 1):
+        objetivos = " | ".join(f"{sol['objectives'][n]:>12.0f}" for n in OBJETIVOS)
+        print(f"{i:>3} | {sol['violation']:>8.0f} | {objetivos} | {sol['fitness']:>8.0f}")
+    
+    # Imprimir a solução da frente com maior fitness escalar
+    melhor = solutions[0]
+    print_schedule(melhor["schedule"], get_fitness_details(
+        melhor["chromosome"], expanded_disciplines, slot_mapping, problem.disciplinas
+    ))
+    
+    output_manager = OutputManager()
+    output_manager.save_pareto_front(
+        solutions=solutions,
+        history=historico,
+        execution_time=execution_time,
+        config={
+            "mode": args.mode,
+            "population_size": population_size,
+            "num_generations": num_generations,
+            "crossover_prob": config.CROSSOVER_PROB,
+            "mutation_prob": config.MUTATION_PROB,
+            "mutation_indpb": config.MUTATION_INDPB,
+            "random_seed": config.RANDOM_SEED,
+            "evaluation_workers": num_workers,
+            "objectives": list(OBJETIVOS),
+        }
+    )
+    
+    if HAS_RICH:
+        console.print(f"[green]OK[/green] Outputs salvos em: {output_manager.get_run_directory()}")
+    else:
+        print(f"OK - Outputs salvos em: {output_manager.get_run_directory()}")
+
+
+def _run_cpsat(args, problem, console, dica=None) -> None:
+    """
+    Resolve a instância com o backend CP-SAT e salva os mesmos outputs do AG.
+    
+    dica (horário mapeado pelo --warm-start) é usada como solução inicial.
+    """
+    from src import config
+    from src.cpsat import HAS_ORTOOLS, solve_cpsat
+    from src.decoder import detalhes_do_vetor
+    from src.fitness import vetor_caracteristicas
+    from src.visualization import print_schedule
+    from src.output_manager import OutputManager
+    from src.export import export_top_k
+    from src.reweight import salvar_caracteristicas
+    
+    HAS_RICH = console is not None
+    if not HAS_ORTOOLS:
+        mensagem = "O modo cpsat requer o OR-Tools. Instale com: pip install ortools"
+        if HAS_RICH:
+            console.print(f"[bold red]ERRO:[/bold red] {mensagem}")
+        else:
+            print(f"ERRO: {mensagem}")
+        sys.exit(1)
+    
+    tempo_limite = args.time_limit or config.CPSAT_TEMPO_LIMITE
+    if HAS_RICH:
+        console.print(f"[bold cyan]Resolvendo com CP-SAT (limite de {tempo_limite:.0f}s)...[/bold cyan]\n")
+    else:
+        print(f"Resolvendo com CP-SAT (limite de {tempo_limite:.0f}s)...\n")
+    
+    resultado = solve_cpsat(problem.disciplinas, problem.slots, tempo_limite=tempo_limite, dica=dica)
+    
+    if resultado.chromosome is None:
+        mensagem = f"CP-SAT sem solução viável (status {resultado.status}) em {resultado.tempo:.1f}s"
+        if HAS_RICH:
+            console.print(f"[bold red]{mensagem}[/bold red]")
+        else:
+            print(mensagem)
+        return
+    
+    if HAS_RICH:
+        console.print(f"[green]OK[/green] Status: {resultado.status} | Fitness: [bold green]{resultado.fitness:.0f}[/bold green] | "
+                      f"Limite superior: {resultado.limite:.0f} | Tempo: {resultado.tempo:.1f}s")
+    else:
+        print(f"OK - Status: {resultado.status} | Fitness: {resultado.fitness:.0f} | "
+              f"Limite superior: {resultado.limite:.0f} | Tempo: {resultado.tempo:.1f}s")
+    
+    expanded_disciplines = problem.expanded_disciplines
+    slot_mapping = problem.slot_mapping
+    vetor = vetor_caracteristicas(resultado.chromosome, expanded_disciplines, slot_mapping)
+    fitness_info = detalhes_do_vetor(vetor)
+    # Histórico de melhorias do solver (uma entrada por solução encontrada)
+    historico = [fit for _, fit in resultado.historico]
+    
+    output_manager = OutputManager()
+    output_manager.save_execution_data(
+        top_individuals=[resultado.chromosome],
+        top_fitnesses=[resultado.fitness],
+        best_fitness_history=historico,
+        avg_fitness_history=historico,
+        execution_time=resultado.tempo,
+        config={
+            "mode": "cpsat",
+            "time_limit": tempo_limite,
+            "workers": config.CPSAT_WORKERS,
+            "status": resultado.status,
+            "upper_bound": resultado.limite,
+            "improvement_times": [t for t, _ in resultado.historico],
+        },
+        expanded_disciplines=expanded_disciplines,
+        slot_mapping=slot_mapping,
+        disciplinas_unicas=problem.disciplinas
+    )
+    # Vetor de características da solução (sem população), para src.reweight
+    salvar_caracteristicas(output_manager.get_run_directory(), [resultado.chromosome], [],
+                           expanded_disciplines, slot_mapping, elite_vetores=[vetor])
+    exportados = export_top_k(
+        run_dir=output_manager.get_run_directory(),
+        top_individuals=[resultado.chromosome],
+        top_fitnesses=[resultado.fitness],
+        expanded_disciplines=expanded_disciplines,
+        slot_mapping=slot_mapping,
+        disciplinas_unicas=problem.disciplinas,
+        grade=problem.time_grid,
+        best_fitness_history=historico,
+        avg_fitness_history=historico,
+        fitness_details=[fitness_info]
+    )
+    
+    schedule, fitness_info = exportados[0]
+    print_schedule(schedule, fitness_info)
+    
+    if HAS_RICH:
+        console.print(f"[green]OK[/green] Outputs salvos em: {output_manager.get_run_directory()}")
+    else:
+        print(f"OK - Outputs salvos em: {output_manager.get_run_directory()}")
+
+
+def _run_decomposicao(args, problem, console) -> None:
+    """Resolve a instância por período (ver decomposition.py) e salva os mesmos outputs do AG."""
+    from src import config
+    from src.decomposition import resolver_decomposto
+    from src.decoder import detalhes_do_vetor
+    from src.fitness import vetor_caracteristicas
+    from src.visualization import print_schedule
+    from src.output_manager import OutputManager
+    from src.export import export_top_k
+    from src.reweight import salvar_caracteristicas
+    
+    HAS_RICH = console is not None
+    populacao = args.population or config.DECOMPOSICAO_POPULACAO
+    geracoes = args.generations or config.DECOMPOSICAO_GERACOES
+    num_workers = args.workers or config.DECOMPOSICAO_WORKERS
+    if HAS_RICH:
+        console.print(f"[bold cyan]Resolvendo por período ({geracoes} gerações, "
+                      f"população {populacao} por período)...[/bold cyan]\n")
+    else:
+        print(f"Resolvendo por período ({geracoes} gerações, população {populacao} por período)...\n")
+    
+    expanded_disciplines = problem.expanded_disciplines
+    slot_mapping = problem.slot_mapping
+    resultado = resolver_decomposto(
+        expanded_disciplines,
+        slot_mapping,
+        problem.disciplinas,
+        populacao=populacao,
+        geracoes=geracoes,
+        num_workers=num_workers
+    )
+    
+    if HAS_RICH:
+        console.print(f"\n[green]OK[/green] Fitness: [bold green]{resultado.fitness:.0f}[/bold green] | "
+                      f"Conflitos de professor: {resultado.conflitos_iniciais} -> {resultado.conflitos} "
+                      f"em {resultado.rodadas} rodadas | Tempo: {resultado.tempo:.1f}s")
+    else:
+        print(f"\nOK - Fitness: {resultado.fitness:.0f} | "
+              f"Conflitos de professor: {resultado.conflitos_iniciais} -> {resultado.conflitos} "
+              f"em {resultado.rodadas} rodadas | Tempo: {resultado.tempo:.1f}s")
+    
+    vetor = vetor_caracteristicas(resultado.chromosome, expanded_disciplines, slot_mapping)
+    fitness_info = detalhes_do_vetor(vetor)
+    # Histórico por fase (fase paralela e cada rodada de coordenação)
+    historico = [fit for _, fit in resultado.historico]
+    
+    output_manager = OutputManager()
+    output_manager.save_execution_data(
+        top_individuals=[resultado.chromosome],
+        top_fitnesses=[resultado.fitness],
+        best_fitness_history=historico,
+        avg_fitness_history=historico,
+        execution_time=resultado.tempo,
+        config={
+            "mode": "decomposicao",
+            "population_size": populacao,
+            "num_generations": geracoes,
+            "coordination_rounds": config.DECOMPOSICAO_RODADAS,
+            "rounds_used": resultado.rodadas,
+            "workers": num_workers,
+            "random_seed": config.RANDOM_SEED,
+            "initial_conflicts": resultado.conflitos_iniciais,
+            "final_conflicts": resultado.conflitos,
+            "phase_times": [t for t, _ in resultado.historico],
+        },
+        expanded_disciplines=expanded_disciplines,
+        slot_mapping=slot_mapping,
+        disciplinas_unicas=problem.disciplinas
+    )
+    # Vetor de características da solução (sem população), para src.reweight
+    salvar_caracteristicas(output_manager.get_run_directory(), [resultado.chromosome], [],
+                           expanded_disciplines, slot_mapping, elite_vetores=[vetor])
+    exportados = export_top_k(
+        run_dir=output_manager.get_run_directory(),
+        top_individuals=[resultado.chromosome],
+        top_fitnesses=[resultado.fitness],
+        expanded_disciplines=expanded_disciplines,
+        slot_mapping=slot_mapping,
+        disciplinas_unicas=problem.disciplinas,
+        grade=problem.time_grid,
+        best_fitness_history=historico,
+        avg_fitness_history=historico,
+        fitness_details=[fitness_info]
+    )
+    
+    schedule, fitness_info = exportados[0]
+    print_schedule(schedule, fitness_info)
+    
+    if HAS_RICH:
+        console.print(f"[green]OK[/green] Outputs salvos em: {output_manager.get_run_directory()}")
+    else:
+        print(f"OK - Outputs salvos em: {output_manager.get_run_directory()}")
+
+
+def main(argv=None):
     """Função principal que orquestra todo o processo."""
+    args = _parse_args(argv)
+    if args.profile_startup:
+        _profile_startup()
+        return
+    
+    console = _load_console()
+    HAS_RICH = console is not None
+    
     try:
+        import random
+        import numpy as np
+        
+        # Importar módulos do projeto
+        from src import config
+        from src.config import RANDOM_SEED
+        from src.data_loader import load_compiled_problem
+        from src.cache import load_cached_problem
+        from src.genetic_algorithm import setup_deap_toolbox, run_genetic_algorithm
+        from src.visualization import print_schedule
+        from src.output_manager import OutputManager
+        from src.export import export_top_k
+        from src.reweight import salvar_caracteristicas
+        from src.fitness import vetor_caracteristicas
+        from src.decoder import detalhes_do_vetor
+        
         # Fixar seed para reprodutibilidade
         random.seed(RANDOM_SEED)
         np.random.seed(RANDOM_SEED)
@@ -53,7 +531,17 @@ def main():
         else:
             print("Carregando dados...")
         
-        disciplinas, slots = load_and_validate_csv()
+        problem_path = None
+        if args.no_cache:
+            problem = load_compiled_problem(Path(args.csv_dir))
+        else:
+            problem, problem_path, cache_hit = load_cached_problem(Path(args.csv_dir))
+            origem = "cache" if cache_hit else "CSVs (cache gravado)"
+            if HAS_RICH:
+                console.print(f"[green]OK[/green] Instância carregada de {origem}: {problem_path}")
+            else:
+                print(f"OK - Instância carregada de {origem}: {problem_path}")
+        disciplinas, slots = problem.disciplinas, problem.slots
         
         if HAS_RICH:
             console.print(f"[green]OK[/green] {len(disciplinas)} disciplinas carregadas")
@@ -63,9 +551,10 @@ def main():
             print(f"OK - {len(slots)} slots de horário disponíveis")
         
         # 2. Construir template do cromossomo
-        expanded_disciplines, chromosome_size = build_chromosome_template(disciplinas)
-        slot_mapping = create_slot_mapping(slots)
-        valid_slot_ids = [s.slot_id for s in slots]
+        expanded_disciplines = problem.expanded_disciplines
+        chromosome_size = problem.chromosome_size
+        slot_mapping = problem.slot_mapping
+        valid_slot_ids = problem.valid_slot_ids
         
         if HAS_RICH:
             console.print(f"[green]OK[/green] Cromossomo: {chromosome_size} genes "
@@ -73,33 +562,115 @@ def main():
         else:
             print(f"OK - Cromossomo: {chromosome_size} genes (total de aulas/semana)\n")
         
-        # 3. Configurar DEAP
+        # Replanejamento: horário da execução anterior mapeado para esta instância
+        inicial, referencia = None, None
+        peso_desvio = config.PESO_DESVIO if args.deviation_weight is None else args.deviation_weight
+        if args.warm_start:
+            from src.warm_start import carregar_horario_anterior, mapear_para_instancia
+            
+            anterior = carregar_horario_anterior(args.warm_start, args.rank)
+            inicial, referencia, mapeadas = mapear_para_instancia(
+                anterior, expanded_disciplines, slot_mapping, valid_slot_ids
+            )
+            mensagem = (f"Warm start: {mapeadas}/{chromosome_size} aulas mapeadas de {args.warm_start} "
+                        f"(rank {args.rank}, peso de desvio {peso_desvio})")
+            if HAS_RICH:
+                console.print(f"[green]OK[/green] {mensagem}\n")
+            else:
+                print(f"OK - {mensagem}\n")
+        
+        if args.mode in ("nsga2", "nsga3"):
+            _run_multiobjective(args, problem, console)
+            return
+        if args.mode == "cpsat":
+            _run_cpsat(args, problem, console, dica=inicial)
+            return
+        if args.mode == "decomposicao":
+            if inicial is not None:
+                raise ValueError("--warm-start não é suportado no modo decomposicao")
+            _run_decomposicao(args, problem, console)
+            return
+        
+        # 3. Configurar DEAP (a busca local usa o fitness escalar do DeltaEvaluator
+        #    e a representação por slots)
+        limite_critico = None
+        representacao = "slots"
+        if args.mode == "ga":
+            limite_critico = (config.LIMITE_PENALIDADE_CRITICA if args.lexicographic_bound is None
+                              else args.lexicographic_bound)
+            representacao = args.representation or config.REPRESENTACAO
+        if representacao != "slots" and inicial is not None:
+            raise ValueError(f"--warm-start exige a representação por slots (atual: {representacao})")
         toolbox = setup_deap_toolbox(
             chromosome_size=chromosome_size,
             valid_slot_ids=valid_slot_ids,
             expanded_disciplines=expanded_disciplines,
             slot_mapping=slot_mapping,
-            disciplinas_unicas=disciplinas
+            disciplinas_unicas=disciplinas,
+            problem_path=problem_path,
+            referencia=referencia,
+            peso_desvio=peso_desvio,
+            limite_critico=limite_critico,
+            canonico=args.mode == "ga" and (args.canonical or config.GENOMA_CANONICO),
+            crossover=args.crossover,
+            representacao=representacao
         )
+        crossover = args.crossover or (config.CROSSOVER_PERMUTACAO if representacao == "permutacao"
+                                       else config.OPERADOR_CROSSOVER)
+        if representacao != "slots":
+            from src.block_encoding import BlockEncoding
+            
+            blocos = BlockEncoding(expanded_disciplines, slot_mapping)
+            mensagem = (f"Representação por blocos: {len(blocos)} genes "
+                        f"(espaço de busca ~10^{blocos.espaco_busca():.0f})")
+            if representacao == "permutacao":
+                mensagem = (f"Representação por permutação: {len(blocos)} blocos "
+                            f"posicionados pelo decodificador guloso")
+            if HAS_RICH:
+                console.print(f"[green]OK[/green] {mensagem}\n")
+            else:
+                print(f"OK - {mensagem}\n")
         
-        # 4. Executar Algoritmo Genético
+        # 4. Executar Algoritmo Genético (ou a busca local, que usa o mesmo toolbox)
         start_time = time.time()
-        best_individual, best_fitness_history, avg_fitness_history, top_individuals, top_fitnesses = run_genetic_algorithm(toolbox)
+        if args.mode in ("sa", "tabu"):
+            from src.local_search import run_local_search
+            
+            estrategia = args.mode
+            (best_individual, best_fitness_history, avg_fitness_history,
+             top_individuals, top_fitnesses, run_stats) = run_local_search(
+                toolbox,
+                valid_slot_ids=valid_slot_ids,
+                expanded_disciplines=expanded_disciplines,
+                slot_mapping=slot_mapping,
+                metodo=args.mode,
+                num_iteracoes=args.iterations,
+                inicial=inicial,
+                referencia=referencia,
+                peso_desvio=peso_desvio,
+                temperatura_inicial=(config.WARM_START_TEMPERATURA if inicial is not None
+                                     else config.SA_TEMPERATURA_INICIAL)
+            )
+        else:
+            estrategia = args.replacement or config.ESTRATEGIA_SUBSTITUICAO
+            population_size = args.population or config.POPULATION_SIZE
+            populacao_inicial = None
+            if inicial is not None:
+                from src.warm_start import semear_populacao
+                populacao_inicial = semear_populacao(toolbox, inicial, referencia, population_size)
+            (best_individual, best_fitness_history, avg_fitness_history,
+             top_individuals, top_fitnesses, run_stats) = run_genetic_algorithm(
+                toolbox,
+                population_size=population_size,
+                num_generations=args.generations or config.NUM_GENERATIONS,
+                estrategia=estrategia,
+                populacao_inicial=populacao_inicial,
+                num_workers=args.workers or config.AVALIACAO_WORKERS
+            )
         execution_time = time.time() - start_time
         
-        # 5. Decodificar o melhor indivíduo
-        schedule = decode_schedule(best_individual, expanded_disciplines, slot_mapping)
-        fitness_info = get_fitness_details(
-            best_individual,
-            expanded_disciplines,
-            slot_mapping,
-            disciplinas
-        )
-        
-        # 6. Imprimir horário
-        print_schedule(schedule, fitness_info)
-        
-        # Inicializar OutputManager para gerenciar todos os arquivos de saída
+        # 5. Salvar outputs: os top-k horários (JSON e HTML) e o gráfico de
+        #    evolução são gerados em paralelo; cada breakdown é calculado uma vez
         if HAS_RICH:
             console.print("\n[yellow]Salvando outputs...[/yellow]")
         else:
@@ -108,24 +679,49 @@ def main():
         output_manager = OutputManager()
         run_dir = output_manager.get_run_directory()
         
-        # 7. Exportar HTML
-        export_html(schedule, output_path=run_dir / "horario_final.html")
-        
-        # 8. Plotar evolução do fitness
-        plot_fitness_evolution(best_fitness_history, avg_fitness_history, output_path=run_dir / "fitness_evolution.png")
-        
-        # 9. Salvar outputs adicionais (top 3 horários e dados de execução)
-        
         # Preparar configurações para salvar
         config_dict = {
-            "population_size": config.POPULATION_SIZE,
-            "num_generations": config.NUM_GENERATIONS,
+            "mode": args.mode,
+            "population_size": args.population or config.POPULATION_SIZE,
+            "num_generations": args.generations or config.NUM_GENERATIONS,
             "crossover_prob": config.CROSSOVER_PROB,
             "mutation_prob": config.MUTATION_PROB,
             "tournament_size": config.TOURNAMENT_SIZE,
             "mutation_indpb": config.MUTATION_INDPB,
+            "hall_of_fame_size": config.HALL_OF_FAME_SIZE,
+            "elite_distancia_minima": config.ELITE_DISTANCIA_MINIMA,
+            "elites_reinseridos": config.ELITES_REINSERIDOS,
+            "estrategia_substituicao": estrategia,
+            "num_filhos": config.NUM_FILHOS,
+            "filhos_steady_state": config.FILHOS_STEADY_STATE,
+            "diversidade_acao": config.DIVERSIDADE_ACAO,
+            "diversidade_minima": config.DIVERSIDADE_MINIMA,
             "random_seed": config.RANDOM_SEED,
+            "evaluation_workers": args.workers or config.AVALIACAO_WORKERS,
+            "lexicographic_bound": limite_critico,
+            "crossover": crossover,
+            "representation": representacao,
+            "canonical_genomes": args.mode == "ga" and (args.canonical or config.GENOMA_CANONICO),
         }
+        if args.warm_start:
+            config_dict.update({
+                "warm_start": str(args.warm_start),
+                "warm_start_rank": args.rank,
+                "deviation_weight": peso_desvio,
+                "warm_start_indpb": config.WARM_START_INDPB,
+                "warm_start_temperature": config.WARM_START_TEMPERATURA,
+            })
+        if args.mode in ("sa", "tabu"):
+            config_dict.update({
+                "iterations": args.iterations or (config.SA_ITERACOES if args.mode == "sa"
+                                                  else config.TABU_ITERACOES),
+                "iterations_per_record": config.BUSCA_REGISTRO,
+                "swap_prob": config.BUSCA_PROB_TROCA,
+                "sa_initial_temperature": config.SA_TEMPERATURA_INICIAL,
+                "sa_final_temperature": config.SA_TEMPERATURA_FINAL,
+                "tabu_neighbours": config.TABU_VIZINHOS,
+                "tabu_tenure": config.TABU_TENURE,
+            })
         
         # Salvar dados gerais de execução
         output_manager.save_execution_data(
@@ -137,32 +733,42 @@ def main():
             config=config_dict,
             expanded_disciplines=expanded_disciplines,
             slot_mapping=slot_mapping,
-            disciplinas_unicas=disciplinas
+            disciplinas_unicas=disciplinas,
+            run_stats=run_stats
         )
         
-        # Salvar detalhes de cada um dos top 3 horários
-        for rank, (individual, fitness) in enumerate(zip(top_individuals, top_fitnesses), 1):
-            schedule_rank = decode_schedule(individual, expanded_disciplines, slot_mapping)
-            fitness_info_rank = get_fitness_details(
-                individual,
-                expanded_disciplines,
-                slot_mapping,
-                disciplinas
-            )
-            output_manager.save_schedule_details(
-                rank=rank,
-                individual=individual,
-                fitness=fitness,
-                schedule=schedule_rank,
-                fitness_info=fitness_info_rank
-            )
+        # Vetores de características do arquivo de elite e da população final,
+        # para reclassificar a execução com outros pesos (python -m src.reweight).
+        # Os vetores da elite também dão o detalhamento de cada rank exportado,
+        # sem reavaliar os horários nos processos de exportação
+        elite_vetores = [vetor_caracteristicas(ind, expanded_disciplines, slot_mapping)
+                         for ind in top_individuals]
+        salvar_caracteristicas(run_dir, top_individuals, run_stats.get("populacao_final", []),
+                               expanded_disciplines, slot_mapping, elite_vetores=elite_vetores)
+        
+        exportados = export_top_k(
+            run_dir=run_dir,
+            top_individuals=top_individuals,
+            top_fitnesses=top_fitnesses,
+            expanded_disciplines=expanded_disciplines,
+            slot_mapping=slot_mapping,
+            disciplinas_unicas=disciplinas,
+            grade=problem.time_grid,
+            best_fitness_history=best_fitness_history,
+            avg_fitness_history=avg_fitness_history,
+            fitness_details=[detalhes_do_vetor(vetor) for vetor in elite_vetores]
+        )
+        
+        # 6. Imprimir o melhor horário (já decodificado pela exportação)
+        schedule, fitness_info = exportados[0]
+        print_schedule(schedule, fitness_info)
         
         if HAS_RICH:
             console.print(f"[green]OK[/green] Outputs salvos em: {output_manager.get_run_directory()}")
         else:
             print(f"OK - Outputs salvos em: {output_manager.get_run_directory()}")
         
-        # 10. Verificação final (auto-check)
+        # 7. Verificação final (auto-check)
         if HAS_RICH:
             console.print("\n[bold yellow]Executando verificação final...[/bold yellow]")
         else:
@@ -214,7 +820,7 @@ def main():
                 print("Boa solução encontrada!")
             else:
                 print("Solução subótima. Considere aumentar o número de gerações.")
-        
+    
     except FileNotFoundError as e:
         print(f"\n{e}")
         sys.exit(1)
@@ -0,0 +1,109 @@
+"""
+Arquivo de elite com diversidade.
+
+Substitui o tools.HallOfFame(3) do DEAP: mantém até `capacidade` indivíduos,
+mas rejeita candidatos a menos de `distancia_minima` genes (distância de
+Hamming) de um membro existente, para que o ranking não seja composto de
+quase-cópias do mesmo horário. Cópias exatas são descartadas por hash antes
+de qualquer cálculo de distância. Com a forma canônica (ver canonical.py),
+horários que diferem apenas na ordem das aulas de uma disciplina são a mesma
+cópia, e as distâncias são medidas entre as formas canônicas.
+"""
+
+from copy import deepcopy
+from typing import Callable, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from .config import HALL_OF_FAME_SIZE, ELITE_DISTANCIA_MINIMA
+
+
+class EliteArchive:
+    """
+    Arquivo de elite com capacidade configurável e distância mínima entre membros.
+    
+    Os membros ficam ordenados do melhor para o pior fitness (maximização),
+    como no HallOfFame do DEAP, pela comparação da própria classe de fitness
+    (escalar ou lexicográfica). Um candidato próximo de membros existentes só
+    entra se for melhor que todos eles, e nesse caso os substitui.
+    """
+    
+    def __init__(
+        self,
+        capacidade: int = HALL_OF_FAME_SIZE,
+        distancia_minima: int = ELITE_DISTANCIA_MINIMA,
+        forma: Optional[Callable[[List[int]], tuple]] = None
+    ):
+        if capacidade < 1:
+            raise ValueError(f"Capacidade do arquivo de elite deve ser positiva: {capacidade}")
+        self.capacidade = capacidade
+        self.distancia_minima = distancia_minima
+        # Forma usada nas comparações (canônica, ou o próprio genoma)
+        self.forma = forma or tuple
+        self.items: List = []
+        self._hashes = set()
+        self._genes: Optional[np.ndarray] = None   # matriz (membros x genes)
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def __getitem__(self, i):
+        return self.items[i]
+    
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+    
+    def __contains__(self, individual) -> bool:
+        return self.forma(individual) in self._hashes
+    
+    def _pior(self):
+        return self.items[-1].fitness
+    
+    def _reconstruir(self) -> None:
+        """Atualiza o índice de hashes e a matriz de genes após mudanças."""
+        self.items.sort(key=lambda ind: ind.fitness, reverse=True)
+        formas = [self.forma(ind) for ind in self.items]
+        self._hashes = set(formas)
+        self._genes = np.array(formas, dtype=np.int32) if formas else None
+    
+    def update(self, population: Iterable) -> int:
+        """
+        Tenta inserir cada indivíduo avaliado da população no arquivo.
+        
+        Returns:
+            Número de indivíduos inseridos
+        """
+        inseridos = 0
+        candidatos = sorted(population, key=lambda ind: ind.fitness, reverse=True)
+        for ind in candidatos:
+            fit = ind.fitness
+            cheio = len(self.items) >= self.capacidade
+            if cheio and fit <= self._pior():
+                # Candidatos restantes são piores ainda
+                break
+            forma = self.forma(ind)
+            if forma in self._hashes:
+                continue
+            
+            proximos: List[int] = []
+            if self._genes is not None and self.distancia_minima > 0:
+                distancias = np.count_nonzero(self._genes != np.asarray(forma, dtype=np.int32), axis=1)
+                proximos = np.flatnonzero(distancias < self.distancia_minima).tolist()
+            
+            if proximos:
+                if any(fit <= self.items[i].fitness for i in proximos):
+                    continue
+                for i in sorted(proximos, reverse=True):
+                    del self.items[i]
+            elif cheio:
+                self.items.pop()
+            
+            self.items.append(deepcopy(ind))
+            self._reconstruir()
+            inseridos += 1
+        
+        return inseridos
+    
+    def elites(self, k: int) -> List:
+        """Retorna cópias dos k melhores membros (para reinserção na população)."""
+        return [deepcopy(ind) for ind in self.items[:k]]
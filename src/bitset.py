@@ -0,0 +1,133 @@
+"""
+Ocupação semanal em bitsets: núcleo das restrições críticas (conflitos).
+
+Cada horário distinto (dia, início, fim) de horarios.csv recebe um bit; a
+ocupação semanal de uma disciplina de um professor (ou de um período) é o OR
+dos bits dos slots de suas aulas. Duas disciplinas do mesmo professor (ou
+período) conflitam em popcount(A & B) horários, e o total de pares em
+conflito de um grupo é a soma desses popcounts entre todos os pares, o mesmo
+que a contagem de penalidade_conflito_professor/periodo: C(k, 2) pares por
+horário ocupado por k disciplinas distintas. Aulas repetidas de uma mesma
+disciplina no mesmo horário não são conflito, pois o OR as une em um bit.
+
+Com 45 slots a ocupação cabe em um inteiro de 64 bits; inteiros do Python
+comportam grades maiores sem alteração.
+"""
+
+from typing import Dict, List, Tuple
+
+from .models import Disciplina, Slot
+
+
+def contar_pares(mascaras: List[int]) -> int:
+    """
+    Pares de máscaras que compartilham cada bit, somados sobre os bits.
+    
+    As máscaras são acumuladas em um contador por fatias de bits (a contagem
+    de cada bit é sum(2**i para cada nível i que o contém)); ao incluir uma
+    máscara, cada bit dela forma um par com cada máscara anterior que já o
+    continha.
+    """
+    niveis: List[int] = []
+    pares = 0
+    for mascara in mascaras:
+        if not mascara:
+            continue
+        for i, nivel in enumerate(niveis):
+            pares += (nivel & mascara).bit_count() << i
+        # Soma a máscara ao contador (com propagação do "vai um")
+        vai_um = mascara
+        for i, nivel in enumerate(niveis):
+            niveis[i] = nivel ^ vai_um
+            vai_um &= nivel
+            if not vai_um:
+                break
+        if vai_um:
+            niveis.append(vai_um)
+    return pares
+
+
+class OccupancyBitsets:
+    """
+    Índices de bits e de unidades (grupo, disciplina) de uma instância.
+    
+    Uma unidade é uma disciplina dentro de um grupo (professor ou período);
+    cada gene pertence a uma unidade de professor e a uma de período.
+    """
+    
+    def __init__(self, expanded_disciplines: List[Disciplina], slot_mapping: Dict[int, Slot]):
+        # (dia, início, fim) -> bit; slots com o mesmo horário compartilham o bit
+        bits: Dict[tuple, int] = {}
+        self.bit_slot: Dict[int, int] = {}
+        for slot_id, slot in slot_mapping.items():
+            chave = (slot.dia, slot.inicio, slot.fim)
+            if chave not in bits:
+                bits[chave] = 1 << len(bits)
+            self.bit_slot[slot_id] = bits[chave]
+        self.num_bits = len(bits)
+        
+        self.unidade_professor, self.grupos_professor = self._unidades(
+            [(disc.professor, disc.codigo) for disc in expanded_disciplines]
+        )
+        self.unidade_periodo, self.grupos_periodo = self._unidades(
+            [(disc.turma, disc.codigo) for disc in expanded_disciplines]
+        )
+        self.num_unidades_professor = max(self.unidade_professor, default=-1) + 1
+        self.num_unidades_periodo = max(self.unidade_periodo, default=-1) + 1
+        # Apenas grupos com mais de uma disciplina podem ter conflitos
+        self.grupos_professor = [g for g in self.grupos_professor if len(g) > 1]
+        self.grupos_periodo = [g for g in self.grupos_periodo if len(g) > 1]
+    
+    @staticmethod
+    def _unidades(chaves: List[tuple]) -> Tuple[List[int], List[List[int]]]:
+        """Índice da unidade de cada gene e as unidades de cada grupo."""
+        indice: Dict[tuple, int] = {}
+        grupos: Dict[object, List[int]] = {}
+        unidade_gene = []
+        for grupo, codigo in chaves:
+            if (grupo, codigo) not in indice:
+                indice[(grupo, codigo)] = len(indice)
+                grupos.setdefault(grupo, []).append(indice[(grupo, codigo)])
+            unidade_gene.append(indice[(grupo, codigo)])
+        return unidade_gene, list(grupos.values())
+    
+    def mascaras(self, individual: List[int]) -> Tuple[List[int], List[int]]:
+        """Ocupação de cada unidade de professor e de período."""
+        professor = [0] * self.num_unidades_professor
+        periodo = [0] * self.num_unidades_periodo
+        bit_slot = self.bit_slot
+        for gene, u_prof, u_per in zip(individual, self.unidade_professor, self.unidade_periodo):
+            bit = bit_slot.get(gene)
+            if bit:
+                professor[u_prof] |= bit
+                periodo[u_per] |= bit
+        return professor, periodo
+    
+    def conflitos(self, individual: List[int]) -> Tuple[int, int]:
+        """Pares em conflito de professor e de período."""
+        professor, periodo = self.mascaras(individual)
+        pares_professor = sum(contar_pares([professor[u] for u in grupo])
+                              for grupo in self.grupos_professor)
+        pares_periodo = sum(contar_pares([periodo[u] for u in grupo])
+                            for grupo in self.grupos_periodo)
+        return pares_professor, pares_periodo
+
+
+# Bitsets já construídos, indexados pela identidade das listas da instância
+# (guardadas junto para que seus ids não sejam reutilizados)
+_BITSET_CACHE: Dict[Tuple[int, int], Tuple[list, dict, OccupancyBitsets]] = {}
+
+
+def bitsets_for(expanded_disciplines: List[Disciplina], slot_mapping: Dict[int, Slot]) -> OccupancyBitsets:
+    """Retorna os bitsets de uma instância, construindo-os apenas uma vez."""
+    chave = (id(expanded_disciplines), id(slot_mapping))
+    entry = _BITSET_CACHE.get(chave)
+    if entry is not None and entry[0] is expanded_disciplines and entry[1] is slot_mapping:
+        return entry[2]
+    
+    ocupacao = OccupancyBitsets(expanded_disciplines, slot_mapping)
+    if len(_BITSET_CACHE) >= 8:
+        # Descarta apenas a entrada mais antiga
+        _BITSET_CACHE.pop(next(iter(_BITSET_CACHE)))
+    _BITSET_CACHE[chave] = (expanded_disciplines, slot_mapping, ocupacao)
+    return ocupacao
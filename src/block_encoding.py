@@ -0,0 +1,137 @@
+"""
+Codificação por blocos: um gene por bloco de aulas consecutivas.
+
+Na codificação direta cada aula semanal é um gene, e uma disciplina de 6
+aulas precisa que seis genes independentes se alinhem em blocos por acaso.
+Aqui as aulas de cada disciplina são particionadas de antemão em blocos de
+tamanho ideal (6 -> 3+3, 5 -> 3+2, 4 -> 2+2, 3 -> 3) e cada gene escolhe uma
+posição para o seu bloco: um dia e um horário de início tais que os horários
+seguintes do bloco existam na grade (ver TimeGrid). Blocos incompletos e
+overload deixam de existir por construção, o cromossomo fica menor e o espaço
+de busca encolhe em ordens de grandeza.
+
+O decodificador converte um cromossomo de blocos no cromossomo de slot_ids
+(mesma ordem de expanded_disciplines), avaliado e exportado como sempre.
+"""
+
+import math
+import random
+from typing import Dict, List, Tuple
+
+from .config import MAX_AULAS_SEQUENCIAIS_IDEAL
+from .models import Disciplina, Slot
+from .time_grid import time_grid_for
+
+
+def particionar_aulas(aulas: int, max_bloco: int = MAX_AULAS_SEQUENCIAIS_IDEAL) -> List[int]:
+    """
+    Tamanhos dos blocos de uma disciplina, o mais iguais possível.
+    
+    Usa o menor número de blocos de até max_bloco aulas: 6 -> [3, 3],
+    5 -> [3, 2], 4 -> [2, 2], 7 -> [3, 2, 2].
+    """
+    if aulas <= 0:
+        return []
+    num_blocos = math.ceil(aulas / max_bloco)
+    base, resto = divmod(aulas, num_blocos)
+    return [base + 1] * resto + [base] * (num_blocos - resto)
+
+
+class BlockEncoding:
+    """
+    Genes de bloco de uma instância e seu decodificador.
+    
+    Cada gene é o índice de uma posição em posicoes[tamanho do bloco]; as
+    posições são as sequências de slot_ids consecutivos de um mesmo dia.
+    """
+    
+    def __init__(
+        self,
+        expanded_disciplines: List[Disciplina],
+        slot_mapping: Dict[int, Slot],
+        max_bloco: int = MAX_AULAS_SEQUENCIAIS_IDEAL
+    ):
+        grade = time_grid_for(slot_mapping)
+        slot_em: Dict[Tuple[int, int], int] = {
+            (grade.slot_dia_idx[s], grade.slot_hora_idx[s]): s for s in slot_mapping
+        }
+        
+        # Genes de bloco: disciplina, tamanho e gene inicial no cromossomo de slots
+        self.disciplinas: List[Disciplina] = []
+        self.tamanhos: List[int] = []
+        self.inicio_gene: List[int] = []
+        inicio = 0
+        for i in range(1, len(expanded_disciplines) + 1):
+            if i == len(expanded_disciplines) or expanded_disciplines[i] != expanded_disciplines[inicio]:
+                gene = inicio
+                for tamanho in particionar_aulas(i - inicio, max_bloco):
+                    self.disciplinas.append(expanded_disciplines[inicio])
+                    self.tamanhos.append(tamanho)
+                    self.inicio_gene.append(gene)
+                    gene += tamanho
+                inicio = i
+        self.tamanho_cromossomo_slots = len(expanded_disciplines)
+        
+        # Posições possíveis de cada tamanho de bloco: slots, (dia, hora) de
+        # início e o índice inverso (dia, hora) -> posição
+        self.posicoes: Dict[int, List[Tuple[int, ...]]] = {}
+        self.inicios: Dict[int, List[Tuple[int, int]]] = {}
+        self.indice_posicao: Dict[int, Dict[Tuple[int, int], int]] = {}
+        for tamanho in sorted(set(self.tamanhos)):
+            posicoes, inicios = [], []
+            for (dia, hora) in sorted(slot_em):
+                slots = tuple(slot_em.get((dia, hora + k)) for k in range(tamanho))
+                if None not in slots:
+                    posicoes.append(slots)
+                    inicios.append((dia, hora))
+            if not posicoes:
+                raise ValueError(f"A grade não tem {tamanho} horários consecutivos para formar um bloco")
+            self.posicoes[tamanho] = posicoes
+            self.inicios[tamanho] = inicios
+            self.indice_posicao[tamanho] = {chave: p for p, chave in enumerate(inicios)}
+        self.num_posicoes = [len(self.posicoes[t]) for t in self.tamanhos]
+        self.num_dias = len(grade.dias)
+    
+    def __len__(self) -> int:
+        return len(self.tamanhos)
+    
+    def gene_aleatorio(self, i: int) -> int:
+        """Posição aleatória para o bloco i."""
+        return random.randrange(self.num_posicoes[i])
+    
+    def individuo_aleatorio(self) -> List[int]:
+        """Cromossomo de blocos aleatório."""
+        return [self.gene_aleatorio(i) for i in range(len(self))]
+    
+    def decodificar(self, individual: List[int]) -> List[int]:
+        """Cromossomo de slot_ids (ordem de expanded_disciplines) de um cromossomo de blocos."""
+        slots = [0] * self.tamanho_cromossomo_slots
+        for gene, tamanho, inicio in zip(individual, self.tamanhos, self.inicio_gene):
+            slots[inicio:inicio + tamanho] = self.posicoes[tamanho][gene]
+        return slots
+    
+    def espaco_busca(self) -> float:
+        """log10 do número de cromossomos de blocos."""
+        return sum(math.log10(n) for n in self.num_posicoes)
+
+
+def mut_blocos(individual: List[int], codificacao: BlockEncoding, indpb: float) -> Tuple[List[int]]:
+    """
+    Mutação de blocos: cada gene, com probabilidade indpb, muda de posição.
+    
+    Metade das mutações sorteia uma posição qualquer; a outra metade leva o
+    bloco ao mesmo horário de início em outro dia (quando existir), o que
+    preserva a posição do bloco no turno.
+    """
+    for i in range(len(individual)):
+        if random.random() >= indpb:
+            continue
+        if random.random() < 0.5:
+            individual[i] = codificacao.gene_aleatorio(i)
+            continue
+        tamanho = codificacao.tamanhos[i]
+        dia, hora = codificacao.inicios[tamanho][individual[i]]
+        indice = codificacao.indice_posicao[tamanho]
+        outros = [indice[(d, hora)] for d in range(codificacao.num_dias) if d != dia and (d, hora) in indice]
+        individual[i] = random.choice(outros) if outros else codificacao.gene_aleatorio(i)
+    return individual,
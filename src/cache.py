@@ -0,0 +1,163 @@
+"""
+Cache binário de instâncias compiladas.
+
+A instância compilada (ver problem.py) é gravada como um diretório de arquivos
+.npy, identificado por um hash do conteúdo dos CSVs e das configurações que
+afetam a compilação. Execuções seguintes (e os workers de avaliação) abrem os
+arrays com memory-map em vez de reprocessar os CSVs.
+"""
+
+import hashlib
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+
+from . import config
+from .data_loader import check_files, load_compiled_problem
+from .models import Disciplina, Slot
+from .problem import CompiledProblem
+
+# Incrementar sempre que o formato dos arrays gravados mudar
+CACHE_FORMAT_VERSION = 2
+
+
+def _relevant_config() -> Dict:
+    """Configurações que alteram o resultado da compilação."""
+    return {
+        "format": CACHE_FORMAT_VERSION,
+        "ordem_horarios": config.ORDEM_HORARIOS,
+        "intervalo_maximo_sequencia": config.INTERVALO_MAXIMO_SEQUENCIA,
+    }
+
+
+def instance_hash(csv_dir: Path = Path("CSVs")) -> str:
+    """Calcula o hash do conteúdo dos CSVs (todos os cursos) e das configurações relevantes."""
+    h = hashlib.sha256()
+    disciplinas_paths, horarios_path = check_files(csv_dir)
+    for path in [p for _, p in disciplinas_paths] + [horarios_path]:
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    h.update(repr(sorted(_relevant_config().items())).encode())
+    return h.hexdigest()[:16]
+
+
+def save_problem(problem: CompiledProblem, path: Path) -> None:
+    """
+    Grava a instância compilada como um diretório de arquivos .npy.
+    
+    A gravação é feita em um diretório temporário e renomeada ao final, de
+    forma que outro processo nunca encontre um cache incompleto.
+    """
+    arrays = {
+        "disc_periodo": np.array([d.periodo for d in problem.disciplinas], dtype=np.int64),
+        "disc_codigo": np.array([d.codigo for d in problem.disciplinas], dtype=str),
+        "disc_nome": np.array([d.nome for d in problem.disciplinas], dtype=str),
+        "disc_carga_horaria": np.array([d.carga_horaria for d in problem.disciplinas], dtype=np.int64),
+        "disc_professor": np.array([d.professor for d in problem.disciplinas], dtype=str),
+        "disc_aulas_semanais": np.array([d.aulas_semanais for d in problem.disciplinas], dtype=np.int64),
+        "disc_curso": np.array([d.curso for d in problem.disciplinas], dtype=str),
+        "slot_dia": np.array([s.dia for s in problem.slots], dtype=str),
+        "slot_inicio": np.array([s.inicio for s in problem.slots], dtype=str),
+        "slot_fim": np.array([s.fim for s in problem.slots], dtype=str),
+        "slot_ids": problem.slot_ids,
+        "periodos_curso": np.array([curso for curso, _ in problem.periodos], dtype=str),
+        "periodos": np.array([periodo for _, periodo in problem.periodos], dtype=np.int64),
+        "professores": np.array(problem.professores, dtype=str),
+        "gene_disciplina": problem.gene_disciplina,
+        "disciplina_periodo": problem.disciplina_periodo,
+        "disciplina_professor": problem.disciplina_professor,
+    }
+    
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(tmp_path / f"{name}.npy", array, allow_pickle=False)
+    
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        # Outro processo gravou o mesmo cache primeiro
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def load_problem(path: Path, mmap: bool = True) -> CompiledProblem:
+    """Abre uma instância compilada gravada por save_problem."""
+    mode = 'r' if mmap else None
+    a = {p.stem: np.load(p, mmap_mode=mode, allow_pickle=False) for p in Path(path).glob("*.npy")}
+    
+    disciplinas = [
+        Disciplina(
+            periodo=periodo,
+            codigo=codigo,
+            nome=nome,
+            carga_horaria=carga,
+            professor=professor,
+            aulas_semanais=aulas,
+            curso=curso
+        )
+        for periodo, codigo, nome, carga, professor, aulas, curso in zip(
+            a["disc_periodo"].tolist(), a["disc_codigo"].tolist(), a["disc_nome"].tolist(),
+            a["disc_carga_horaria"].tolist(), a["disc_professor"].tolist(),
+            a["disc_aulas_semanais"].tolist(), a["disc_curso"].tolist()
+        )
+    ]
+    slots = [
+        Slot(slot_id=slot_id, dia=dia, inicio=inicio, fim=fim)
+        for slot_id, dia, inicio, fim in zip(
+            a["slot_ids"].tolist(), a["slot_dia"].tolist(),
+            a["slot_inicio"].tolist(), a["slot_fim"].tolist()
+        )
+    ]
+    
+    return CompiledProblem(
+        disciplinas=disciplinas,
+        slots=slots,
+        periodos=list(zip(a["periodos_curso"].tolist(), a["periodos"].tolist())),
+        professores=a["professores"].tolist(),
+        gene_disciplina=a["gene_disciplina"],
+        disciplina_periodo=a["disciplina_periodo"],
+        disciplina_professor=a["disciplina_professor"],
+        slot_ids=a["slot_ids"],
+    )
+
+
+def load_cached_problem(
+    csv_dir: Path = Path("CSVs"),
+    cache_dir: Path = Path(config.CACHE_DIR),
+    engine: str = "auto"
+) -> Tuple[CompiledProblem, Path, bool]:
+    """
+    Carrega a instância compilada do cache, compilando e gravando se necessário.
+    
+    Args:
+        csv_dir: Diretório contendo os arquivos CSV
+        cache_dir: Diretório do cache
+        engine: Leitor de CSV usado na compilação (ver load_compiled_problem)
+    
+    Returns:
+        Tupla com a instância compilada, o caminho do cache e se houve acerto no cache
+    """
+    path = Path(cache_dir) / f"instancia_{instance_hash(csv_dir)}"
+    if path.is_dir():
+        return load_problem(path), path, True
+    
+    problem = load_compiled_problem(csv_dir, engine=engine)
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    save_problem(problem, path)
+    return problem, path, False
+
+
+@lru_cache(maxsize=4)
+def worker_problem(path: str) -> Tuple[list, Dict[int, Slot], list]:
+    """
+    Estruturas de avaliação de uma instância em cache, carregadas uma vez por processo.
+    
+    Returns:
+        Tupla com disciplinas expandidas, mapeamento de slots e disciplinas únicas
+    """
+    problem = load_problem(Path(path))
+    return problem.expanded_disciplines, problem.slot_mapping, problem.disciplinas
@@ -0,0 +1,70 @@
+"""
+Genomas canônicos: simetria entre as aulas de uma mesma disciplina.
+
+build_chromosome_template repete cada disciplina aulas_semanais vezes, em
+genes consecutivos. As aulas de uma disciplina são intercambiáveis: permutar
+os slots entre os genes do grupo produz o mesmo horário (e o mesmo fitness)
+com outro genoma. A forma canônica ordena os slots de cada grupo, de modo que
+horários equivalentes tenham um único genoma; o hash canônico identifica o
+horário em caches, na detecção de duplicatas e no arquivo de elite.
+"""
+
+import hashlib
+from typing import List, Tuple
+
+import numpy as np
+
+from .models import Disciplina
+
+
+def grupos_disciplina(expanded_disciplines: List[Disciplina]) -> List[Tuple[int, int]]:
+    """Intervalos [início, fim) dos genes de cada disciplina com mais de uma aula."""
+    grupos = []
+    inicio = 0
+    for i in range(1, len(expanded_disciplines) + 1):
+        if i == len(expanded_disciplines) or expanded_disciplines[i] != expanded_disciplines[inicio]:
+            if i - inicio > 1:
+                grupos.append((inicio, i))
+            inicio = i
+    return grupos
+
+
+class CanonicalGenome:
+    """Forma canônica e hash canônico dos genomas de uma instância."""
+    
+    def __init__(self, expanded_disciplines: List[Disciplina]):
+        self.grupos = grupos_disciplina(expanded_disciplines)
+    
+    def canonizar(self, individual: List[int]) -> bool:
+        """
+        Ordena (in-place) os slots de cada disciplina.
+        
+        Returns:
+            True se o genoma foi alterado
+        """
+        alterado = False
+        for inicio, fim in self.grupos:
+            trecho = individual[inicio:fim]
+            ordenado = sorted(trecho)
+            if ordenado != trecho:
+                individual[inicio:fim] = ordenado
+                alterado = True
+        return alterado
+    
+    def forma(self, individual: List[int]) -> tuple:
+        """Genoma canônico como tupla, sem alterar o indivíduo."""
+        canonico = list(individual)
+        for inicio, fim in self.grupos:
+            canonico[inicio:fim] = sorted(canonico[inicio:fim])
+        return tuple(canonico)
+    
+    def hash(self, individual: List[int]) -> str:
+        """
+        Hash canônico (hexadecimal, estável entre processos e execuções).
+        
+        Genomas que diferem apenas na ordem das aulas de uma disciplina têm o
+        mesmo hash.
+        """
+        dados = np.asarray(self.forma(individual), dtype=np.int64).tobytes()
+        return hashlib.blake2b(dados, digest_size=16).hexdigest()
+
@@ -36,6 +36,15 @@ MAX_AULAS_SEQUENCIAIS_IDEAL = 3
 THRESHOLD_SALTO_TEMPORAL = 4     # Diferença de índices > 4 indica salto dentro do dia
 MAX_AULAS_POR_DIA = 5            # Limite máximo de aulas por dia para um período
 
+# A ordem dos horários dentro do dia é derivada de horarios.csv (ver time_grid.py).
+# Intervalos entre o fim de um horário e o início do seguinte maiores que este
+# limite (ex.: 09:10-10:20) quebram a sequência de aulas; os menores (almoço de
+# 60 min, intervalo de 20 min da tarde) não quebram.
+INTERVALO_MAXIMO_SEQUENCIA = 60  # minutos
+# Ordem explícita dos horários de início, em vez da derivada (None = derivar).
+# Horários listados mas ausentes da grade contam como quebra de sequência.
+ORDEM_HORARIOS = None
+
 # ============================================================================
 # CONFIGURAÇÕES DO ALGORITMO GENÉTICO
 # ============================================================================
@@ -47,6 +56,67 @@ MUTATION_PROB = 0.2             # Probabilidade de mutação
 TOURNAMENT_SIZE = 3             # Tamanho do torneio para seleção
 MUTATION_INDPB = 0.2            # Probabilidade de mutação por gene
 
+# Representação do cromossomo:
+#   "slots"  - um gene por aula semanal (slot_id da aula)
+#   "blocos" - um gene por bloco de 2-3 aulas consecutivas (posição do bloco),
+#              decodificado para slot_ids (ver block_encoding.py)
+#   "permutacao" - ordem de prioridade dos blocos, posicionados por um
+#              decodificador guloso sem conflitos (ver permutation_encoding.py)
+REPRESENTACAO = "slots"
+
+# Operador de crossover:
+#   "dois_pontos" - tools.cxTwoPoint, cortes em posições arbitrárias
+#   "disciplinas" - cada disciplina (todas as suas aulas) vem de um dos pais
+#   "periodos"    - cada período (grade semanal da turma) vem de um dos pais
+OPERADOR_CROSSOVER = "dois_pontos"
+CROSSOVER_INDPB = 0.5           # Probabilidade de troca de cada grupo (disciplinas/periodos)
+# Representação por permutação: "pmx" (tools.cxPartialyMatched) ou "ordenado"
+# (tools.cxOrdered); a mutação troca posições com probabilidade por gene
+CROSSOVER_PERMUTACAO = "pmx"
+PERMUTACAO_INDPB = 0.05
+
+# Arquivo de elite (hall da fama com diversidade)
+HALL_OF_FAME_SIZE = 3           # Capacidade do arquivo (horários exportados no ranking)
+ELITE_DISTANCIA_MINIMA = 5      # Genes diferentes exigidos entre membros (distância de Hamming)
+ELITES_REINSERIDOS = 2          # Melhores do arquivo reinseridos na população a cada geração
+
+# Estratégia de substituição da população:
+#   "geracional"        - filhos substituem os pais (+ ELITES_REINSERIDOS do arquivo)
+#   "mu_mais_lambda"    - (μ+λ): sobrevivem os μ melhores entre pais e filhos
+#   "mu_virgula_lambda" - (μ,λ): sobrevivem os μ melhores entre os λ filhos
+#   "steady_state"      - FILHOS_STEADY_STATE filhos por iteração substituem os piores
+ESTRATEGIA_SUBSTITUICAO = "geracional"
+NUM_FILHOS = None               # λ das estratégias (μ+λ) e (μ,λ) (None = POPULATION_SIZE)
+FILHOS_STEADY_STATE = 2         # Filhos gerados por iteração no steady-state
+
+# Monitor de diversidade (discordância média entre pares, gene a gene, de 0 a 1)
+# Ao cair abaixo de DIVERSIDADE_MINIMA, aplica DIVERSIDADE_ACAO à população
+# ("reinicio_parcial", "hipermutacao", "imigrantes" ou None para desativar)
+DIVERSIDADE_ACAO = "hipermutacao"
+DIVERSIDADE_MINIMA = 0.08       # Limiar de colapso da diversidade
+DIVERSIDADE_INTERVALO = 10      # Gerações entre medições
+DIVERSIDADE_CARENCIA = 50       # Gerações mínimas entre duas ações
+FRACAO_REINICIO = 0.8           # Fração da população reiniciada (reinicio_parcial)
+FRACAO_HIPERMUTACAO = 0.5       # Fração da população hipermutada (hipermutacao)
+FRACAO_IMIGRANTES = 0.3         # Fração da população substituída por imigrantes (imigrantes)
+HIPERMUTACAO_INDPB = 0.5        # Probabilidade de mutação por gene na hipermutação
+
+# Avaliação lexicográfica: com um limite, o fitness vira (pontuação, penalidade
+# crítica), a seleção compara primeiro a penalidade crítica e indivíduos com
+# penalidade crítica acima do limite não têm as penalidades de qualidade
+# calculadas (None = fitness escalar, todas as penalidades sempre calculadas)
+LIMITE_PENALIDADE_CRITICA = None
+
+# Genomas canônicos: ordena os slots das aulas de cada disciplina após a
+# variação, para que horários equivalentes tenham um único genoma; indivíduos
+# repetidos (pelo hash canônico) reaproveitam o fitness já calculado, até
+# CACHE_AVALIACOES_MAX genomas por execução
+GENOMA_CANONICO = False
+CACHE_AVALIACOES_MAX = 100000
+
+# Modo multiobjetivo (NSGA-III): divisões por objetivo dos pontos de referência
+NSGA3_DIVISOES = 12
+
 # Pontuação base (antes das penalidades/bonificações)
 BASE_SCORE = 10000
 
@@ -55,3 +125,71 @@ RANDOM_SEED = 13
 
 # Limite máximo de aulas em sequência para bonificação
 MAX_AULAS_SEQUENCIAIS = 3
+
+# ============================================================================
+# REPLANEJAMENTO (WARM START A PARTIR DE UMA EXECUÇÃO ANTERIOR)
+# ============================================================================
+
+PESO_DESVIO = 0                  # Penalidade por aula fora do horário anterior (0 = desativada)
+WARM_START_INDPB = 0.05          # Probabilidade de mutação por gene nas perturbações da população inicial
+WARM_START_TEMPERATURA = 50.0    # Temperatura inicial do SA ao partir de um horário anterior
+
+# ============================================================================
+# BUSCA LOCAL (SIMULATED ANNEALING / BUSCA TABU)
+# ============================================================================
+
+BUSCA_REGISTRO = 100             # Iterações por entrada do histórico ("geração")
+BUSCA_PROB_TROCA = 0.3           # Probabilidade de uma troca (vs. mover um gene)
+SA_ITERACOES = 200000            # Iterações do Simulated Annealing
+SA_TEMPERATURA_INICIAL = 1000.0  # Temperatura inicial (aceita pioras de centenas de pontos)
+SA_TEMPERATURA_FINAL = 1.0       # Temperatura ao final (praticamente só aceita melhoras)
+TABU_ITERACOES = 5000            # Iterações da Busca Tabu
+TABU_VIZINHOS = 50               # Vizinhos avaliados por iteração
+TABU_TENURE = 20                 # Iterações em que um (gene, slot) abandonado fica proibido
+
+# ============================================================================
+# BACKEND EXATO (CP-SAT, requer OR-Tools)
+# ============================================================================
+
+CPSAT_TEMPO_LIMITE = 60.0        # Tempo máximo de busca em segundos
+CPSAT_WORKERS = 0                # Threads de busca do CP-SAT (0 = automático)
+
+# ============================================================================
+# DECOMPOSIÇÃO POR PERÍODO (acoplada pelos professores compartilhados)
+# ============================================================================
+
+DECOMPOSICAO_POPULACAO = 40      # População do AG de cada período
+DECOMPOSICAO_GERACOES = 150      # Gerações do AG de cada período (e de cada nova resolução)
+DECOMPOSICAO_RODADAS = 5         # Rodadas máximas da fase de coordenação
+DECOMPOSICAO_WORKERS = None      # Períodos resolvidos em paralelo (None = número de CPUs)
+
+# ============================================================================
+# PROCESSOS DE AVALIAÇÃO
+# ============================================================================
+
+AVALIACAO_WORKERS = None         # Processos de avaliação do AG (None = número de CPUs; 1 = sem pool)
+
+# ============================================================================
+# EXPORTAÇÃO DOS RESULTADOS
+# ============================================================================
+
+EXPORT_WORKERS = None            # Workers da exportação paralela (None = número de CPUs)
+
+# ============================================================================
+# CACHE DE INSTÂNCIAS COMPILADAS
+# ============================================================================
+
+CACHE_DIR = ".cache"             # Diretório das instâncias compiladas (chave: hash dos CSVs)
+
+# ============================================================================
+# SERVIÇO HTTP LOCAL (python -m src.server)
+# ============================================================================
+
+SERVIDOR_HOST = "127.0.0.1"      # Apenas conexões locais
+SERVIDOR_PORTA = 8765
+SERVIDOR_JOBS_SIMULTANEOS = 1    # Jobs que dividem o orçamento de workers (ver WORKERS_POR_JOB)
+ORCAMENTO_WORKERS = None         # Processos de avaliação somados entre todos os jobs (None = número de CPUs)
+WORKERS_POR_JOB = None           # Workers de um job do AG (None = orçamento / SERVIDOR_JOBS_SIMULTANEOS)
+SERVIDOR_FILA_MAXIMA = 32        # Jobs aguardando execução (além disso: HTTP 503)
+SERVIDOR_CORPO_MAXIMO = 10 * 1024 * 1024  # Tamanho máximo do corpo de uma requisição (bytes)
+SERVIDOR_SESSOES_MAXIMAS = 64     # Sessões what-if abertas (além disso: fecha a usada há mais tempo)
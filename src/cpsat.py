@@ -0,0 +1,343 @@
+"""
+Backend exato (CP-SAT do OR-Tools) como alternativa ao Algoritmo Genético.
+
+Formula o mesmo problema do AG como um modelo de programação por restrições:
+os conflitos de professor e de período são restrições rígidas e as demais
+penalidades e bonificações de fitness.py, com os pesos de config.py, formam a
+função objetivo. O modelo reproduz evaluate_fitness exatamente (inclusive os
+truncamentos de fragmentação e pulverização, via tabelas), de modo que o valor
+do objetivo é o fitness do cromossomo retornado e o limite do solver é um
+limite superior para qualquer horário sem conflitos.
+
+O OR-Tools é opcional (pip install ortools); sem ele, apenas este backend fica
+indisponível.
+"""
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import List, Optional, Tuple
+
+from .models import Disciplina, Slot
+from .time_grid import build_time_grid
+from .config import (
+    BASE_SCORE,
+    PESO_CONCENTRACAO,
+    PESO_LACUNA,
+    PESO_AULAS_SEQUENCIAIS,
+    PESO_FRAGMENTACAO,
+    PESO_PULVERIZACAO_SEMANAL,
+    PESO_SALTO_TEMPORAL,
+    PESO_BLOCO_INCOMPLETO,
+    PESO_OVERLOAD_SEQUENCIAL,
+    PESO_SOBRECARGA_DIARIA,
+    MIN_AULAS_SEQUENCIAIS_IDEAL,
+    MAX_AULAS_SEQUENCIAIS_IDEAL,
+    THRESHOLD_SALTO_TEMPORAL,
+    MAX_AULAS_POR_DIA,
+    CPSAT_TEMPO_LIMITE,
+    CPSAT_WORKERS
+)
+
+HAS_ORTOOLS = find_spec("ortools") is not None
+
+
+@dataclass
+class ResultadoSolver:
+    """Resultado de um backend de otimização alternativo ao AG."""
+    chromosome: Optional[List[int]]      # None se nenhuma solução viável foi encontrada
+    fitness: Optional[float]
+    status: str                          # OPTIMAL, FEASIBLE, INFEASIBLE ou UNKNOWN
+    limite: Optional[float]              # limite superior do fitness provado pelo solver
+    tempo: float                         # segundos
+    historico: List[Tuple[float, float]] = field(default_factory=list)  # (segundos, fitness) a cada melhoria
+    
+    @property
+    def otimo(self) -> bool:
+        return self.status == "OPTIMAL"
+
+
+def _tabela_fragmentacao(total_aulas: int) -> List[int]:
+    """int(quebras / dias * PESO) para índice quebras * (total_aulas + 1) + dias."""
+    tabela = []
+    for quebras in range(total_aulas + 1):
+        for dias in range(total_aulas + 1):
+            media = quebras / dias if dias > 0 else 0
+            tabela.append(int(media * PESO_FRAGMENTACAO) if media > 0 else 0)
+    return tabela
+
+
+def _tabela_pulverizacao(total_aulas: int) -> List[int]:
+    """Penalidade de pulverização para cada número de dias utilizados."""
+    tabela = []
+    for dias in range(total_aulas + 1):
+        pulverizacao = dias / total_aulas
+        tabela.append(int((pulverizacao - 0.75) * 4 * PESO_PULVERIZACAO_SEMANAL) if pulverizacao > 0.75 else 0)
+    return tabela
+
+
+def _e(model, literais: List, nome: str):
+    """Variável booleana igual à conjunção dos literais."""
+    b = model.NewBoolVar(nome)
+    model.AddBoolAnd(literais).OnlyEnforceIf(b)
+    model.AddBoolOr([lit.Not() for lit in literais] + [b])
+    return b
+
+
+def solve_cpsat(
+    disciplinas: List[Disciplina],
+    slots: List[Slot],
+    tempo_limite: float = CPSAT_TEMPO_LIMITE,
+    num_workers: int = CPSAT_WORKERS,
+    dica: Optional[List[int]] = None,
+    verbose: bool = False
+) -> ResultadoSolver:
+    """
+    Resolve a instância com o CP-SAT.
+    
+    Args:
+        disciplinas: Disciplinas (ordem de disciplinas.csv)
+        slots: Slots de horário
+        tempo_limite: Tempo máximo de busca em segundos
+        num_workers: Threads de busca do CP-SAT (0 = automático)
+        dica: Cromossomo usado como solução inicial (ex.: o melhor do AG)
+        verbose: Exibe o log de busca do solver
+    
+    Returns:
+        ResultadoSolver com um cromossomo na ordem de build_chromosome_template
+        (consumível por decode_schedule e OutputManager)
+    
+    Raises:
+        ImportError: Se o OR-Tools não estiver instalado
+    """
+    if not HAS_ORTOOLS:
+        raise ImportError("O backend CP-SAT requer o OR-Tools: pip install ortools")
+    if MIN_AULAS_SEQUENCIAIS_IDEAL != 2:
+        raise ValueError("O modelo CP-SAT assume blocos ideais a partir de 2 aulas (MIN_AULAS_SEQUENCIAIS_IDEAL = 2)")
+    from ortools.sat.python import cp_model
+    
+    grade = build_time_grid(slots)
+    num_dias, num_horas = len(grade.dias), grade.num_horarios
+    model = cp_model.CpModel()
+    
+    # x[d, slot_id]: a disciplina d tem uma aula no slot
+    x = {(d, s.slot_id): model.NewBoolVar(f"x_{d}_{s.slot_id}")
+         for d in range(len(disciplinas)) for s in slots}
+    
+    for d, disc in enumerate(disciplinas):
+        model.Add(sum(x[d, s.slot_id] for s in slots) == disc.aulas_semanais)
+    
+    # Restrições rígidas: conflitos de professor e de período por horário
+    por_horario = defaultdict(list)
+    for s in slots:
+        por_horario[(s.dia, s.inicio, s.fim)].append(s.slot_id)
+    for slot_ids in por_horario.values():
+        for chave in ("professor", "turma"):
+            grupos = defaultdict(list)
+            for d, disc in enumerate(disciplinas):
+                grupos[getattr(disc, chave)].append(d)
+            for ds in grupos.values():
+                if len(ds) > 1:
+                    model.Add(sum(x[d, sid] for d in ds for sid in slot_ids) <= 1)
+    
+    # y[d][k][h]: a disciplina d tem aula no dia k, horário h (0 se o horário não existe)
+    posicao = defaultdict(list)
+    for s in slots:
+        posicao[grade.slot_dia_idx[s.slot_id], grade.slot_hora_idx[s.slot_id]].append(s.slot_id)
+    
+    y = []
+    for d in range(len(disciplinas)):
+        dias = []
+        for k in range(num_dias):
+            horas = []
+            for h in range(num_horas):
+                ids = posicao.get((k, h), [])
+                if not ids:
+                    horas.append(0)
+                    continue
+                v = model.NewBoolVar(f"y_{d}_{k}_{h}")
+                model.Add(sum(x[d, sid] for sid in ids) == v)
+                horas.append(v)
+            dias.append(horas)
+        y.append(dias)
+    
+    def ocupado(d, k, h):
+        return y[d][k][h] if 0 <= h < num_horas else 0
+    
+    penalidades = []
+    inicios = []    # início de cada sequência de aulas consecutivas (todas as disciplinas)
+    
+    for d, disc in enumerate(disciplinas):
+        total = disc.aulas_semanais
+        inicios_total, dias_usados = [], []
+        saltos, saltos_grandes = [], []
+        
+        for k in range(num_dias):
+            horas = [h for h in range(num_horas) if not isinstance(y[d][k][h], int)]
+            
+            # Blocos: início de sequência, aula isolada e sequência acima do máximo ideal
+            for h in horas:
+                anterior, seguinte = ocupado(d, k, h - 1), ocupado(d, k, h + 1)
+                inicio = y[d][k][h] if isinstance(anterior, int) else _e(model, [y[d][k][h], anterior.Not()], f"ini_{d}_{k}_{h}")
+                inicios_total.append(inicio)
+                
+                isolada = inicio if isinstance(seguinte, int) else _e(model, [inicio, seguinte.Not()], f"iso_{d}_{k}_{h}")
+                penalidades.append((PESO_BLOCO_INCOMPLETO + PESO_AULAS_SEQUENCIAIS) * isolada)
+                
+                cauda = [ocupado(d, k, h + i) for i in range(1, MAX_AULAS_SEQUENCIAIS_IDEAL + 1)]
+                if all(not isinstance(c, int) for c in cauda):
+                    overload = _e(model, [inicio] + cauda, f"ovl_{d}_{k}_{h}")
+                    penalidades.append((PESO_OVERLOAD_SEQUENCIAL + PESO_AULAS_SEQUENCIAIS) * overload)
+            
+            # Dia utilizado e concentração
+            aulas_dia = sum(y[d][k][h] for h in horas)
+            usado = model.NewBoolVar(f"usado_{d}_{k}")
+            model.Add(aulas_dia >= 1).OnlyEnforceIf(usado)
+            model.Add(aulas_dia == 0).OnlyEnforceIf(usado.Not())
+            dias_usados.append(usado)
+            
+            excesso = model.NewIntVar(0, total, f"conc_{d}_{k}")
+            model.AddMaxEquality(excesso, [aulas_dia - 2, 0])
+            penalidades.append(PESO_CONCENTRACAO * excesso)
+            
+            # Saltos temporais: par de aulas no mesmo dia a mais de THRESHOLD índices
+            pares = [(a, b) for a in horas for b in horas if b - a > THRESHOLD_SALTO_TEMPORAL]
+            ambos = {(a, b): _e(model, [y[d][k][a], y[d][k][b]], f"par_{d}_{k}_{a}_{b}") for a, b in pares}
+            if pares:
+                salto = model.NewBoolVar(f"salto_{d}_{k}")
+                model.AddMaxEquality(salto, list(ambos.values()))
+                saltos.append(salto)
+            grandes = [ambos[a, b] for a, b in pares if b - a > THRESHOLD_SALTO_TEMPORAL + 2]
+            if grandes:
+                grande = model.NewBoolVar(f"salto_grande_{d}_{k}")
+                model.AddMaxEquality(grande, grandes)
+                saltos_grandes.append(grande)
+        
+        penalidades.append(PESO_SALTO_TEMPORAL * sum(saltos))
+        if saltos_grandes:
+            algum_grande = model.NewBoolVar(f"algum_salto_grande_{d}")
+            model.AddMaxEquality(algum_grande, saltos_grandes)
+            penalidades.append(PESO_SALTO_TEMPORAL * algum_grande)
+        
+        # Fragmentação (quebras = sequências - dias utilizados) e pulverização, por tabela
+        num_dias_var = model.NewIntVar(1, total, f"dias_{d}")
+        model.Add(num_dias_var == sum(dias_usados))
+        quebras = model.NewIntVar(0, total, f"quebras_{d}")
+        model.Add(quebras == sum(inicios_total) - num_dias_var)
+        inicios.extend(inicios_total)
+        
+        indice = model.NewIntVar(0, (total + 1) ** 2 - 1, f"frag_idx_{d}")
+        model.Add(indice == quebras * (total + 1) + num_dias_var)
+        tabela = _tabela_fragmentacao(total)
+        fragmentacao = model.NewIntVar(0, max(tabela), f"frag_{d}")
+        model.AddElement(indice, tabela, fragmentacao)
+        penalidades.append(fragmentacao)
+        
+        tabela = _tabela_pulverizacao(total)
+        pulverizacao = model.NewIntVar(0, max(tabela), f"pulv_{d}")
+        model.AddElement(num_dias_var, tabela, pulverizacao)
+        penalidades.append(pulverizacao)
+    
+    # Lacunas e sobrecarga diária por período
+    por_periodo = defaultdict(list)
+    for d, disc in enumerate(disciplinas):
+        por_periodo[disc.turma].append(d)
+    
+    for periodo, ds in enumerate(por_periodo.values()):
+        for k in range(num_dias):
+            ocupados = []
+            for h in range(num_horas):
+                vs = [y[d][k][h] for d in ds if not isinstance(y[d][k][h], int)]
+                if not vs:
+                    continue
+                o = model.NewBoolVar(f"ocup_{periodo}_{k}_{h}")
+                model.AddMaxEquality(o, vs)
+                ocupados.append((h, o))
+            if not ocupados:
+                continue
+            
+            # Lacuna: horário livre com aulas do período antes e depois no mesmo dia
+            ocupacao = dict(ocupados)
+            antes, depois = {}, {}
+            acumulado = None
+            for h in range(num_horas):
+                antes[h] = acumulado
+                if h in ocupacao:
+                    if acumulado is None:
+                        acumulado = ocupacao[h]
+                    else:
+                        novo = model.NewBoolVar(f"antes_{periodo}_{k}_{h}")
+                        model.AddMaxEquality(novo, [acumulado, ocupacao[h]])
+                        acumulado = novo
+            acumulado = None
+            for h in reversed(range(num_horas)):
+                depois[h] = acumulado
+                if h in ocupacao:
+                    if acumulado is None:
+                        acumulado = ocupacao[h]
+                    else:
+                        novo = model.NewBoolVar(f"depois_{periodo}_{k}_{h}")
+                        model.AddMaxEquality(novo, [acumulado, ocupacao[h]])
+                        acumulado = novo
+            for h in range(num_horas):
+                if antes[h] is None or depois[h] is None:
+                    continue
+                literais = [antes[h], depois[h]] + ([ocupacao[h].Not()] if h in ocupacao else [])
+                penalidades.append(PESO_LACUNA * _e(model, literais, f"lacuna_{periodo}_{k}_{h}"))
+            
+            aulas = sum(y[d][k][h] for d in ds for h in range(num_horas) if not isinstance(y[d][k][h], int))
+            sobrecarga = model.NewIntVar(0, sum(disciplinas[d].aulas_semanais for d in ds), f"sobrec_{periodo}_{k}")
+            model.AddMaxEquality(sobrecarga, [aulas - MAX_AULAS_POR_DIA, 0])
+            penalidades.append(PESO_SOBRECARGA_DIARIA * sobrecarga)
+    
+    if dica is not None:
+        escolhidos = set()
+        posicao_gene = 0
+        for d, disc in enumerate(disciplinas):
+            escolhidos.update((d, sid) for sid in dica[posicao_gene:posicao_gene + disc.aulas_semanais])
+            posicao_gene += disc.aulas_semanais
+        for chave, var in x.items():
+            model.AddHint(var, chave in escolhidos)
+    
+    # Bonificação: blocos ideais = sequências - isoladas - overload; as duas últimas
+    # já foram penalizadas acima com o desconto da bonificação
+    model.Minimize(sum(penalidades) - PESO_AULAS_SEQUENCIAIS * sum(inicios))
+    
+    class _Historico(cp_model.CpSolverSolutionCallback):
+        """Registra (tempo, fitness) a cada solução melhor encontrada."""
+        
+        def __init__(self):
+            super().__init__()
+            self.inicio = time.time()
+            self.pontos: List[Tuple[float, float]] = []
+        
+        def on_solution_callback(self):
+            self.pontos.append((time.time() - self.inicio, BASE_SCORE - self.ObjectiveValue()))
+    
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = tempo_limite
+    solver.parameters.num_search_workers = num_workers
+    solver.parameters.log_search_progress = verbose
+    historico = _Historico()
+    
+    inicio = time.time()
+    status = solver.Solve(model, historico)
+    tempo = time.time() - inicio
+    nome_status = solver.StatusName(status)
+    
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return ResultadoSolver(None, None, nome_status, None, tempo, historico.pontos)
+    
+    chromosome = []
+    for d, disc in enumerate(disciplinas):
+        chromosome.extend(sorted(s.slot_id for s in slots if solver.Value(x[d, s.slot_id])))
+    
+    return ResultadoSolver(
+        chromosome=chromosome,
+        fitness=BASE_SCORE - solver.ObjectiveValue(),
+        status=nome_status,
+        limite=BASE_SCORE - solver.BestObjectiveBound(),
+        tempo=tempo,
+        historico=historico.pontos,
+    )
@@ -0,0 +1,53 @@
+"""
+Operadores de crossover que respeitam a estrutura do cromossomo.
+
+O tools.cxTwoPoint corta o cromossomo em posições arbitrárias: as aulas de
+uma disciplina podem ficar divididas entre os pais, desfazendo os blocos
+consecutivos que a bonificação premia. Os operadores daqui trocam grupos
+inteiros de genes entre os pais, usando a disciplina ou o período de cada gene
+(expanded_disciplines):
+
+- disciplinas: cada disciplina (todas as suas aulas) vem de um dos pais
+- periodos: cada período (a grade semanal inteira da turma) vem de um dos pais
+
+Ambos são cx_grupos com os grupos de grupos_genes e seguem a convenção do
+DEAP: alteram os pais in-place e os retornam.
+"""
+
+import random
+from typing import Callable, Dict, List, Tuple
+
+from .models import Disciplina
+
+OPERADORES_CROSSOVER = ("dois_pontos", "disciplinas", "periodos")
+# Operadores da representação por permutação (ver permutation_encoding.py)
+OPERADORES_PERMUTACAO = ("pmx", "ordenado")
+
+
+def grupos_genes(expanded_disciplines: List[Disciplina], chave: Callable[[Disciplina], object]) -> List[List[int]]:
+    """Índices dos genes de cada valor de chave (ex.: código ou período), na ordem do cromossomo."""
+    grupos: Dict[object, List[int]] = {}
+    for i, disc in enumerate(expanded_disciplines):
+        grupos.setdefault(chave(disc), []).append(i)
+    return list(grupos.values())
+
+
+def cx_grupos(ind1: List[int], ind2: List[int], grupos: List[List[int]], indpb: float) -> Tuple[List[int], List[int]]:
+    """
+    Crossover uniforme por grupos: cada grupo é trocado entre os pais com probabilidade indpb.
+    
+    Com dois ou mais grupos, ao menos um é trocado e ao menos um é mantido,
+    para que os filhos não sejam cópias dos pais.
+    """
+    if len(grupos) < 2:
+        return ind1, ind2
+    trocar = [random.random() < indpb for _ in grupos]
+    if all(trocar) or not any(trocar):
+        i = random.randrange(len(grupos))
+        trocar[i] = not trocar[i]
+    for grupo, troca in zip(grupos, trocar):
+        if troca:
+            for i in grupo:
+                ind1[i], ind2[i] = ind2[i], ind1[i]
+    return ind1, ind2
+
@@ -1,35 +1,58 @@
 """
 Funções para carregar e validar dados dos arquivos CSV.
+
+O leitor padrão usa o módulo csv da biblioteca padrão: percorre as linhas em
+streaming, valida os tipos de cada linha (com o número da linha na mensagem de
+erro) e alimenta diretamente a instância compilada. O leitor baseado em pandas
+continua disponível como alternativa para arquivos fora do padrão.
+
+Uma instância pode reunir vários cursos: além de disciplinas.csv, cada arquivo
+disciplinas_<CURSO>.csv do diretório é lido com curso=<CURSO>. Os períodos
+ficam separados por curso (Disciplina.turma) e os professores são comuns a
+todos os arquivos, de modo que um professor que leciona em dois cursos não
+pode ter aulas simultâneas neles. Os códigos de disciplina devem ser únicos
+entre os cursos; a grade de horarios.csv é a mesma para todos.
 """
 
+import csv
 from pathlib import Path
-from typing import List, Tuple
-import pandas as pd
+from typing import Dict, Iterator, List, Tuple
 
 from .models import Disciplina, Slot
+from .problem import CompiledProblem, ProblemBuilder
+
+REQUIRED_COLS_DISC = ['periodo', 'codigo', 'nome', 'carga_horaria', 'professor', 'aulas_semanais']
+REQUIRED_COLS_HORA = ['slot_id', 'dia', 'inicio', 'fim']
 
+# Leitores disponíveis: "csv" (streaming), "pandas" ou "auto" (csv com fallback para pandas)
+ENGINES = ("auto", "csv", "pandas")
 
-def load_and_validate_csv(csv_dir: Path = Path("CSVs")) -> Tuple[List[Disciplina], List[Slot]]:
+
+def arquivos_disciplinas(csv_dir: Path) -> List[Tuple[str, Path]]:
     """
-    Carrega e valida os arquivos CSV de disciplinas e horários.
+    Arquivos de disciplinas do diretório e o curso de cada um.
     
-    Args:
-        csv_dir: Diretório contendo os arquivos CSV
-        
-    Returns:
-        Tupla contendo lista de disciplinas e lista de slots
-        
-    Raises:
-        FileNotFoundError: Se os arquivos CSV não existirem
-        ValueError: Se os CSVs estiverem malformados ou faltarem colunas
+    disciplinas.csv tem curso "" (instância de um só curso, como antes);
+    disciplinas_<CURSO>.csv tem curso <CURSO>. A ordem é a do nome do arquivo.
     """
-    disciplinas_path = csv_dir / "disciplinas.csv"
+    arquivos = []
+    for path in sorted(Path(csv_dir).glob("disciplinas*.csv")):
+        if path.name == "disciplinas.csv":
+            arquivos.append(("", path))
+        elif path.stem.startswith("disciplinas_") and len(path.stem) > len("disciplinas_"):
+            arquivos.append((path.stem[len("disciplinas_"):], path))
+    return arquivos
+
+
+def check_files(csv_dir: Path) -> Tuple[List[Tuple[str, Path]], Path]:
+    """Retorna os arquivos de disciplinas (com o curso) e o de horários, verificando se existem."""
+    disciplinas_paths = arquivos_disciplinas(csv_dir)
     horarios_path = csv_dir / "horarios.csv"
     
-    if not disciplinas_path.exists():
+    if not disciplinas_paths:
         raise FileNotFoundError(
-            f"Arquivo não encontrado: {disciplinas_path}\n"
-            f"   Certifique-se de que 'disciplinas.csv' está no diretório CSVs/"
+            f"Arquivo não encontrado: {csv_dir / 'disciplinas.csv'}\n"
+            f"   Certifique-se de que 'disciplinas.csv' (ou disciplinas_<CURSO>.csv) está no diretório CSVs/"
         )
     
     if not horarios_path.exists():
@@ -38,71 +61,270 @@ def load_and_validate_csv(csv_dir: Path = Path("CSVs")) -> Tuple[List[Disciplina
             f"   Certifique-se de que 'horarios.csv' está no diretório CSVs/"
         )
     
-    # Carregar disciplinas
-    try:
-        df_disciplinas = pd.read_csv(disciplinas_path)
-    except Exception as e:
-        raise ValueError(f"Erro ao ler disciplinas.csv: {e}")
+    return disciplinas_paths, horarios_path
+
+
+def _iter_rows(path: Path, required_cols: List[str], key_col: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Percorre as linhas de um CSV, retornando (número da linha, linha).
     
-    # Validar colunas obrigatórias
-    required_cols_disc = ['periodo', 'codigo', 'nome', 'carga_horaria', 'professor', 'aulas_semanais']
-    missing_cols = set(required_cols_disc) - set(df_disciplinas.columns)
-    if missing_cols:
+    Linhas em branco e linhas sem valor na coluna-chave são ignoradas, como
+    no leitor baseado em pandas.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        
+        columns = [c.strip() for c in (reader.fieldnames or [])]
+        if len(columns) == 1 and len(required_cols) > 1:
+            # Provavelmente outro delimitador (ex.: ';'); o leitor pandas detecta sozinho
+            raise csv.Error(f"Delimitador não reconhecido em {path.name}")
+        missing_cols = set(required_cols) - set(columns)
+        if missing_cols:
+            raise ValueError(
+                f"Colunas faltando em {path.name}: {missing_cols}\n"
+                f"   Colunas esperadas: {required_cols}"
+            )
+        reader.fieldnames = columns
+        
+        for row in reader:
+            value = row.get(key_col)
+            if value is None or not value.strip():
+                continue
+            yield reader.line_num, row
+
+
+def _parse_int(row: Dict[str, str], col: str, filename: str, line: int, minimo: int = None) -> int:
+    """Converte o valor de uma coluna para inteiro, com erro indicando a linha."""
+    raw = (row.get(col) or '').strip()
+    try:
+        value = int(raw)
+    except ValueError:
         raise ValueError(
-            f"Colunas faltando em disciplinas.csv: {missing_cols}\n"
-            f"   Colunas esperadas: {required_cols_disc}"
+            f"{filename}, linha {line}: valor inválido para '{col}': {raw!r} (esperado inteiro)"
+        ) from None
+    if minimo is not None and value < minimo:
+        raise ValueError(
+            f"{filename}, linha {line}: '{col}' deve ser >= {minimo}, encontrado {value}"
         )
-    
-    # Remover linhas vazias e criar objetos Disciplina
-    df_disciplinas = df_disciplinas.dropna(subset=['codigo'])
-    disciplinas = [
-        Disciplina(
-            periodo=int(row['periodo']),
-            codigo=str(row['codigo']),
-            nome=str(row['nome']),
-            carga_horaria=int(row['carga_horaria']),
-            professor=str(row['professor']),
-            aulas_semanais=int(row['aulas_semanais'])
+    return value
+
+
+def _parse_str(row: Dict[str, str], col: str, filename: str, line: int) -> str:
+    """Retorna o valor textual de uma coluna obrigatória."""
+    value = (row.get(col) or '').strip()
+    if not value:
+        raise ValueError(f"{filename}, linha {line}: coluna '{col}' vazia")
+    return value
+
+
+def _parse_time(row: Dict[str, str], col: str, filename: str, line: int) -> str:
+    """Valida um horário no formato HH:MM."""
+    value = _parse_str(row, col, filename, line)
+    hh, sep, mm = value.partition(':')
+    if not (sep and hh.isdigit() and mm.isdigit() and len(mm) == 2
+            and int(hh) < 24 and int(mm) < 60):
+        raise ValueError(
+            f"{filename}, linha {line}: horário inválido em '{col}': {value!r} (esperado HH:MM)"
         )
-        for _, row in df_disciplinas.iterrows()
-    ]
+    return value
+
+
+def stream_disciplinas(path: Path, curso: str = "") -> Iterator[Disciplina]:
+    """Lê um arquivo de disciplinas linha a linha, validando os tipos de cada linha."""
+    for line, row in _iter_rows(path, REQUIRED_COLS_DISC, 'codigo'):
+        yield Disciplina(
+            periodo=_parse_int(row, 'periodo', path.name, line),
+            codigo=_parse_str(row, 'codigo', path.name, line),
+            nome=_parse_str(row, 'nome', path.name, line),
+            carga_horaria=_parse_int(row, 'carga_horaria', path.name, line, minimo=0),
+            professor=_parse_str(row, 'professor', path.name, line),
+            aulas_semanais=_parse_int(row, 'aulas_semanais', path.name, line, minimo=1),
+            curso=curso
+        )
+
+
+def stream_slots(path: Path) -> Iterator[Slot]:
+    """Lê horarios.csv linha a linha, validando tipos e unicidade dos slot_ids."""
+    seen: Dict[int, int] = {}
+    for line, row in _iter_rows(path, REQUIRED_COLS_HORA, 'slot_id'):
+        slot_id = _parse_int(row, 'slot_id', path.name, line)
+        if slot_id in seen:
+            raise ValueError(
+                f"{path.name}, linha {line}: slot_id {slot_id} duplicado "
+                f"(já definido na linha {seen[slot_id]})"
+            )
+        seen[slot_id] = line
+        yield Slot(
+            slot_id=slot_id,
+            dia=_parse_str(row, 'dia', path.name, line),
+            inicio=_parse_time(row, 'inicio', path.name, line),
+            fim=_parse_time(row, 'fim', path.name, line)
+        )
+
+
+def _read_csv_pandas(path: Path):
+    """Lê um CSV com pandas detectando o delimitador e tolerando arquivos em latin-1."""
+    # pandas é importado sob demanda para não pesar na inicialização
+    import pandas as pd
     
-    if not disciplinas:
-        raise ValueError("Nenhuma disciplina encontrada em disciplinas.csv")
+    try:
+        return pd.read_csv(path, sep=None, engine='python', encoding='utf-8-sig')
+    except UnicodeDecodeError:
+        return pd.read_csv(path, sep=None, engine='python', encoding='latin-1')
+
+
+def _load_with_pandas(
+    disciplinas_paths: List[Tuple[str, Path]],
+    horarios_path: Path
+) -> Tuple[List[Disciplina], List[Slot]]:
+    """Leitor alternativo baseado em pandas, para arquivos fora do padrão."""
+    disciplinas = []
+    for curso, disciplinas_path in disciplinas_paths:
+        # Carregar disciplinas
+        try:
+            df_disciplinas = _read_csv_pandas(disciplinas_path)
+        except Exception as e:
+            raise ValueError(f"Erro ao ler {disciplinas_path.name}: {e}")
+        
+        # Validar colunas obrigatórias
+        missing_cols = set(REQUIRED_COLS_DISC) - set(df_disciplinas.columns)
+        if missing_cols:
+            raise ValueError(
+                f"Colunas faltando em {disciplinas_path.name}: {missing_cols}\n"
+                f"   Colunas esperadas: {REQUIRED_COLS_DISC}"
+            )
+        
+        # Remover linhas vazias e criar objetos Disciplina
+        df_disciplinas = df_disciplinas.dropna(subset=['codigo'])
+        disciplinas.extend(
+            Disciplina(
+                periodo=int(row.periodo),
+                codigo=str(row.codigo),
+                nome=str(row.nome),
+                carga_horaria=int(row.carga_horaria),
+                professor=str(row.professor),
+                aulas_semanais=int(row.aulas_semanais),
+                curso=curso
+            )
+            for row in df_disciplinas[REQUIRED_COLS_DISC].itertuples(index=False)
+        )
     
     # Carregar horários
     try:
-        df_horarios = pd.read_csv(horarios_path)
+        df_horarios = _read_csv_pandas(horarios_path)
     except Exception as e:
         raise ValueError(f"Erro ao ler horarios.csv: {e}")
     
     # Validar colunas obrigatórias
-    required_cols_hora = ['slot_id', 'dia', 'inicio', 'fim']
-    missing_cols = set(required_cols_hora) - set(df_horarios.columns)
+    missing_cols = set(REQUIRED_COLS_HORA) - set(df_horarios.columns)
     if missing_cols:
         raise ValueError(
             f"Colunas faltando em horarios.csv: {missing_cols}\n"
-            f"   Colunas esperadas: {required_cols_hora}"
+            f"   Colunas esperadas: {REQUIRED_COLS_HORA}"
         )
     
     # Remover linhas vazias e criar objetos Slot
     df_horarios = df_horarios.dropna(subset=['slot_id'])
     slots = [
         Slot(
-            slot_id=int(row['slot_id']),
-            dia=str(row['dia']),
-            inicio=str(row['inicio']),
-            fim=str(row['fim'])
+            slot_id=int(row.slot_id),
+            dia=str(row.dia),
+            inicio=str(row.inicio),
+            fim=str(row.fim)
         )
-        for _, row in df_horarios.iterrows()
+        for row in df_horarios[REQUIRED_COLS_HORA].itertuples(index=False)
     ]
     
-    if not slots:
-        raise ValueError("Nenhum slot de horário encontrado em horarios.csv")
-    
     # Verificar unicidade dos slot_ids
     slot_ids = [s.slot_id for s in slots]
     if len(slot_ids) != len(set(slot_ids)):
         raise ValueError("Existem slot_ids duplicados em horarios.csv")
     
     return disciplinas, slots
+
+
+def load_compiled_problem(csv_dir: Path = Path("CSVs"), engine: str = "auto") -> CompiledProblem:
+    """
+    Carrega os CSVs e monta diretamente a instância compilada.
+    
+    Todos os arquivos de disciplinas do diretório (ver arquivos_disciplinas)
+    são reunidos em uma única instância.
+    
+    Args:
+        csv_dir: Diretório contendo os arquivos CSV
+        engine: "csv" (streaming com validação por linha), "pandas", ou
+            "auto" (csv, recorrendo ao pandas para arquivos com outra
+            codificação ou outro delimitador)
+    
+    Returns:
+        Instância compilada com disciplinas, slots e arrays de índices
+    
+    Raises:
+        FileNotFoundError: Se os arquivos CSV não existirem
+        ValueError: Se os CSVs estiverem malformados ou faltarem colunas
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Leitor de CSV desconhecido: {engine!r}. Opções: {ENGINES}")
+    
+    disciplinas_paths, horarios_path = check_files(csv_dir)
+    builder = ProblemBuilder()
+    curso_codigo: Dict[str, str] = {}
+    
+    def adicionar(disc: Disciplina) -> None:
+        # O código identifica a disciplina na avaliação: não pode se repetir entre cursos
+        curso = curso_codigo.setdefault(disc.codigo, disc.curso)
+        if curso != disc.curso:
+            raise ValueError(
+                f"Código de disciplina {disc.codigo!r} repetido nos cursos {curso!r} e {disc.curso!r}\n"
+                f"   Use códigos distintos em cada disciplinas_<CURSO>.csv"
+            )
+        builder.add_disciplina(disc)
+    
+    if engine == "pandas":
+        disciplinas, slots = _load_with_pandas(disciplinas_paths, horarios_path)
+        for disc in disciplinas:
+            adicionar(disc)
+        for slot in slots:
+            builder.add_slot(slot)
+    else:
+        try:
+            for curso, disciplinas_path in disciplinas_paths:
+                for disc in stream_disciplinas(disciplinas_path, curso):
+                    adicionar(disc)
+            for slot in stream_slots(horarios_path):
+                builder.add_slot(slot)
+        except (UnicodeDecodeError, csv.Error):
+            if engine == "csv":
+                raise
+            return load_compiled_problem(csv_dir, engine="pandas")
+    
+    if not builder.disciplinas:
+        raise ValueError("Nenhuma disciplina encontrada em disciplinas.csv")
+    if not builder.slots:
+        raise ValueError("Nenhum slot de horário encontrado em horarios.csv")
+    
+    problem = builder.build()
+    # A grade de tempo é construída já na carga: slots que começam em horários
+    # fora de ORDEM_HORARIOS (quando configurada) geram erro aqui, em vez de serem ignorados na avaliação
+    if problem.time_grid.num_horarios == 0:
+        raise ValueError("Nenhum horário de início definido para a grade de tempo")
+    return problem
+
+
+def load_and_validate_csv(csv_dir: Path = Path("CSVs"), engine: str = "auto") -> Tuple[List[Disciplina], List[Slot]]:
+    """
+    Carrega e valida os arquivos CSV de disciplinas e horários.
+    
+    Args:
+        csv_dir: Diretório contendo os arquivos CSV
+        engine: Leitor a ser usado (ver load_compiled_problem)
+    
+    Returns:
+        Tupla contendo lista de disciplinas e lista de slots
+    
+    Raises:
+        FileNotFoundError: Se os arquivos CSV não existirem
+        ValueError: Se os CSVs estiverem malformados ou faltarem colunas
+    """
+    problem = load_compiled_problem(csv_dir, engine=engine)
+    return problem.disciplinas, problem.slots
@@ -0,0 +1,281 @@
+"""
+Tabela de padrões diários das penalidades de qualidade.
+
+Blocos consecutivos, fragmentação, saltos temporais e concentração dependem
+apenas do conjunto de índices de horário que uma disciplina ocupa em cada dia.
+Com H índices de horário há 2**H padrões possíveis (1024 para 10 horários);
+cada padrão, como máscara de bits, é mapeado uma única vez para o seu perfil
+
+    (blocos ideais, blocos overload, aulas isoladas, quebras, salto,
+     maior salto, aulas)
+
+e as penalidades de uma disciplina passam a ser consultas à tabela e somas,
+com os mesmos valores de count_consecutive_blocks,
+compute_discipline_daily_spread, compute_temporal_jump_penalty e
+penalidade_concentracao (fitness.py).
+
+Duas aulas da mesma disciplina no mesmo índice de horário não cabem em uma
+máscara; nesses dias o perfil é calculado a partir da lista de índices.
+"""
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .models import Disciplina, Slot
+from .time_grid import time_grid_for
+from .config import (
+    PESO_CONCENTRACAO,
+    PESO_AULAS_SEQUENCIAIS,
+    PESO_FRAGMENTACAO,
+    PESO_PULVERIZACAO_SEMANAL,
+    PESO_SALTO_TEMPORAL,
+    PESO_BLOCO_INCOMPLETO,
+    PESO_OVERLOAD_SEQUENCIAL,
+    MIN_AULAS_SEQUENCIAIS_IDEAL,
+    MAX_AULAS_SEQUENCIAIS_IDEAL,
+    THRESHOLD_SALTO_TEMPORAL
+)
+
+# Grades com mais horários por dia calculam os perfis sem tabela
+MAX_HORARIOS_TABELA = 16
+
+# Ordem dos componentes retornados por DayPatterns.componentes_disciplina
+COMPONENTES_PADRAO = (
+    "penalidade_fragmentacao",
+    "penalidade_pulverizacao",
+    "penalidade_salto_temporal",
+    "penalidade_concentracao",
+    "penalidade_overload",
+    "penalidade_blocos_incompletos",
+    "bonificacao_sequencial",
+    "blocos_ideais",
+    "blocos_overload",
+    "aulas_isoladas",
+)
+
+# Ordem das contagens brutas retornadas por contagens_disciplina
+CONTAGENS_PADRAO = (
+    "fragmentacao",
+    "pulverizacao",
+    "saltos_temporais",
+    "excesso_concentracao",
+    "blocos_overload",
+    "aulas_isoladas",
+    "blocos_ideais",
+)
+
+# Perfil de um dia: (ideais, overload, isoladas, quebras, salto, maior salto, aulas)
+PerfilDia = Tuple[int, int, int, int, int, int, int]
+
+
+def perfil_dia(indices: List[int]) -> PerfilDia:
+    """
+    Perfil das aulas de uma disciplina em um dia, a partir dos índices de
+    horário ordenados (com repetições, se houver).
+    
+    O maior salto é a distância entre a primeira e a última aula apenas
+    quando há salto (distância maior que THRESHOLD_SALTO_TEMPORAL), como em
+    compute_temporal_jump_penalty.
+    """
+    ideais = overload = isoladas = 0
+    i = 0
+    while i < len(indices):
+        j = i
+        while j < len(indices) - 1 and indices[j + 1] == indices[j] + 1:
+            j += 1
+        sequencia = j - i + 1
+        if sequencia == 1:
+            isoladas += 1
+        elif MIN_AULAS_SEQUENCIAIS_IDEAL <= sequencia <= MAX_AULAS_SEQUENCIAIS_IDEAL:
+            ideais += 1
+        else:
+            overload += 1
+        i = j + 1
+    
+    quebras = sum(1 for a, b in zip(indices, indices[1:]) if b != a + 1)
+    
+    salto = maior_salto = 0
+    if len(indices) >= 2 and indices[-1] - indices[0] > THRESHOLD_SALTO_TEMPORAL:
+        salto = 1
+        maior_salto = indices[-1] - indices[0]
+    
+    return ideais, overload, isoladas, quebras, salto, maior_salto, len(indices)
+
+
+@lru_cache(maxsize=4096)
+def perfil_repetido(indices: Tuple[int, ...]) -> PerfilDia:
+    """Perfil de um dia com índices repetidos (ou fora da tabela), memorizado."""
+    return perfil_dia(list(indices))
+
+
+@lru_cache(maxsize=None)
+def tabela_padroes(num_horarios: int) -> Tuple[PerfilDia, ...]:
+    """Perfil de cada máscara de 0 a 2**num_horarios - 1 (bit h = índice de horário h)."""
+    return tuple(
+        perfil_dia([h for h in range(num_horarios) if mascara >> h & 1])
+        for mascara in range(1 << num_horarios)
+    )
+
+
+def contagens_disciplina(perfis: List[PerfilDia]) -> tuple:
+    """
+    Contagens brutas de uma disciplina, sem pesos (ordem de CONTAGENS_PADRAO),
+    a partir dos perfis dos dias em que ela tem aulas.
+    
+    Fragmentação e pulverização são as razões que penalidade_fragmentacao_disciplina
+    e penalidade_pulverizacao_semanal multiplicam pelo peso (a pulverização já
+    como o fator acima de 0.75); os saltos contam um a mais quando o maior
+    salto passa de THRESHOLD_SALTO_TEMPORAL + 2.
+    """
+    if not perfis:
+        return (0.0, 0.0, 0, 0, 0, 0, 0)
+    
+    ideais = overload = isoladas = quebras = saltos = maior_salto = aulas = excesso = 0
+    for p_ideais, p_overload, p_isoladas, p_quebras, p_salto, p_maior, p_aulas in perfis:
+        ideais += p_ideais
+        overload += p_overload
+        isoladas += p_isoladas
+        quebras += p_quebras
+        saltos += p_salto
+        if p_maior > maior_salto:
+            maior_salto = p_maior
+        aulas += p_aulas
+        if p_aulas > 2:
+            excesso += p_aulas - 2
+    dias = len(perfis)
+    
+    fragmentacao_media = quebras / dias
+    pulverizacao = dias / aulas
+    fator_pulverizacao = (pulverizacao - 0.75) * 4 if pulverizacao > 0.75 else 0.0
+    if saltos > 0 and maior_salto > THRESHOLD_SALTO_TEMPORAL + 2:
+        saltos += 1
+    
+    return (fragmentacao_media, fator_pulverizacao, saltos, excesso, overload, isoladas, ideais)
+
+
+def custos_disciplina(perfis: List[PerfilDia]) -> tuple:
+    """
+    Penalidades, bonificação e blocos de uma disciplina a partir dos perfis
+    dos dias em que ela tem aulas (ordem de COMPONENTES_PADRAO).
+    """
+    frag, pulv, saltos, excesso, overload, isoladas, ideais = contagens_disciplina(perfis)
+    # Mesmas expressões de penalidade_fragmentacao_disciplina e penalidade_pulverizacao_semanal
+    return (int(frag * PESO_FRAGMENTACAO) if frag > 0 else 0,
+            int(pulv * PESO_PULVERIZACAO_SEMANAL) if pulv > 0 else 0,
+            saltos * PESO_SALTO_TEMPORAL,
+            excesso * PESO_CONCENTRACAO,
+            overload * PESO_OVERLOAD_SEQUENCIAL,
+            isoladas * PESO_BLOCO_INCOMPLETO,
+            ideais * PESO_AULAS_SEQUENCIAIS,
+            ideais, overload, isoladas)
+
+
+class DayPatterns:
+    """Posição (dia, bit de horário) de cada slot e a tabela de padrões da grade."""
+    
+    def __init__(self, expanded_disciplines: List[Disciplina], slot_mapping: Dict[int, Slot]):
+        grade = time_grid_for(slot_mapping)
+        self.tabela = (tabela_padroes(grade.num_horarios)
+                       if grade.num_horarios <= MAX_HORARIOS_TABELA else None)
+        # slot_id -> (índice do dia, índice do horário, bit do horário)
+        self.slot_posicao: Dict[int, Tuple[int, int, int]] = {
+            slot_id: (grade.slot_dia_idx[slot_id], hora, 1 << hora)
+            for slot_id, hora in grade.slot_hora_idx.items()
+        }
+        # código -> índices dos genes da disciplina (na ordem do cromossomo)
+        self.genes_codigo: Dict[str, List[int]] = defaultdict(list)
+        for i, disc in enumerate(expanded_disciplines):
+            self.genes_codigo[disc.codigo].append(i)
+        # Máscaras de todas as disciplinas em uma lista: a disciplina de
+        # ordem c ocupa as posições c * num_dias a (c + 1) * num_dias - 1
+        self.num_dias = len(grade.dias)
+        ordem = {codigo: c for c, codigo in enumerate(self.genes_codigo)}
+        self.base_gene = [ordem[disc.codigo] * self.num_dias for disc in expanded_disciplines]
+    
+    def perfis_disciplina(self, slots: List[int]) -> List[PerfilDia]:
+        """Perfis dos dias de uma disciplina com aulas nos slots dados."""
+        posicao = self.slot_posicao
+        mascaras: Dict[int, int] = {}
+        indices = defaultdict(list)
+        repetidos = set()
+        for slot_id in slots:
+            pos = posicao.get(slot_id)
+            if pos is None:
+                continue
+            dia, hora, bit = pos
+            mascara = mascaras.get(dia, 0)
+            if mascara & bit or self.tabela is None:
+                repetidos.add(dia)
+            mascaras[dia] = mascara | bit
+            indices[dia].append(hora)
+        
+        return [perfil_repetido(tuple(sorted(indices[dia]))) if dia in repetidos else self.tabela[m]
+                for dia, m in mascaras.items()]
+    
+    def perfis(self, individual: List[int]) -> List[List[PerfilDia]]:
+        """Perfis dos dias de cada disciplina do cromossomo (ordem de genes_codigo)."""
+        if self.tabela is None:
+            return [self.perfis_disciplina([individual[i] for i in genes])
+                    for genes in self.genes_codigo.values()]
+        
+        posicao = self.slot_posicao
+        num_dias = self.num_dias
+        mascaras = [0] * (len(self.genes_codigo) * num_dias)
+        repetidas = set()
+        for slot_id, base in zip(individual, self.base_gene):
+            pos = posicao.get(slot_id)
+            if pos is None:
+                continue
+            k = base + pos[0]
+            if mascaras[k] & pos[2]:
+                repetidas.add(base)
+            mascaras[k] |= pos[2]
+        
+        tabela = self.tabela
+        perfis = []
+        for genes in self.genes_codigo.values():
+            base = self.base_gene[genes[0]]
+            if base in repetidas:
+                perfis.append(self.perfis_disciplina([individual[i] for i in genes]))
+            else:
+                perfis.append([tabela[m] for m in mascaras[base:base + num_dias] if m])
+        return perfis
+    
+    def componentes_disciplina(self, slots: List[int]) -> tuple:
+        """Componentes (ordem de COMPONENTES_PADRAO) de uma disciplina com aulas nos slots dados."""
+        return custos_disciplina(self.perfis_disciplina(slots))
+    
+    def componentes(self, individual: List[int]) -> Dict[str, tuple]:
+        """Componentes de cada disciplina do cromossomo."""
+        return {codigo: custos_disciplina(perfis)
+                for codigo, perfis in zip(self.genes_codigo, self.perfis(individual))}
+    
+    def contagens(self, individual: List[int]) -> List[tuple]:
+        """Contagens brutas de cada disciplina (ordem de genes_codigo e de CONTAGENS_PADRAO)."""
+        return [contagens_disciplina(perfis) for perfis in self.perfis(individual)]
+    
+    def totais(self, individual: List[int]) -> tuple:
+        """Soma dos componentes de todas as disciplinas (ordem de COMPONENTES_PADRAO)."""
+        componentes = [custos_disciplina(perfis) for perfis in self.perfis(individual)]
+        return tuple(sum(valores) for valores in zip(*componentes)) or (0,) * len(COMPONENTES_PADRAO)
+
+
+# Padrões já construídos, indexados pela identidade das listas da instância
+# (guardadas junto para que seus ids não sejam reutilizados)
+_PATTERN_CACHE: Dict[Tuple[int, int], Tuple[list, dict, DayPatterns]] = {}
+
+
+def day_patterns_for(expanded_disciplines: List[Disciplina], slot_mapping: Dict[int, Slot]) -> DayPatterns:
+    """Retorna os padrões diários de uma instância, construindo-os apenas uma vez."""
+    chave = (id(expanded_disciplines), id(slot_mapping))
+    entry = _PATTERN_CACHE.get(chave)
+    if entry is not None and entry[0] is expanded_disciplines and entry[1] is slot_mapping:
+        return entry[2]
+    
+    padroes = DayPatterns(expanded_disciplines, slot_mapping)
+    if len(_PATTERN_CACHE) >= 8:
+        # Descarta apenas a entrada mais antiga
+        _PATTERN_CACHE.pop(next(iter(_PATTERN_CACHE)))
+    _PATTERN_CACHE[chave] = (expanded_disciplines, slot_mapping, padroes)
+    return padroes
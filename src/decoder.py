@@ -2,7 +2,7 @@
 Funções para decodificar cromossomos em horários legíveis.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Sequence
 from .models import Disciplina, Slot
 
 
@@ -18,7 +18,7 @@ def decode_schedule(
         individual: Cromossomo (lista de slot_ids)
         expanded_disciplines: Lista expandida de disciplinas
         slot_mapping: Mapeamento de slot_id para Slot
-        
+    
     Returns:
         Lista de dicionários contendo informações de cada aula
     """
@@ -28,6 +28,7 @@ def decode_schedule(
         slot = slot_mapping.get(gene)
         if slot:
             schedule.append({
+                'curso': disc.curso,
                 'periodo': disc.periodo,
                 'codigo': disc.codigo,
                 'disciplina': disc.nome,
@@ -37,7 +38,7 @@ def decode_schedule(
                 'fim': slot.fim
             })
     
-    schedule.sort(key=lambda x: (x['periodo'], x['dia'], x['inicio']))
+    schedule.sort(key=lambda x: (x.get('curso', ''), x['periodo'], x['dia'], x['inicio']))
     return schedule
 
 
@@ -64,60 +65,29 @@ def get_fitness_details(
     """
     from .fitness import (
         BASE_SCORE,
-        penalidade_conflito_professor,
-        penalidade_conflito_periodo,
-        penalidade_concentracao,
-        penalidade_lacuna,
-        penalidade_fragmentacao_disciplina,
-        penalidade_pulverizacao_semanal,
-        penalidade_salto_temporal,
-        penalidade_overload_sequencial,
-        penalidade_blocos_incompletos,
-        bonificacao_aulas_sequenciais,
-        count_consecutive_blocks,
-        get_daily_distribution,
-        compute_discipline_daily_spread,
-        compute_temporal_jump_penalty
+        penalidades_conflito,
+        penalidade_lacuna
     )
+    from .day_patterns import day_patterns_for
     
     # ========================================================================
     # CÁLCULO PRÉVIO DE ESTRUTURAS AUXILIARES
     # ========================================================================
-    distribuicao = get_daily_distribution(individual, expanded_disciplines, slot_mapping)
-    blocos_info = count_consecutive_blocks(distribuicao)
-    spread_info = compute_discipline_daily_spread(distribuicao)
-    saltos_info = compute_temporal_jump_penalty(distribuicao)
+    # Componentes por disciplina/dia pela tabela de padrões diários
+    (pen_frag, pen_pulv, pen_salto, pen_conc, pen_overload, pen_incompleto, bonus_seq,
+     total_blocos_ideais, total_blocos_overload,
+     total_aulas_isoladas) = day_patterns_for(expanded_disciplines, slot_mapping).totais(individual)
     
     # ========================================================================
     # CÁLCULO DAS PENALIDADES CRÍTICAS
     # ========================================================================
-    pen_prof = penalidade_conflito_professor(individual, expanded_disciplines, slot_mapping)
-    pen_per = penalidade_conflito_periodo(individual, expanded_disciplines, slot_mapping)
-    
-    # ========================================================================
-    # CÁLCULO DAS PENALIDADES DE QUALIDADE DA GRADE
-    # ========================================================================
-    pen_frag = penalidade_fragmentacao_disciplina(spread_info)
-    pen_pulv = penalidade_pulverizacao_semanal(spread_info)
-    pen_salto = penalidade_salto_temporal(saltos_info)
+    pen_prof, pen_per = penalidades_conflito(individual, expanded_disciplines, slot_mapping)
     
     # ========================================================================
     # CÁLCULO DAS PENALIDADES DE OTIMIZAÇÃO
     # ========================================================================
-    pen_conc = penalidade_concentracao(distribuicao)
     pen_lac = penalidade_lacuna(individual, expanded_disciplines, slot_mapping, disciplinas_unicas)
     
-    # ========================================================================
-    # CÁLCULO DAS PENALIDADES DE OVERLOAD E BLOCOS INCOMPLETOS
-    # ========================================================================
-    pen_overload = penalidade_overload_sequencial(blocos_info)
-    pen_incompleto = penalidade_blocos_incompletos(blocos_info)
-    
-    # ========================================================================
-    # CÁLCULO DAS BONIFICAÇÕES
-    # ========================================================================
-    bonus_seq = bonificacao_aulas_sequenciais(blocos_info)
-    
     # ========================================================================
     # CÁLCULO DO FITNESS TOTAL
     # ========================================================================
@@ -133,16 +103,6 @@ def get_fitness_details(
                - pen_incompleto 
                + bonus_seq)
     
-    # ========================================================================
-    # ANÁLISE DE BLOCOS CONSECUTIVOS (para estatísticas adicionais)
-    # ========================================================================
-    # (blocos_info já calculado anteriormente)
-    
-    # Contar totais de blocos
-    total_blocos_ideais = sum(info['blocos_ideais'] for info in blocos_info.values())
-    total_blocos_overload = sum(info['blocos_overload'] for info in blocos_info.values())
-    total_aulas_isoladas = sum(info['aulas_isoladas'] for info in blocos_info.values())
-    
     # ========================================================================
     # RETORNAR DICIONÁRIO COMPLETO COM TODAS AS MÉTRICAS
     # ========================================================================
@@ -176,3 +136,53 @@ def get_fitness_details(
         'blocos_overload': total_blocos_overload,
         'aulas_isoladas': total_aulas_isoladas
     }
+
+
+def detalhes_do_vetor(vetor: Sequence[float]) -> Dict:
+    """
+    Mesmo dicionário de get_fitness_details, a partir de um vetor de
+    características já calculado (vetor_caracteristicas em fitness.py).
+    
+    Evita reavaliar o horário quando o vetor já existe (arquivo de elite de
+    uma execução). Como em get_fitness_details, o campo 'fitness' não inclui
+    a sobrecarga diária.
+    """
+    from .fitness import CARACTERISTICAS, RAZOES, PESOS_PADRAO, BASE_SCORE
+    
+    n = len(CARACTERISTICAS)
+    contagens = {nome: int(valor) for (nome, _, _), valor in zip(CARACTERISTICAS, vetor)}
+    pesos = {nome: PESOS_PADRAO[peso] for nome, peso, _ in CARACTERISTICAS}
+    
+    def ponderada(nome: str) -> int:
+        return contagens[nome] * pesos[nome]
+    
+    # Razões por disciplina: cada uma subtrai int(razão × peso)
+    num_disciplinas = (len(vetor) - n) // len(RAZOES)
+    razoes = {}
+    for k, (nome, peso) in enumerate(RAZOES):
+        inicio = n + k * num_disciplinas
+        razoes[nome] = sum(int(razao * PESOS_PADRAO[peso])
+                           for razao in vetor[inicio:inicio + num_disciplinas] if razao > 0)
+    
+    detalhes = {
+        'fitness': 0,
+        'base_score': BASE_SCORE,
+        'penalidade_professor': ponderada('conflitos_professor'),
+        'penalidade_periodo': ponderada('conflitos_periodo'),
+        'penalidade_fragmentacao': razoes['fragmentacao'],
+        'penalidade_pulverizacao': razoes['pulverizacao'],
+        'penalidade_salto_temporal': ponderada('saltos_temporais'),
+        'penalidade_concentracao': ponderada('excesso_concentracao'),
+        'penalidade_lacuna': ponderada('lacunas'),
+        'penalidade_overload': ponderada('blocos_overload'),
+        'penalidade_blocos_incompletos': ponderada('aulas_isoladas'),
+        'bonificacao_sequencial': ponderada('blocos_ideais'),
+        'blocos_ideais': contagens['blocos_ideais'],
+        'blocos_overload': contagens['blocos_overload'],
+        'aulas_isoladas': contagens['aulas_isoladas']
+    }
+    detalhes['fitness'] = (BASE_SCORE
+                           - sum(valor for chave, valor in detalhes.items()
+                                 if chave.startswith('penalidade_'))
+                           + detalhes['bonificacao_sequencial'])
+    return detalhes
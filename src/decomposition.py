@@ -0,0 +1,295 @@
+"""
+Decomposição por período, acoplada apenas pelos professores compartilhados.
+
+Conflitos de período só ocorrem dentro de um período, e conflitos de professor
+entre períodos só ocorrem pelos professores que lecionam em mais de um deles
+(ex.: "Professor Substituto 1"). As demais penalidades são calculadas por
+período. O problema se decompõe, portanto, em um subproblema por período,
+ligados pelo grafo de acoplamento: dois períodos são vizinhos se compartilham
+um professor.
+
+1. Fase paralela: cada período é otimizado por um AG pequeno e independente
+   (em processos separados), com a representação por permutação
+   (permutation_encoding.py), que não gera conflitos dentro do período.
+2. Coordenação: os períodos com conflitos de professor compartilhado são
+   resolvidos de novo, com os horários dos professores nos demais períodos
+   fixos (o decodificador os evita). Períodos vizinhos nunca são resolvidos
+   ao mesmo tempo: cada rodada percorre as classes de uma coloração do grafo,
+   e os períodos de uma mesma classe são resolvidos em paralelo. Uma nova
+   solução de período só é aceita se reduz os conflitos ou, sem piorá-los,
+   melhora o fitness do horário completo.
+
+Os períodos são as turmas (curso, período) de Disciplina.turma. O custo cresce
+com o número de turmas, não com o tamanho do cromossomo completo: cursos
+adicionais acrescentam subproblemas independentes, acoplados apenas onde há
+professores em comum.
+"""
+
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from .bitset import bitsets_for
+from .fitness import evaluate_fitness
+from .models import Disciplina, Slot
+from .config import (
+    DECOMPOSICAO_POPULACAO,
+    DECOMPOSICAO_GERACOES,
+    DECOMPOSICAO_RODADAS,
+    DECOMPOSICAO_WORKERS,
+    RANDOM_SEED
+)
+
+# Verificar se rich está disponível
+try:
+    from rich.console import Console
+    console = Console()
+    HAS_RICH = True
+except ImportError:
+    HAS_RICH = False
+
+
+@dataclass
+class ResultadoDecomposicao:
+    """Resultado da decomposição por período."""
+    chromosome: List[int]
+    fitness: float
+    conflitos_iniciais: int              # pares em conflito de professor após a fase paralela
+    conflitos: int                       # pares em conflito de professor ao final
+    rodadas: int                         # rodadas de coordenação executadas
+    tempo: float                         # segundos
+    historico: List[Tuple[float, float]] = field(default_factory=list)  # (segundos, fitness) a cada fase
+
+
+def genes_por_periodo(expanded_disciplines: List[Disciplina]) -> Dict[object, List[int]]:
+    """Índices dos genes de cada período, na ordem do cromossomo."""
+    genes: Dict[object, List[int]] = {}
+    for i, disc in enumerate(expanded_disciplines):
+        genes.setdefault(disc.turma, []).append(i)
+    return genes
+
+
+def professores_compartilhados(expanded_disciplines: List[Disciplina]) -> Dict[str, Set[object]]:
+    """Professores que lecionam em mais de um período e os seus períodos."""
+    periodos: Dict[str, Set[object]] = {}
+    for disc in expanded_disciplines:
+        periodos.setdefault(disc.professor, set()).add(disc.turma)
+    return {prof: pers for prof, pers in periodos.items() if len(pers) > 1}
+
+
+def grafo_acoplamento(expanded_disciplines: List[Disciplina]) -> Dict[object, Set[object]]:
+    """Grafo dos períodos: vizinhos compartilham ao menos um professor."""
+    grafo: Dict[object, Set[object]] = {disc.turma: set() for disc in expanded_disciplines}
+    for periodos in professores_compartilhados(expanded_disciplines).values():
+        for periodo in periodos:
+            grafo[periodo] |= periodos - {periodo}
+    return grafo
+
+
+def colorir(grafo: Dict[object, Set[object]], vertices: Set[object]) -> List[List[object]]:
+    """
+    Coloração gulosa dos vértices (maior grau primeiro).
+    
+    Returns:
+        Classes de vértices sem vizinhos entre si
+    """
+    cor: Dict[object, int] = {}
+    for v in sorted(vertices, key=lambda v: (-len(grafo[v]), str(v))):
+        usadas = {cor[u] for u in grafo[v] if u in cor}
+        cor[v] = next(c for c in range(len(vertices)) if c not in usadas)
+    classes: List[List[object]] = [[] for _ in range(max(cor.values(), default=-1) + 1)]
+    for v, c in cor.items():
+        classes[c].append(v)
+    return classes
+
+
+def ocupacao_professores(
+    cromossomo: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    professores: Set[str],
+    excluir_periodo: object = None
+) -> Dict[str, int]:
+    """Máscaras de horários ocupados (bitset.py) dos professores, fora de um período."""
+    bit_slot = bitsets_for(expanded_disciplines, slot_mapping).bit_slot
+    ocupacao: Dict[str, int] = {}
+    for gene, disc in zip(cromossomo, expanded_disciplines):
+        if disc.professor in professores and disc.turma != excluir_periodo:
+            ocupacao[disc.professor] = ocupacao.get(disc.professor, 0) | bit_slot.get(gene, 0)
+    return ocupacao
+
+
+def periodos_em_conflito(
+    cromossomo: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    compartilhados: Dict[str, Set[object]]
+) -> Set[object]:
+    """Períodos com aulas de um professor compartilhado em choque com outro período."""
+    bit_slot = bitsets_for(expanded_disciplines, slot_mapping).bit_slot
+    mascaras: Dict[Tuple[str, object], int] = {}
+    for gene, disc in zip(cromossomo, expanded_disciplines):
+        if disc.professor in compartilhados:
+            chave = (disc.professor, disc.turma)
+            mascaras[chave] = mascaras.get(chave, 0) | bit_slot.get(gene, 0)
+    
+    em_conflito = set()
+    for prof, periodos in compartilhados.items():
+        for periodo in periodos:
+            outros = 0
+            for outro in periodos - {periodo}:
+                outros |= mascaras.get((prof, outro), 0)
+            if mascaras.get((prof, periodo), 0) & outros:
+                em_conflito.add(periodo)
+    return em_conflito
+
+
+def _resolver_periodo(tarefa: tuple) -> Tuple[object, List[int]]:
+    """Otimiza um período (executado nos processos da fase paralela e da coordenação)."""
+    from .genetic_algorithm import setup_deap_toolbox, run_genetic_algorithm
+    
+    periodo, expanded, slot_mapping, disciplinas, ocupacao, populacao, geracoes, seed = tarefa
+    random.seed(seed)
+    toolbox = setup_deap_toolbox(
+        chromosome_size=len(expanded),
+        valid_slot_ids=list(slot_mapping),
+        expanded_disciplines=expanded,
+        slot_mapping=slot_mapping,
+        disciplinas_unicas=disciplinas,
+        limite_critico=None,
+        canonico=False,
+        representacao="permutacao",
+        ocupacao_professor=ocupacao
+    )
+    tamanho = len(toolbox.individual())
+    if tamanho < 2:
+        return periodo, toolbox.decodificar(list(range(tamanho)))
+    _, _, _, top_individuals, _, _ = run_genetic_algorithm(
+        toolbox,
+        population_size=populacao,
+        num_generations=geracoes,
+        num_workers=1,
+        verbose=False
+    )
+    return periodo, top_individuals[0]
+
+
+def _mensagem(texto: str) -> None:
+    if HAS_RICH:
+        console.print(f"[cyan]{texto}[/cyan]")
+    else:
+        print(texto)
+
+
+def resolver_decomposto(
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    disciplinas_unicas: List[Disciplina],
+    populacao: int = DECOMPOSICAO_POPULACAO,
+    geracoes: int = DECOMPOSICAO_GERACOES,
+    rodadas: int = DECOMPOSICAO_RODADAS,
+    num_workers: Optional[int] = DECOMPOSICAO_WORKERS,
+    seed: int = RANDOM_SEED,
+    verbose: bool = True
+) -> ResultadoDecomposicao:
+    """
+    Resolve a instância por períodos em paralelo e coordena os professores compartilhados.
+    
+    Args:
+        expanded_disciplines: Lista expandida de disciplinas
+        slot_mapping: Mapeamento de slot_id para Slot
+        disciplinas_unicas: Lista de disciplinas
+        populacao: População do AG de cada período
+        geracoes: Gerações de cada AG (fase paralela e cada nova resolução)
+        rodadas: Rodadas máximas de coordenação
+        num_workers: Períodos resolvidos em paralelo (None: todos os núcleos;
+            1: no próprio processo, sem pool)
+        seed: Seed base; cada resolução usa uma seed derivada dela
+    
+    Returns:
+        ResultadoDecomposicao com o cromossomo completo (slot_ids)
+    """
+    inicio = time.time()
+    genes = genes_por_periodo(expanded_disciplines)
+    compartilhados = professores_compartilhados(expanded_disciplines)
+    grafo = grafo_acoplamento(expanded_disciplines)
+    ordem = {periodo: k for k, periodo in enumerate(genes)}
+    subproblemas = {
+        periodo: (
+            [expanded_disciplines[i] for i in indices],
+            [d for d in disciplinas_unicas if d.turma == periodo]
+        )
+        for periodo, indices in genes.items()
+    }
+    
+    def tarefa(periodo, ocupacao, rodada):
+        expanded, disciplinas = subproblemas[periodo]
+        return (periodo, expanded, slot_mapping, disciplinas, ocupacao,
+                populacao, geracoes, seed + 1000 * rodada + ordem[periodo])
+    
+    def avaliar(cromossomo) -> Tuple[int, float]:
+        conflitos = bitsets_for(expanded_disciplines, slot_mapping).conflitos(cromossomo)[0]
+        return conflitos, evaluate_fitness(cromossomo, expanded_disciplines, slot_mapping, disciplinas_unicas)[0]
+    
+    processos = num_workers or multiprocessing.cpu_count()
+    pool = multiprocessing.Pool(min(processos, len(genes))) if processos > 1 and len(genes) > 1 else None
+    mapear = pool.map if pool is not None else map
+    cromossomo = [0] * len(expanded_disciplines)
+    historico = []
+    
+    try:
+        if verbose:
+            arestas = sum(len(v) for v in grafo.values()) // 2
+            _mensagem(f"Decomposição: {len(genes)} períodos, {len(compartilhados)} professores "
+                      f"compartilhados, {arestas} arestas de acoplamento")
+        
+        # 1. Fase paralela: períodos independentes
+        for periodo, sub in mapear(_resolver_periodo, [tarefa(p, None, 0) for p in genes]):
+            for i, slot in zip(genes[periodo], sub):
+                cromossomo[i] = slot
+        conflitos, fitness = avaliar(cromossomo)
+        conflitos_iniciais = conflitos
+        historico.append((time.time() - inicio, fitness))
+        if verbose:
+            _mensagem(f"Fase paralela: fitness {fitness:.0f}, {conflitos} conflitos de professor compartilhado")
+        
+        # 2. Coordenação: classes de períodos não vizinhos, resolvidas em paralelo
+        rodada = 0
+        while rodada < rodadas:
+            em_conflito = periodos_em_conflito(cromossomo, expanded_disciplines, slot_mapping, compartilhados)
+            if not em_conflito:
+                break
+            rodada += 1
+            for classe in colorir(grafo, em_conflito):
+                tarefas = [
+                    tarefa(p, ocupacao_professores(cromossomo, expanded_disciplines, slot_mapping,
+                                                   set(compartilhados), excluir_periodo=p), rodada)
+                    for p in classe
+                ]
+                for periodo, sub in mapear(_resolver_periodo, tarefas):
+                    candidato = list(cromossomo)
+                    for i, slot in zip(genes[periodo], sub):
+                        candidato[i] = slot
+                    novo_conflitos, novo_fitness = avaliar(candidato)
+                    if (novo_conflitos, -novo_fitness) < (conflitos, -fitness):
+                        cromossomo, conflitos, fitness = candidato, novo_conflitos, novo_fitness
+            historico.append((time.time() - inicio, fitness))
+            if verbose:
+                _mensagem(f"Coordenação, rodada {rodada}: fitness {fitness:.0f}, {conflitos} conflitos "
+                          f"({len(em_conflito)} períodos resolvidos de novo)")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    
+    return ResultadoDecomposicao(
+        chromosome=cromossomo,
+        fitness=fitness,
+        conflitos_iniciais=conflitos_iniciais,
+        conflitos=conflitos,
+        rodadas=rodada,
+        tempo=time.time() - inicio,
+        historico=historico,
+    )
@@ -0,0 +1,227 @@
+"""
+Avaliação incremental (delta) do fitness.
+
+Mantém o estado de um cromossomo (ocupação em bitsets de cada disciplina por
+professor e por período, ocupação por período/dia e o custo de cada
+disciplina, pela tabela de padrões diários) e atualiza o fitness a cada
+movimento de um gene ou troca de dois genes, recalculando apenas as chaves
+afetadas. As penalidades são as mesmas de fitness.py: o resultado é sempre
+igual a evaluate_fitness do cromossomo atual.
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from .models import Disciplina, Slot
+from .time_grid import time_grid_for
+from .bitset import bitsets_for
+from .day_patterns import day_patterns_for
+from .fitness import custo_lacuna, custo_sobrecarga
+from .config import BASE_SCORE, PESO_CONFLITO_PROFESSOR, PESO_CONFLITO_PERIODO, PESO_DESVIO
+
+
+# Ordem dos componentes por disciplina em DeltaEvaluator.componentes_codigo
+COMPONENTES_DISCIPLINA = (
+    "penalidade_fragmentacao",
+    "penalidade_pulverizacao",
+    "penalidade_salto_temporal",
+    "penalidade_concentracao",
+    "penalidade_overload",
+    "penalidade_blocos_incompletos",
+    "bonificacao_sequencial",
+    "penalidade_desvio",
+    "blocos_ideais",
+    "blocos_overload",
+    "aulas_isoladas",
+)
+
+
+class DeltaEvaluator:
+    """
+    Fitness de um cromossomo mantido incrementalmente.
+
+    Uso:
+        delta = DeltaEvaluator(individual, expanded_disciplines, slot_mapping)
+        novo = delta.move(3, 17)     # gene 3 para o slot 17; retorna o novo fitness
+        delta.move(3, antigo)        # desfaz
+        delta.swap(3, 40)            # troca os slots dos genes 3 e 40
+
+    Com referencia e peso_desvio (replanejamento), o fitness inclui a
+    penalidade_desvio de fitness.py.
+    """
+
+    def __init__(
+        self,
+        individual: List[int],
+        expanded_disciplines: List[Disciplina],
+        slot_mapping: Dict[int, Slot],
+        referencia: Optional[List[Optional[int]]] = None,
+        peso_desvio: int = PESO_DESVIO
+    ):
+        grade = time_grid_for(slot_mapping)
+        self.genes = list(individual)
+        self._disc = expanded_disciplines
+        self._slot_mapping = slot_mapping
+        self._slot_dia = grade.slot_dia
+        self._slot_hora = grade.slot_hora_idx
+        self._padroes = day_patterns_for(expanded_disciplines, slot_mapping)
+
+        self._genes_codigo: Dict[str, List[int]] = defaultdict(list)
+        for i, disc in enumerate(expanded_disciplines):
+            self._genes_codigo[disc.codigo].append(i)
+
+        # código -> slots de referência (apenas com penalidade de desvio)
+        self._peso_desvio = peso_desvio if referencia is not None else 0
+        self._referencia: Dict[str, Counter] = defaultdict(Counter)
+        if self._peso_desvio:
+            for i, ref in enumerate(referencia):
+                if ref is not None:
+                    self._referencia[expanded_disciplines[i].codigo][ref] += 1
+
+        # Unidades (professor|período, código) de bitsets.py: máscara de ocupação,
+        # aulas por bit e as demais unidades do mesmo grupo
+        bitsets = bitsets_for(expanded_disciplines, slot_mapping)
+        self._bit_slot = bitsets.bit_slot
+        self._unidade_professor = bitsets.unidade_professor
+        self._unidade_periodo = bitsets.unidade_periodo
+        self._mascara_professor = [0] * bitsets.num_unidades_professor
+        self._mascara_periodo = [0] * bitsets.num_unidades_periodo
+        self._aulas_professor = [Counter() for _ in range(bitsets.num_unidades_professor)]
+        self._aulas_periodo = [Counter() for _ in range(bitsets.num_unidades_periodo)]
+        self._vizinhos_professor = self._vizinhos(bitsets.grupos_professor, bitsets.num_unidades_professor)
+        self._vizinhos_periodo = self._vizinhos(bitsets.grupos_periodo, bitsets.num_unidades_periodo)
+        # (período, dia) -> índices de horário ocupados / número de aulas
+        self._ocupacao: Dict[tuple, Counter] = defaultdict(Counter)
+        self._aulas: Counter = Counter()
+        # código -> penalidades de distribuição, blocos e saltos (menos a bonificação)
+        self._custo_codigo: Dict[str, int] = {}
+        # código -> componentes desse custo (ver COMPONENTES_DISCIPLINA)
+        self.componentes_codigo: Dict[str, tuple] = {}
+        # Totais das penalidades que dependem de vários códigos
+        self.pen_professor = 0
+        self.pen_periodo = 0
+        self.pen_sobrecarga = 0
+        self.pen_lacuna = 0
+
+        self.score = BASE_SCORE
+        for i in range(len(self.genes)):
+            self._alterar_gene(i, +1)
+        for codigo in self._genes_codigo:
+            self._atualizar_codigo(codigo)
+
+    @property
+    def fitness(self) -> tuple:
+        """Fitness no formato do DEAP (igual a evaluate_fitness)."""
+        return (self.score,)
+
+    def _componentes_disciplina(self, codigo: str) -> tuple:
+        """Penalidades, bonificação e blocos que dependem apenas das aulas de uma disciplina."""
+        slots = [self.genes[i] for i in self._genes_codigo[codigo]]
+        padrao = self._padroes.componentes_disciplina(slots)
+
+        desvio = 0
+        if self._peso_desvio and codigo in self._referencia:
+            desvio = sum((self._referencia[codigo] - Counter(slots)).values()) * self._peso_desvio
+
+        # Ordem de COMPONENTES_DISCIPLINA: a de COMPONENTES_PADRAO com o desvio antes dos blocos
+        return padrao[:7] + (desvio,) + padrao[7:]
+
+    def _atualizar_codigo(self, codigo: str) -> None:
+        componentes = self._componentes_disciplina(codigo)
+        frag, pulv, salto, conc, overload, incompletos, bonus, desvio = componentes[:8]
+        novo = frag + pulv + salto + conc + overload + incompletos - bonus + desvio
+        self.score -= novo - self._custo_codigo.get(codigo, 0)
+        self._custo_codigo[codigo] = novo
+        self.componentes_codigo[codigo] = componentes
+
+    @staticmethod
+    def _vizinhos(grupos: List[List[int]], num_unidades: int) -> List[List[int]]:
+        """Para cada unidade, as outras unidades do seu grupo."""
+        vizinhos: List[List[int]] = [[] for _ in range(num_unidades)]
+        for grupo in grupos:
+            for u in grupo:
+                vizinhos[u] = [v for v in grupo if v != u]
+        return vizinhos
+
+    @staticmethod
+    def _alterar_bit(mascaras: List[int], aulas: List[Counter], vizinhos: List[List[int]],
+                     u: int, bit: int, sinal: int) -> int:
+        """
+        Inclui (+1) ou retira (-1) uma aula da unidade u no bit e retorna a
+        variação no número de pares em conflito: ao ganhar (ou perder) o bit, a
+        unidade forma (ou desfaz) um par com cada outra unidade que o ocupa.
+        """
+        contador = aulas[u]
+        contador[bit] += sinal
+        if contador[bit] == 0:
+            del contador[bit]
+        elif sinal < 0 or contador[bit] > 1:
+            return 0
+        mascaras[u] ^= bit
+        pares = sum(1 for v in vizinhos[u] if mascaras[v] & bit)
+        return pares if sinal > 0 else -pares
+
+    @staticmethod
+    def _contar(contador: Counter, chave, sinal: int) -> None:
+        contador[chave] += sinal
+        if contador[chave] == 0:
+            del contador[chave]
+
+    def _alterar_gene(self, i: int, sinal: int) -> None:
+        """Inclui (+1) ou retira (-1) a aula do gene i dos contadores, ajustando o fitness."""
+        gene = self.genes[i]
+        disc = self._disc[i]
+        slot = self._slot_mapping.get(gene)
+        if not slot:
+            return
+
+        bit = self._bit_slot[gene]
+        variacao = self._alterar_bit(self._mascara_professor, self._aulas_professor,
+                                     self._vizinhos_professor, self._unidade_professor[i],
+                                     bit, sinal) * PESO_CONFLITO_PROFESSOR
+        self.pen_professor += variacao
+        self.score -= variacao
+
+        variacao = self._alterar_bit(self._mascara_periodo, self._aulas_periodo,
+                                     self._vizinhos_periodo, self._unidade_periodo[i],
+                                     bit, sinal) * PESO_CONFLITO_PERIODO
+        self.pen_periodo += variacao
+        self.score -= variacao
+
+        periodo_dia = (disc.turma, slot.dia)
+        antes = custo_sobrecarga(self._aulas[periodo_dia])
+        self._aulas[periodo_dia] += sinal
+        variacao = custo_sobrecarga(self._aulas[periodo_dia]) - antes
+        self.pen_sobrecarga += variacao
+        self.score -= variacao
+
+        if gene in self._slot_hora:
+            ocupacao = self._ocupacao[(disc.turma, self._slot_dia[gene])]
+            antes = custo_lacuna(ocupacao.keys())
+            self._contar(ocupacao, self._slot_hora[gene], sinal)
+            variacao = custo_lacuna(ocupacao.keys()) - antes
+            self.pen_lacuna += variacao
+            self.score -= variacao
+
+    def move(self, i: int, slot_id: int) -> int:
+        """Move o gene i para slot_id e retorna o novo fitness."""
+        if self.genes[i] == slot_id:
+            return self.score
+        self._alterar_gene(i, -1)
+        self.genes[i] = slot_id
+        self._alterar_gene(i, +1)
+        self._atualizar_codigo(self._disc[i].codigo)
+        return self.score
+
+    def swap(self, i: int, j: int) -> int:
+        """Troca os slots dos genes i e j e retorna o novo fitness."""
+        if self.genes[i] == self.genes[j]:
+            return self.score
+        self._alterar_gene(i, -1)
+        self._alterar_gene(j, -1)
+        self.genes[i], self.genes[j] = self.genes[j], self.genes[i]
+        self._alterar_gene(i, +1)
+        self._alterar_gene(j, +1)
+        for codigo in {self._disc[i].codigo, self._disc[j].codigo}:
+            self._atualizar_codigo(codigo)
+        return self.score
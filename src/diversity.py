@@ -0,0 +1,98 @@
+"""
+Monitor de diversidade da população e estratégias de reinjeção.
+
+A diversidade é medida como a discordância média entre pares de indivíduos,
+gene a gene: a fração de pares (i, j) da população cujos slots diferem em cada
+posição do cromossomo, média sobre todas as posições. Ela é calculada pela
+contagem de valores de cada coluna da matriz de genomas (O(n·L)), sem
+comparar os pares explicitamente.
+
+Quando a diversidade cai abaixo do limiar, uma das ações é aplicada à
+população (o arquivo de elite não é alterado):
+
+- reinicio_parcial: substitui a maior parte da população por indivíduos novos
+- hipermutacao: muta parte da população com probabilidade por gene elevada
+- imigrantes: substitui os piores indivíduos por indivíduos aleatórios
+"""
+
+import random
+from typing import List
+
+import numpy as np
+from deap import base
+
+ACOES_DIVERSIDADE = ("reinicio_parcial", "hipermutacao", "imigrantes")
+
+
+def diversidade_genotipica(population: List) -> float:
+    """
+    Discordância média entre pares de indivíduos, gene a gene (0 a 1).
+    
+    0 indica uma população de cópias; 1 indica que nenhum par compartilha
+    o mesmo slot em nenhuma posição.
+    """
+    n = len(population)
+    if n < 2:
+        return 0.0
+    
+    genomas = np.asarray(population, dtype=np.int64)
+    tamanho = genomas.shape[1]
+    # Desloca cada coluna para uma faixa própria de valores e conta todas de uma vez
+    valores = genomas - genomas.min()
+    largura = int(valores.max()) + 1
+    codigos = valores + np.arange(tamanho, dtype=np.int64) * largura
+    contagens = np.bincount(codigos.ravel(), minlength=tamanho * largura)
+    
+    pares_iguais = float(np.sum(contagens * (contagens - 1))) / 2
+    total_pares = tamanho * n * (n - 1) / 2
+    return 1.0 - pares_iguais / total_pares
+
+
+def injetar_diversidade(
+    toolbox: base.Toolbox,
+    population: List,
+    acao: str,
+    fracao: float,
+    indpb: float
+) -> List:
+    """
+    Aplica a ação de diversidade à população (in-place).
+    
+    O melhor indivíduo da população nunca é substituído nem mutado.
+    
+    Args:
+        toolbox: Toolbox com individual, mutate e clone registrados
+        population: População atual (avaliada)
+        acao: Uma de ACOES_DIVERSIDADE
+        fracao: Fração da população afetada (reinício e imigrantes substituem
+            os piores; hipermutação muta indivíduos sorteados)
+        indpb: Probabilidade de mutação por gene na hipermutação
+    
+    Returns:
+        Indivíduos novos ou alterados (sem fitness válido)
+    """
+    if acao not in ACOES_DIVERSIDADE:
+        raise ValueError(f"Ação de diversidade desconhecida: {acao!r}. Opções: {ACOES_DIVERSIDADE}")
+    
+    population.sort(key=lambda ind: ind.fitness, reverse=True)
+    quantidade = min(len(population) - 1, max(1, round(fracao * len(population))))
+    
+    if acao == "hipermutacao":
+        # Outras representações (blocos, permutação) registram a própria hipermutação
+        hipermutar = getattr(toolbox, "hipermutar", None)
+        alterados = random.sample(population[1:], quantidade)
+        for ind in alterados:
+            if hipermutar is not None:
+                hipermutar(ind, indpb=indpb)
+            else:
+                for i in range(len(ind)):
+                    if random.random() < indpb:
+                        ind[i] = toolbox.attr_slot()
+            del ind.fitness.values
+        return alterados
+    
+    # reinicio_parcial e imigrantes substituem os piores por indivíduos aleatórios
+    # (diferem apenas na fração configurada)
+    novos = [toolbox.individual() for _ in range(quantidade)]
+    population[len(population) - quantidade:] = novos
+    return novos
@@ -0,0 +1,147 @@
+"""
+Exportação paralela dos melhores horários.
+
+Cada horário do top-k é decodificado, detalhado (breakdown do fitness) e
+gravado em JSON e HTML por um worker; o gráfico de evolução é renderizado em
+paralelo por outro. O contexto da instância é enviado a cada worker uma única
+vez, e breakdowns já calculados são reaproveitados em vez de recalculados.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import Disciplina, Slot
+from .time_grid import TimeGrid
+from .config import EXPORT_WORKERS
+
+# Contexto da instância em cada worker (definido por _init_worker)
+_CONTEXTO: Dict[str, Any] = {}
+
+
+def _init_worker(contexto: Dict[str, Any]) -> None:
+    """Recebe o contexto da instância uma única vez por worker."""
+    global _CONTEXTO
+    _CONTEXTO = contexto
+
+
+def _export_rank(
+    rank: int,
+    individual: List[int],
+    fitness: float,
+    fitness_info: Optional[Dict]
+) -> Tuple[int, List[Dict], Dict]:
+    """Decodifica e grava o horário de uma posição do ranking (JSON e HTML)."""
+    from .decoder import decode_schedule, get_fitness_details
+    from .output_manager import OutputManager
+    from .visualization import export_html
+    
+    ctx = _CONTEXTO
+    run_dir = ctx["run_dir"]
+    schedule = decode_schedule(individual, ctx["expanded_disciplines"], ctx["slot_mapping"])
+    if fitness_info is None:
+        fitness_info = get_fitness_details(
+            individual,
+            ctx["expanded_disciplines"],
+            ctx["slot_mapping"],
+            ctx["disciplinas_unicas"]
+        )
+    
+    OutputManager(run_dir=run_dir).save_schedule_details(
+        rank=rank,
+        individual=list(individual),
+        fitness=fitness,
+        schedule=schedule,
+        fitness_info=fitness_info
+    )
+    export_html(schedule, output_path=run_dir / f"horario_rank_{rank}.html",
+                grade=ctx["grade"], verbose=False)
+    if rank == 1:
+        export_html(schedule, output_path=run_dir / "horario_final.html",
+                    grade=ctx["grade"], verbose=False)
+    
+    return rank, schedule, fitness_info
+
+
+def _export_plot(run_dir: Path, best_fitness_history: List[float], avg_fitness_history: List[float]) -> Path:
+    """Renderiza o gráfico de evolução do fitness."""
+    from .visualization import plot_fitness_evolution
+    
+    output_path = run_dir / "fitness_evolution.png"
+    plot_fitness_evolution(best_fitness_history, avg_fitness_history,
+                           output_path=output_path, verbose=False)
+    return output_path
+
+
+def export_top_k(
+    run_dir: Path,
+    top_individuals: List[List[int]],
+    top_fitnesses: List[float],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    disciplinas_unicas: List[Disciplina],
+    grade: Optional[TimeGrid] = None,
+    best_fitness_history: Optional[List[float]] = None,
+    avg_fitness_history: Optional[List[float]] = None,
+    fitness_details: Optional[List[Optional[Dict]]] = None,
+    max_workers: Optional[int] = EXPORT_WORKERS
+) -> List[Tuple[List[Dict], Dict]]:
+    """
+    Exporta HTML, JSON e gráfico dos top-k horários em um pool de workers.
+    
+    Args:
+        run_dir: Diretório da execução (ver OutputManager)
+        top_individuals: Melhores indivíduos, em ordem de ranking
+        top_fitnesses: Fitness de cada indivíduo
+        expanded_disciplines: Lista expandida de disciplinas
+        slot_mapping: Mapeamento de slot_id para Slot
+        disciplinas_unicas: Lista de disciplinas únicas
+        grade: Grade de tempo usada na ordem de dias/horários do HTML
+        best_fitness_history: Histórico do melhor fitness (None: sem gráfico)
+        avg_fitness_history: Histórico do fitness médio
+        fitness_details: Breakdowns já calculados, alinhados com top_individuals
+            (posições None são calculadas pelos workers)
+        max_workers: Número de workers (None: número de CPUs; 1: sem pool)
+    
+    Returns:
+        Lista com (horário decodificado, breakdown do fitness) de cada posição
+    """
+    run_dir = Path(run_dir)
+    if fitness_details is None:
+        fitness_details = [None] * len(top_individuals)
+    
+    contexto = {
+        "run_dir": run_dir,
+        "expanded_disciplines": expanded_disciplines,
+        "slot_mapping": slot_mapping,
+        "disciplinas_unicas": disciplinas_unicas,
+        "grade": grade,
+    }
+    tarefas = [
+        (rank, list(ind), float(fit), info)
+        for rank, (ind, fit, info) in enumerate(zip(top_individuals, top_fitnesses, fitness_details), 1)
+    ]
+    com_grafico = best_fitness_history is not None
+    
+    num_tarefas = len(tarefas) + int(com_grafico)
+    workers = min(max_workers or os.cpu_count() or 1, num_tarefas)
+    
+    if workers <= 1:
+        _init_worker(contexto)
+        resultados = [_export_rank(*t) for t in tarefas]
+        if com_grafico:
+            _export_plot(run_dir, best_fitness_history, avg_fitness_history)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(contexto,)) as executor:
+            # O gráfico é a tarefa mais lenta: é enviado primeiro
+            grafico = (executor.submit(_export_plot, run_dir, best_fitness_history, avg_fitness_history)
+                       if com_grafico else None)
+            futuros = [executor.submit(_export_rank, *t) for t in tarefas]
+            resultados = [f.result() for f in futuros]
+            if grafico is not None:
+                grafico.result()
+    
+    resultados.sort(key=lambda r: r[0])
+    return [(schedule, info) for _, schedule, info in resultados]
@@ -3,9 +3,12 @@ Funções de penalidade, bonificação e cálculo de fitness.
 """
 
 from typing import List, Dict, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from .models import Disciplina, Slot
+from .time_grid import time_grid_for
+from .bitset import bitsets_for
+from .day_patterns import day_patterns_for
 from .config import (
     BASE_SCORE,
     PESO_CONFLITO_PROFESSOR,
@@ -22,42 +25,101 @@ from .config import (
     MIN_AULAS_SEQUENCIAIS_IDEAL,
     MAX_AULAS_SEQUENCIAIS_IDEAL,
     THRESHOLD_SALTO_TEMPORAL,
-    MAX_AULAS_POR_DIA
+    MAX_AULAS_POR_DIA,
+    PESO_DESVIO,
+    LIMITE_PENALIDADE_CRITICA
 )
 
 
-def penalidade_conflito_professor(
+def contar_lacunas(indices) -> int:
+    """Número de horários vagos entre os índices de horário ocupados em um dia."""
+    if len(indices) <= 1:
+        return 0
+    indices_sorted = sorted(indices)
+    lacunas = 0
+    for i in range(len(indices_sorted) - 1):
+        gap = indices_sorted[i + 1] - indices_sorted[i] - 1
+        if gap > 0:
+            lacunas += gap
+    return lacunas
+
+
+def custo_lacuna(indices) -> int:
+    """Penalidade dos buracos entre os índices de horário ocupados em um dia."""
+    return contar_lacunas(indices) * PESO_LACUNA
+
+
+def excesso_aulas(num_aulas: int) -> int:
+    """Aulas de um período além de MAX_AULAS_POR_DIA em um dia."""
+    return max(0, num_aulas - MAX_AULAS_POR_DIA)
+
+
+def custo_sobrecarga(num_aulas: int) -> int:
+    """Penalidade de um dia com num_aulas aulas de um mesmo período."""
+    # Penalizar proporcionalmente ao excesso
+    return excesso_aulas(num_aulas) * PESO_SOBRECARGA_DIARIA
+
+
+def contar_ocupacao_periodos(
     individual: List[int],
     expanded_disciplines: List[Disciplina],
     slot_mapping: Dict[int, Slot]
-) -> int:
+) -> tuple:
     """
-    Penaliza se um professor tem aulas simultâneas.
+    Lacunas e excesso de aulas por dia dos períodos, em um único percurso.
     
-    ATENÇÃO: Esta é uma restrição CRÍTICA e INADMISSÍVEL.
-    Um professor não pode ministrar duas aulas diferentes ao mesmo tempo.
+    Returns:
+        Tupla (horários vagos entre aulas, aulas além de MAX_AULAS_POR_DIA),
+        somados sobre todos os (período, dia)
     """
-    # Mapeia: (professor, dia, inicio, fim) -> lista de disciplinas
-    professor_slot_disciplinas = defaultdict(list)
+    grade = time_grid_for(slot_mapping)
+    slot_dia = grade.slot_dia
+    slot_hora = grade.slot_hora_idx
     
+    # Mapeia: (turma, dia) -> índices de horário ocupados / contagem de aulas
+    ocupados = defaultdict(set)
+    aulas = defaultdict(int)
     for gene, disc in zip(individual, expanded_disciplines):
-        slot = slot_mapping.get(gene)
-        if slot:
-            key = (disc.professor, slot.dia, slot.inicio, slot.fim)
-            professor_slot_disciplinas[key].append(disc.codigo)
+        if gene in slot_hora:
+            chave = (disc.turma, slot_dia[gene])
+            ocupados[chave].add(slot_hora[gene])
+            aulas[chave] += 1
     
-    penalty = 0
+    lacunas = sum(contar_lacunas(indices) for indices in ocupados.values())
+    excesso = sum(excesso_aulas(num_aulas) for num_aulas in aulas.values())
+    return lacunas, excesso
+
+
+def penalidades_conflito(
+    individual: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot]
+) -> tuple:
+    """
+    Penalidades de conflito de professor e de período, calculadas juntas.
     
-    # Para cada combinação (professor, slot), verificar se há múltiplas disciplinas
-    for key, disciplinas in professor_slot_disciplinas.items():
-        disciplinas_unicas = set(disciplinas)
-        
-        if len(disciplinas_unicas) > 1:
-            # Número de conflitos = número de pares de disciplinas em conflito
-            num_conflitos = (len(disciplinas_unicas) * (len(disciplinas_unicas) - 1)) // 2
-            penalty += num_conflitos * PESO_CONFLITO_PROFESSOR
+    Usa a ocupação em bitsets (ver bitset.py): um único percurso pelos genes
+    monta as máscaras de professor e de período.
+    """
+    pares_professor, pares_periodo = bitsets_for(expanded_disciplines, slot_mapping).conflitos(individual)
+    return pares_professor * PESO_CONFLITO_PROFESSOR, pares_periodo * PESO_CONFLITO_PERIODO
+
+
+def penalidade_conflito_professor(
+    individual: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot]
+) -> int:
+    """
+    Penaliza se um professor tem aulas simultâneas.
     
-    return penalty
+    ATENÇÃO: Esta é uma restrição CRÍTICA e INADMISSÍVEL.
+    Um professor não pode ministrar duas aulas diferentes ao mesmo tempo.
+    
+    Cada horário (dia, início, fim) com k disciplinas distintas do mesmo
+    professor conta C(k, 2) conflitos (pares de disciplinas).
+    """
+    return penalidades_conflito(individual, expanded_disciplines, slot_mapping)[0]
 
 
 def penalidade_conflito_periodo(
@@ -71,30 +133,9 @@ def penalidade_conflito_periodo(
     ATENÇÃO: Esta é uma restrição CRÍTICA e INADMISSÍVEL.
     Duas ou mais disciplinas do mesmo período não podem ocupar o mesmo horário,
     pois os alunos precisariam estar em dois lugares ao mesmo tempo.
+    Se 2 disciplinas -> 1 conflito; se 3 disciplinas -> 3 conflitos (2+1).
     """
-    # Mapeia: (periodo, dia, inicio, fim) -> lista de disciplinas nesse slot
-    periodo_slot_disciplinas = defaultdict(list)
-    
-    for gene, disc in zip(individual, expanded_disciplines):
-        slot = slot_mapping.get(gene)
-        if slot:
-            key = (disc.periodo, slot.dia, slot.inicio, slot.fim)
-            periodo_slot_disciplinas[key].append(disc.codigo)
-    
-    penalty = 0
-    
-    # Para cada combinação (período, slot), verificar se há múltiplas disciplinas
-    for key, disciplinas in periodo_slot_disciplinas.items():
-        # Se mais de uma disciplina (mesmo código) no mesmo período e slot = CONFLITO
-        disciplinas_unicas = set(disciplinas)
-        
-        if len(disciplinas_unicas) > 1:
-            # Número de conflitos = número de pares de disciplinas em conflito
-            # Se 2 disciplinas -> 1 conflito; se 3 disciplinas -> 3 conflitos (2+1)
-            num_conflitos = (len(disciplinas_unicas) * (len(disciplinas_unicas) - 1)) // 2
-            penalty += num_conflitos * PESO_CONFLITO_PERIODO
-    
-    return penalty
+    return penalidades_conflito(individual, expanded_disciplines, slot_mapping)[1]
 
 
 def penalidade_concentracao(
@@ -123,34 +164,8 @@ def penalidade_lacuna(
     """
     Penaliza buracos (gaps) na grade horária de cada período.
     """
-    periodo_slots_por_dia = defaultdict(lambda: defaultdict(list))
-    
-    for gene, disc in zip(individual, expanded_disciplines):
-        slot = slot_mapping.get(gene)
-        if slot:
-            periodo_slots_por_dia[disc.periodo][slot.dia].append(slot.inicio)
-    
-    penalty = 0
-    for periodo, dias in periodo_slots_por_dia.items():
-        for dia, horarios in dias.items():
-            if len(horarios) > 1:
-                horarios_sorted = sorted(set(horarios))
-                
-                ordem_horarios = [
-                    "07:30", "08:20", "09:10", "10:20", "11:10",
-                    "13:00", "13:50", "14:40", "15:50", "16:40"
-                ]
-                
-                indices = [ordem_horarios.index(h) for h in horarios_sorted if h in ordem_horarios]
-                
-                if len(indices) > 1:
-                    indices_sorted = sorted(indices)
-                    for i in range(len(indices_sorted) - 1):
-                        gap = indices_sorted[i + 1] - indices_sorted[i] - 1
-                        if gap > 0:
-                            penalty += gap * PESO_LACUNA
-    
-    return penalty
+    lacunas, _ = contar_ocupacao_periodos(individual, expanded_disciplines, slot_mapping)
+    return lacunas * PESO_LACUNA
 
 
 def penalidade_sobrecarga_diaria(
@@ -161,24 +176,8 @@ def penalidade_sobrecarga_diaria(
     """
     Penaliza dias com mais de 5 aulas para um mesmo período.
     """
-    # Mapeia: (periodo, dia) -> contagem de aulas
-    periodo_dia_aulas = defaultdict(lambda: defaultdict(int))
-    
-    for gene, disc in zip(individual, expanded_disciplines):
-        slot = slot_mapping.get(gene)
-        if slot:
-            periodo_dia_aulas[disc.periodo][slot.dia] += 1
-    
-    penalty = 0
-    
-    for periodo, dias in periodo_dia_aulas.items():
-        for dia, num_aulas in dias.items():
-            if num_aulas > MAX_AULAS_POR_DIA:
-                # Penalizar proporcionalmente ao excesso
-                excesso = num_aulas - MAX_AULAS_POR_DIA
-                penalty += excesso * PESO_SOBRECARGA_DIARIA
-    
-    return penalty
+    _, excesso = contar_ocupacao_periodos(individual, expanded_disciplines, slot_mapping)
+    return excesso * PESO_SOBRECARGA_DIARIA
 
 
 # ============================================================================
@@ -190,23 +189,21 @@ def get_daily_distribution(individual: List[int],
                           slot_mapping: Dict[int, Slot]) -> Dict:
     """
     Retorna a distribuição de aulas por disciplina e dia.
+    
+    Os horários são convertidos em índices numéricos pela grade de tempo
+    derivada de horarios.csv (ver time_grid.py).
     """
-    # Ordem de horários para conversão em índices numéricos
-    ordem_horarios = [
-        "07:30", "08:20", "09:10", "10:20", "11:10",
-        "13:00", "13:50", "14:40", "15:50", "16:40"
-    ]
+    grade = time_grid_for(slot_mapping)
+    slot_dia = grade.slot_dia
+    slot_hora = grade.slot_hora_idx
     
     # Estrutura: codigo -> dia -> lista de índices de horários
     distribuicao = defaultdict(lambda: defaultdict(list))
     
     # Iterar sobre cada gene (aula) do cromossomo
     for gene, disc in zip(individual, expanded_disciplines):
-        slot = slot_mapping.get(gene)
-        if slot and slot.inicio in ordem_horarios:
-            # Converter horário para índice numérico (0-9)
-            idx_horario = ordem_horarios.index(slot.inicio)
-            distribuicao[disc.codigo][slot.dia].append(idx_horario)
+        if gene in slot_hora:
+            distribuicao[disc.codigo][slot_dia[gene]].append(slot_hora[gene])
     
     # Ordenar os índices de horários para cada dia
     for codigo in distribuicao:
@@ -418,6 +415,119 @@ def penalidade_blocos_incompletos(blocos: Dict) -> int:
     return penalty
 
 
+# ============================================================================
+# VETOR DE CARACTERÍSTICAS (FITNESS COMO PRODUTO ESCALAR)
+# ============================================================================
+
+# Contagens brutas do fitness: (nome, peso em config.py, sinal). O fitness é
+# BASE_SCORE + soma de sinal × contagem × peso (as penalidades subtraem, a
+# bonificação soma)
+CARACTERISTICAS = (
+    ("conflitos_professor", "PESO_CONFLITO_PROFESSOR", -1),
+    ("conflitos_periodo", "PESO_CONFLITO_PERIODO", -1),
+    ("aulas_isoladas", "PESO_BLOCO_INCOMPLETO", -1),
+    ("blocos_overload", "PESO_OVERLOAD_SEQUENCIAL", -1),
+    ("saltos_temporais", "PESO_SALTO_TEMPORAL", -1),
+    ("excesso_concentracao", "PESO_CONCENTRACAO", -1),
+    ("lacunas", "PESO_LACUNA", -1),
+    ("excesso_diario", "PESO_SOBRECARGA_DIARIA", -1),
+    ("blocos_ideais", "PESO_AULAS_SEQUENCIAIS", +1),
+)
+
+# Razões por disciplina (nome, peso): cada disciplina subtrai int(razão × peso),
+# como em penalidade_fragmentacao_disciplina e penalidade_pulverizacao_semanal
+RAZOES = (
+    ("fragmentacao", "PESO_FRAGMENTACAO"),
+    ("pulverizacao", "PESO_PULVERIZACAO_SEMANAL"),
+)
+
+# Pesos atuais de config.py, pelo nome da constante
+PESOS_PADRAO: Dict[str, float] = {
+    "PESO_CONFLITO_PROFESSOR": PESO_CONFLITO_PROFESSOR,
+    "PESO_CONFLITO_PERIODO": PESO_CONFLITO_PERIODO,
+    "PESO_BLOCO_INCOMPLETO": PESO_BLOCO_INCOMPLETO,
+    "PESO_OVERLOAD_SEQUENCIAL": PESO_OVERLOAD_SEQUENCIAL,
+    "PESO_SALTO_TEMPORAL": PESO_SALTO_TEMPORAL,
+    "PESO_CONCENTRACAO": PESO_CONCENTRACAO,
+    "PESO_LACUNA": PESO_LACUNA,
+    "PESO_SOBRECARGA_DIARIA": PESO_SOBRECARGA_DIARIA,
+    "PESO_AULAS_SEQUENCIAIS": PESO_AULAS_SEQUENCIAIS,
+    "PESO_FRAGMENTACAO": PESO_FRAGMENTACAO,
+    "PESO_PULVERIZACAO_SEMANAL": PESO_PULVERIZACAO_SEMANAL,
+}
+
+
+def nomes_caracteristicas(expanded_disciplines: List[Disciplina]) -> List[str]:
+    """Nome de cada posição do vetor de características de uma instância."""
+    codigos = list(dict.fromkeys(disc.codigo for disc in expanded_disciplines))
+    return ([nome for nome, _, _ in CARACTERISTICAS]
+            + [f"{razao}:{codigo}" for razao, _ in RAZOES for codigo in codigos])
+
+
+def vetor_caracteristicas(
+    individual: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    pares_conflito: Optional[tuple] = None
+) -> tuple:
+    """
+    Contagens brutas (sem pesos) que determinam o fitness de um indivíduo.
+    
+    As primeiras posições seguem CARACTERISTICAS; depois vêm as razões de
+    RAZOES, uma por disciplina (ver nomes_caracteristicas). Com o vetor
+    guardado, o fitness para qualquer conjunto de pesos é calculado por
+    pontuar, sem reavaliar o horário. pares_conflito reaproveita os pares em
+    conflito (professor, período) já contados.
+    """
+    # Restrições críticas: pares em conflito (bitsets)
+    if pares_conflito is None:
+        pares_conflito = bitsets_for(expanded_disciplines, slot_mapping).conflitos(individual)
+    pares_professor, pares_periodo = pares_conflito
+    
+    # Blocos, distribuição e saltos por disciplina (tabela de padrões diários)
+    contagens = day_patterns_for(expanded_disciplines, slot_mapping).contagens(individual)
+    fragmentacao = tuple(c[0] for c in contagens)
+    pulverizacao = tuple(c[1] for c in contagens)
+    saltos = sum(c[2] for c in contagens)
+    excesso_concentracao = sum(c[3] for c in contagens)
+    blocos_overload = sum(c[4] for c in contagens)
+    aulas_isoladas = sum(c[5] for c in contagens)
+    blocos_ideais = sum(c[6] for c in contagens)
+    
+    # Lacunas e sobrecarga diária por período
+    lacunas, excesso_diario = contar_ocupacao_periodos(individual, expanded_disciplines, slot_mapping)
+    
+    return ((pares_professor, pares_periodo, aulas_isoladas, blocos_overload, saltos,
+             excesso_concentracao, lacunas, excesso_diario, blocos_ideais)
+            + fragmentacao + pulverizacao)
+
+
+def pontuar(vetor: tuple, pesos: Dict[str, float] = PESOS_PADRAO) -> float:
+    """
+    Fitness de um vetor de características para um conjunto de pesos.
+    
+    Com PESOS_PADRAO o resultado é igual a evaluate_fitness; pesos ausentes
+    do dicionário usam o valor de PESOS_PADRAO.
+    """
+    n = len(CARACTERISTICAS)
+    num_disciplinas = (len(vetor) - n) // len(RAZOES)
+    
+    score = BASE_SCORE
+    for (_, peso, sinal), contagem in zip(CARACTERISTICAS, vetor):
+        if contagem:
+            score += sinal * contagem * pesos.get(peso, PESOS_PADRAO[peso])
+    
+    inicio = n
+    for _, peso in RAZOES:
+        valor_peso = pesos.get(peso, PESOS_PADRAO[peso])
+        for razao in vetor[inicio:inicio + num_disciplinas]:
+            if razao > 0:
+                score -= int(razao * valor_peso)
+        inicio += num_disciplinas
+    
+    return score
+
+
 def evaluate_fitness(
     individual: List[int],
     expanded_disciplines: List[Disciplina],
@@ -426,55 +536,159 @@ def evaluate_fitness(
 ) -> tuple:
     """
     Calcula o fitness de um indivíduo (solução candidata).
-    VERSÃO OTIMIZADA: Calcula estruturas auxiliares apenas uma vez.
+    
+    O fitness é o produto escalar das contagens brutas (vetor_caracteristicas)
+    com os pesos de config.py (PESOS_PADRAO).
     """
-    # Começar com pontuação base
-    score = BASE_SCORE
+    return (pontuar(vetor_caracteristicas(individual, expanded_disciplines, slot_mapping)),)
+
+
+def evaluate_fitness_lexicografico(
+    individual: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    disciplinas_unicas: List[Disciplina],
+    limite: Optional[float] = LIMITE_PENALIDADE_CRITICA,
+    referencia: Optional[List[Optional[int]]] = None,
+    peso_desvio: int = PESO_DESVIO
+) -> tuple:
+    """
+    Fitness lexicográfico: restrições críticas primeiro.
+    
+    Conta os conflitos (bitsets) e, se a penalidade crítica passar do limite,
+    não calcula as penalidades de qualidade: a pontuação fica apenas
+    BASE_SCORE - penalidade crítica. Com a seleção comparando primeiro a
+    penalidade crítica (ver FitnessLexicografica em genetic_algorithm.py), as
+    penalidades de qualidade só decidiriam entre indivíduos com a mesma
+    penalidade crítica, e a ordem da seleção não muda para os demais.
     
-    # ========================================================================
-    # 1. CÁLCULO PRÉVIO DE ESTRUTURAS AUXILIARES (OTIMIZAÇÃO)
-    # ========================================================================
-    # Calcula distribuição de aulas UMA ÚNICA VEZ
-    distribuicao = get_daily_distribution(individual, expanded_disciplines, slot_mapping)
-    
-    # Calcula blocos consecutivos UMA ÚNICA VEZ
-    blocos = count_consecutive_blocks(distribuicao)
-    
-    # Calcula spread (fragmentação/pulverização) UMA ÚNICA VEZ
-    spread_info = compute_discipline_daily_spread(distribuicao)
-    
-    # Calcula saltos temporais UMA ÚNICA VEZ
-    saltos_info = compute_temporal_jump_penalty(distribuicao)
-    
-    # ========================================================================
-    # 2. PENALIDADES CRÍTICAS
-    # ========================================================================
-    score -= penalidade_conflito_professor(individual, expanded_disciplines, slot_mapping)
-    score -= penalidade_conflito_periodo(individual, expanded_disciplines, slot_mapping)
-    
-    # ========================================================================
-    # 3. QUALIDADE DA GRADE (usando estruturas pré-calculadas)
-    # ========================================================================
-    score -= penalidade_fragmentacao_disciplina(spread_info)
-    score -= penalidade_pulverizacao_semanal(spread_info)
-    score -= penalidade_salto_temporal(saltos_info)
-    
-    # ========================================================================
-    # 4. OTIMIZAÇÕES
-    # ========================================================================
-    score -= penalidade_concentracao(distribuicao)
-    score -= penalidade_lacuna(individual, expanded_disciplines, slot_mapping, disciplinas_unicas)
-    score -= penalidade_sobrecarga_diaria(individual, expanded_disciplines, slot_mapping)
-    
-    # ========================================================================
-    # 5. PENALIDADE DE OVERLOAD
-    # ========================================================================
-    score -= penalidade_overload_sequencial(blocos)
-    score -= penalidade_blocos_incompletos(blocos)
-
-    # ========================================================================
-    # 6. BONIFICAÇÕES
-    # ========================================================================
-    score += bonificacao_aulas_sequenciais(blocos)
-    
-    return (score,)
+    Com uma referência (replanejamento), a pontuação inclui a penalidade de
+    desvio, como em evaluate_fitness_com_desvio.
+    
+    Returns:
+        Tupla (pontuação, penalidade crítica); abaixo do limite (ou com
+        limite None) a pontuação é igual a evaluate_fitness
+    """
+    pares = bitsets_for(expanded_disciplines, slot_mapping).conflitos(individual)
+    critica = pares[0] * PESO_CONFLITO_PROFESSOR + pares[1] * PESO_CONFLITO_PERIODO
+    if limite is not None and critica > limite:
+        score = BASE_SCORE - critica
+    else:
+        score = pontuar(vetor_caracteristicas(individual, expanded_disciplines, slot_mapping, pares))
+    if referencia is not None and peso_desvio:
+        score -= penalidade_desvio(individual, expanded_disciplines, referencia, peso_desvio)
+    return (score, critica)
+
+
+# Grupos de qualidade usados como objetivos no modo multiobjetivo (todos minimizados).
+# As restrições críticas (conflitos) não são objetivos: formam a violação de viabilidade.
+OBJETIVOS = ("blocos", "distribuicao", "lacunas")
+
+
+def evaluate_objectives(
+    individual: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    disciplinas_unicas: List[Disciplina]
+) -> tuple:
+    """
+    Calcula a violação das restrições críticas e os objetivos de qualidade.
+    
+    Usada pelo modo multiobjetivo (NSGA-II/NSGA-III). Cada objetivo soma as
+    penalidades ponderadas de um grupo, de forma que os pesos entre grupos
+    deixam de importar.
+    
+    Returns:
+        Tupla (violação, blocos, distribuição, lacunas), todos a minimizar:
+        - violação: penalidades de conflito de professor e de período
+        - blocos: aulas isoladas + overload sequencial - blocos ideais
+        - distribuição: fragmentação + pulverização + saltos + concentração
+        - lacunas: buracos na grade + sobrecarga diária
+    """
+    (pen_frag, pen_pulv, pen_salto, pen_conc,
+     pen_overload, pen_incompleto, bonus_seq) = day_patterns_for(expanded_disciplines, slot_mapping).totais(individual)[:7]
+    
+    violacao = sum(penalidades_conflito(individual, expanded_disciplines, slot_mapping))
+    
+    obj_blocos = pen_incompleto + pen_overload - bonus_seq
+    obj_distribuicao = pen_frag + pen_pulv + pen_salto + pen_conc
+    # Lacunas e sobrecarga diária saem do mesmo percurso pela ocupação dos períodos
+    lacunas, excesso = contar_ocupacao_periodos(individual, expanded_disciplines, slot_mapping)
+    obj_lacunas = lacunas * PESO_LACUNA + excesso * PESO_SOBRECARGA_DIARIA
+    
+    return (violacao, obj_blocos, obj_distribuicao, obj_lacunas)
+
+
+def penalidade_desvio(
+    individual: List[int],
+    expanded_disciplines: List[Disciplina],
+    referencia: List[Optional[int]],
+    peso: int = PESO_DESVIO
+) -> int:
+    """
+    Penaliza aulas que saíram do horário de referência (replanejamento).
+    
+    Como os genes de uma disciplina são intercambiáveis, a comparação é feita
+    por disciplina: cada slot de referência da disciplina que não aparece
+    entre os slots atuais dela conta como uma aula deslocada. Genes sem
+    referência (None: disciplina ou aula nova) não contam.
+    """
+    atuais = defaultdict(Counter)
+    anteriores = defaultdict(Counter)
+    for gene, ref, disc in zip(individual, referencia, expanded_disciplines):
+        atuais[disc.codigo][gene] += 1
+        if ref is not None:
+            anteriores[disc.codigo][ref] += 1
+    
+    deslocadas = sum(sum((ref - atuais[codigo]).values()) for codigo, ref in anteriores.items())
+    return deslocadas * peso
+
+
+def evaluate_fitness_com_desvio(
+    individual: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    disciplinas_unicas: List[Disciplina],
+    referencia: List[Optional[int]],
+    peso_desvio: int = PESO_DESVIO
+) -> tuple:
+    """Fitness com a penalidade de desvio em relação ao horário de referência."""
+    score = evaluate_fitness(individual, expanded_disciplines, slot_mapping, disciplinas_unicas)[0]
+    return (score - penalidade_desvio(individual, expanded_disciplines, referencia, peso_desvio),)
+
+
+def evaluate_fitness_cached(
+    individual: List[int],
+    problem_path: str,
+    referencia: Optional[List[Optional[int]]] = None,
+    peso_desvio: int = PESO_DESVIO,
+    lexicografico: bool = False,
+    limite: Optional[float] = LIMITE_PENALIDADE_CRITICA
+) -> tuple:
+    """
+    Calcula o fitness usando a instância compilada gravada em cache.
+    
+    Usada pelos workers de avaliação: cada processo abre o cache (memory-map)
+    uma única vez, e apenas o caminho é enviado junto com as tarefas. Com uma
+    referência (replanejamento), inclui a penalidade de desvio; com
+    lexicografico, retorna (pontuação, penalidade crítica) como
+    evaluate_fitness_lexicografico.
+    """
+    from .cache import worker_problem
+    
+    expanded_disciplines, slot_mapping, disciplinas_unicas = worker_problem(problem_path)
+    if lexicografico:
+        return evaluate_fitness_lexicografico(individual, expanded_disciplines, slot_mapping,
+                                              disciplinas_unicas, limite, referencia, peso_desvio)
+    if referencia is not None and peso_desvio:
+        return evaluate_fitness_com_desvio(individual, expanded_disciplines, slot_mapping,
+                                           disciplinas_unicas, referencia, peso_desvio)
+    return evaluate_fitness(individual, expanded_disciplines, slot_mapping, disciplinas_unicas)
+
+
+def evaluate_fitness_decodificado(individual: List[int], decodificar, avaliar) -> tuple:
+    """
+    Fitness de um cromossomo de outra codificação (ex.: blocos, ver
+    block_encoding.py): decodifica para slot_ids e avalia com avaliar.
+    """
+    return avaliar(decodificar(individual))
@@ -2,20 +2,58 @@
 Configuração e execução do Algoritmo Genético usando DEAP.
 """
 
+import time
 import random
 import multiprocessing
-from typing import List, Dict, Tuple
+from pathlib import Path
+from typing import Callable, List, Dict, Tuple, Optional
 from deap import base, creator, tools, algorithms
 
 from .models import Disciplina, Slot
-from .fitness import evaluate_fitness
+from .fitness import (
+    evaluate_fitness,
+    evaluate_fitness_cached,
+    evaluate_fitness_com_desvio,
+    evaluate_fitness_lexicografico,
+    evaluate_fitness_decodificado
+)
+from .archive import EliteArchive
+from .block_encoding import BlockEncoding, mut_blocos
+from .canonical import CanonicalGenome
+from .crossover import OPERADORES_CROSSOVER, OPERADORES_PERMUTACAO, grupos_genes, cx_grupos
+from .permutation_encoding import PermutationEncoding
+from .diversity import ACOES_DIVERSIDADE, diversidade_genotipica, injetar_diversidade
 from .config import (
     POPULATION_SIZE,
     NUM_GENERATIONS,
     CROSSOVER_PROB,
     MUTATION_PROB,
     TOURNAMENT_SIZE,
-    MUTATION_INDPB
+    MUTATION_INDPB,
+    REPRESENTACAO,
+    OPERADOR_CROSSOVER,
+    CROSSOVER_INDPB,
+    CROSSOVER_PERMUTACAO,
+    PERMUTACAO_INDPB,
+    HALL_OF_FAME_SIZE,
+    ELITE_DISTANCIA_MINIMA,
+    ELITES_REINSERIDOS,
+    ESTRATEGIA_SUBSTITUICAO,
+    NUM_FILHOS,
+    FILHOS_STEADY_STATE,
+    DIVERSIDADE_ACAO,
+    DIVERSIDADE_MINIMA,
+    DIVERSIDADE_INTERVALO,
+    DIVERSIDADE_CARENCIA,
+    FRACAO_REINICIO,
+    FRACAO_HIPERMUTACAO,
+    FRACAO_IMIGRANTES,
+    HIPERMUTACAO_INDPB,
+    PESO_DESVIO,
+    AVALIACAO_WORKERS,
+    LIMITE_PENALIDADE_CRITICA,
+    GENOMA_CANONICO,
+    CACHE_AVALIACOES_MAX
 )
 
 # Verificar se rich está disponível
@@ -27,151 +65,550 @@ except ImportError:
     HAS_RICH = False
 
 
+class FitnessLexicografica(base.Fitness):
+    """
+    Fitness (pontuação, penalidade crítica) comparado lexicograficamente.
+    
+    A comparação considera primeiro a penalidade crítica (menor é melhor) e,
+    em caso de empate, a pontuação. values[0] continua sendo a pontuação, de
+    modo que arquivo de elite e exportação a leem como no fitness escalar;
+    o melhor indivíduo é escolhido por esta comparação e run_genetic_algorithm
+    informa sua penalidade crítica junto com a pontuação.
+    """
+    
+    weights = (1.0, -1.0)
+    
+    def _chave(self) -> tuple:
+        return self.wvalues[1], self.wvalues[0]
+    
+    def __le__(self, other) -> bool:
+        return self._chave() <= other._chave()
+    
+    def __lt__(self, other) -> bool:
+        return self._chave() < other._chave()
+    
+    def __ge__(self, other) -> bool:
+        return not self.__lt__(other)
+    
+    def __gt__(self, other) -> bool:
+        return not self.__le__(other)
+
+
 def setup_deap_toolbox(
     chromosome_size: int,
     valid_slot_ids: List[int],
     expanded_disciplines: List[Disciplina],
     slot_mapping: Dict[int, Slot],
-    disciplinas_unicas: List[Disciplina]
+    disciplinas_unicas: List[Disciplina],
+    problem_path: Optional[Path] = None,
+    referencia: Optional[List[Optional[int]]] = None,
+    peso_desvio: int = PESO_DESVIO,
+    limite_critico: Optional[float] = LIMITE_PENALIDADE_CRITICA,
+    canonico: bool = GENOMA_CANONICO,
+    crossover: Optional[str] = None,
+    representacao: str = REPRESENTACAO,
+    ocupacao_professor: Optional[Dict[str, int]] = None
 ) -> base.Toolbox:
     """
     Configura o toolbox do DEAP com os operadores genéticos.
+    
+    Se problem_path (instância compilada em cache) for informado, a avaliação
+    envia aos workers apenas o caminho do cache em vez das listas de objetos.
+    Se referencia (horário anterior, ver warm_start.py) e peso_desvio forem
+    informados, a avaliação penaliza aulas deslocadas em relação a ele.
+    Com limite_critico, a avaliação é lexicográfica (ver
+    evaluate_fitness_lexicografico e FitnessLexicografica): indivíduos com
+    penalidade crítica acima do limite não têm as penalidades de qualidade
+    calculadas. Com canonico, o toolbox também registra canonizar,
+    forma_canonica e hash_canonico (ver canonical.py), usados por
+    run_genetic_algorithm.
+    
+    representacao escolhe a codificação (uma de REPRESENTACOES). Com "blocos"
+    (ver block_encoding.py), cada gene é a posição de um bloco de aulas; com
+    "permutacao" (ver permutation_encoding.py), o genoma é a ordem de
+    prioridade dos blocos, posicionados por um decodificador guloso. Nas duas,
+    a avaliação decodifica o cromossomo para slot_ids e o toolbox registra
+    decodificar, usado por run_genetic_algorithm para devolver os resultados
+    como cromossomos de slot_ids, e hipermutar, usado pelo monitor de
+    diversidade.
+    
+    ocupacao_professor (apenas na permutação) são horários já ocupados por
+    professor que o decodificador evita (ver decomposition.py).
+    
+    crossover escolhe o operador de cruzamento: uma de OPERADORES_CROSSOVER
+    (ver crossover.py) ou, na permutação, uma de OPERADORES_PERMUTACAO. None
+    usa OPERADOR_CROSSOVER (ou CROSSOVER_PERMUTACAO).
     """
+    if representacao not in REPRESENTACOES:
+        raise ValueError(f"Representação desconhecida: {representacao!r}. "
+                         f"Opções: {REPRESENTACOES}")
+    permutacao = representacao == "permutacao"
+    operadores = OPERADORES_PERMUTACAO if permutacao else OPERADORES_CROSSOVER
+    if crossover is None:
+        crossover = CROSSOVER_PERMUTACAO if permutacao else OPERADOR_CROSSOVER
+    if crossover not in operadores:
+        raise ValueError(f"Operador de crossover desconhecido para a representação {representacao!r}: "
+                         f"{crossover!r}. Opções: {operadores}")
+    if permutacao and canonico:
+        raise ValueError("Genomas canônicos não se aplicam à representação por permutação")
+    
     # Criar classes de fitness e indivíduo (apenas uma vez)
     if not hasattr(creator, "FitnessMax"):
         creator.create("FitnessMax", base.Fitness, weights=(1.0,))
     if not hasattr(creator, "Individual"):
         creator.create("Individual", list, fitness=creator.FitnessMax)
+    if not hasattr(creator, "FitnessLex"):
+        creator.create("FitnessLex", FitnessLexicografica)
+    if not hasattr(creator, "IndividualLex"):
+        creator.create("IndividualLex", list, fitness=creator.FitnessLex)
+    lexicografico = limite_critico is not None
+    classe = creator.IndividualLex if lexicografico else creator.Individual
     
     toolbox = base.Toolbox()
     
     # Registro de funções
     toolbox.register("attr_slot", random.choice, valid_slot_ids)
-    toolbox.register("individual", tools.initRepeat, creator.Individual, toolbox.attr_slot, n=chromosome_size)
+    codificacao = None
+    disciplinas_genes = expanded_disciplines
+    if representacao == "blocos":
+        codificacao = BlockEncoding(expanded_disciplines, slot_mapping)
+        disciplinas_genes = codificacao.disciplinas
+        toolbox.register("individual", tools.initIterate, classe, codificacao.individuo_aleatorio)
+        toolbox.register("hipermutar", mut_blocos, codificacao=codificacao)
+    elif permutacao:
+        codificacao = PermutationEncoding(expanded_disciplines, slot_mapping,
+                                          ocupacao_professor=ocupacao_professor)
+        disciplinas_genes = codificacao.blocos.disciplinas
+        toolbox.register("indices", random.sample, range(len(codificacao)), len(codificacao))
+        toolbox.register("individual", tools.initIterate, classe, toolbox.indices)
+        toolbox.register("hipermutar", tools.mutShuffleIndexes)
+    else:
+        toolbox.register("individual", tools.initRepeat, classe, toolbox.attr_slot, n=chromosome_size)
     toolbox.register("population", tools.initRepeat, list, toolbox.individual)
+    if canonico:
+        # Blocos de mesma disciplina e tamanho também são intercambiáveis
+        genoma = CanonicalGenome(expanded_disciplines if codificacao is None
+                                 else list(zip(codificacao.disciplinas, codificacao.tamanhos)))
+        toolbox.register("canonizar", genoma.canonizar)
+        toolbox.register("forma_canonica", genoma.forma)
+        toolbox.register("hash_canonico", genoma.hash)
     
     # Operadores genéticos
-    toolbox.register("evaluate", evaluate_fitness,
-                     expanded_disciplines=expanded_disciplines,
-                     slot_mapping=slot_mapping,
-                     disciplinas_unicas=disciplinas_unicas)
-    toolbox.register("mate", tools.cxTwoPoint)
-    toolbox.register("mutate", tools.mutUniformInt,
-                     low=min(valid_slot_ids),
-                     up=max(valid_slot_ids),
-                     indpb=MUTATION_INDPB)
+    com_desvio = referencia is not None and peso_desvio > 0
+    if problem_path is not None and lexicografico:
+        toolbox.register("evaluate", evaluate_fitness_cached, problem_path=str(problem_path),
+                         referencia=list(referencia) if com_desvio else None, peso_desvio=peso_desvio,
+                         lexicografico=True, limite=limite_critico)
+    elif lexicografico:
+        toolbox.register("evaluate", evaluate_fitness_lexicografico,
+                         expanded_disciplines=expanded_disciplines,
+                         slot_mapping=slot_mapping,
+                         disciplinas_unicas=disciplinas_unicas,
+                         limite=limite_critico,
+                         referencia=list(referencia) if com_desvio else None,
+                         peso_desvio=peso_desvio)
+    elif problem_path is not None and com_desvio:
+        toolbox.register("evaluate", evaluate_fitness_cached, problem_path=str(problem_path),
+                         referencia=list(referencia), peso_desvio=peso_desvio)
+    elif problem_path is not None:
+        toolbox.register("evaluate", evaluate_fitness_cached, problem_path=str(problem_path))
+    elif com_desvio:
+        toolbox.register("evaluate", evaluate_fitness_com_desvio,
+                         expanded_disciplines=expanded_disciplines,
+                         slot_mapping=slot_mapping,
+                         disciplinas_unicas=disciplinas_unicas,
+                         referencia=list(referencia),
+                         peso_desvio=peso_desvio)
+    else:
+        toolbox.register("evaluate", evaluate_fitness,
+                         expanded_disciplines=expanded_disciplines,
+                         slot_mapping=slot_mapping,
+                         disciplinas_unicas=disciplinas_unicas)
+    if codificacao is not None:
+        toolbox.register("decodificar", codificacao.decodificar)
+        toolbox.register("evaluate", evaluate_fitness_decodificado,
+                         decodificar=codificacao.decodificar, avaliar=toolbox.evaluate)
+    if crossover == "pmx":
+        toolbox.register("mate", tools.cxPartialyMatched)
+    elif crossover == "ordenado":
+        toolbox.register("mate", tools.cxOrdered)
+    elif crossover == "disciplinas":
+        toolbox.register("mate", cx_grupos, indpb=CROSSOVER_INDPB,
+                         grupos=grupos_genes(disciplinas_genes, lambda disc: disc.codigo))
+    elif crossover == "periodos":
+        toolbox.register("mate", cx_grupos, indpb=CROSSOVER_INDPB,
+                         grupos=grupos_genes(disciplinas_genes, lambda disc: disc.turma))
+    else:
+        toolbox.register("mate", tools.cxTwoPoint)
+    if permutacao:
+        toolbox.register("mutate", tools.mutShuffleIndexes, indpb=PERMUTACAO_INDPB)
+    elif codificacao is not None:
+        toolbox.register("mutate", mut_blocos, codificacao=codificacao, indpb=MUTATION_INDPB)
+    else:
+        toolbox.register("mutate", tools.mutUniformInt,
+                         low=min(valid_slot_ids),
+                         up=max(valid_slot_ids),
+                         indpb=MUTATION_INDPB)
     toolbox.register("select", tools.selTournament, tournsize=TOURNAMENT_SIZE)
     
     return toolbox
 
 
+ESTRATEGIAS_SUBSTITUICAO = ("geracional", "mu_mais_lambda", "mu_virgula_lambda", "steady_state")
+REPRESENTACOES = ("slots", "blocos", "permutacao")
+
+
+def _variar(toolbox: base.Toolbox, population: List, n: int, cxpb: float, mutpb: float) -> List:
+    """Gera n descendentes por seleção, crossover e mutação (fitness invalidado se alterados)."""
+    offspring = toolbox.select(population, n)
+    offspring = list(map(toolbox.clone, offspring))
+    
+    for child1, child2 in zip(offspring[::2], offspring[1::2]):
+        if random.random() < cxpb:
+            toolbox.mate(child1, child2)
+            del child1.fitness.values
+            del child2.fitness.values
+    
+    for mutant in offspring:
+        if random.random() < mutpb:
+            toolbox.mutate(mutant)
+            del mutant.fitness.values
+    
+    return offspring
+
+
+class _MemoAvaliacoes:
+    """Fitness já calculados, indexados pelo hash canônico do genoma."""
+    
+    def __init__(self, capacidade: int = CACHE_AVALIACOES_MAX):
+        self.capacidade = capacidade
+        self.valores: Dict[str, tuple] = {}
+        self.reaproveitadas = 0
+    
+    def guardar(self, chave: str, valores: tuple) -> None:
+        if len(self.valores) >= self.capacidade:
+            # Descarta apenas a entrada mais antiga
+            self.valores.pop(next(iter(self.valores)))
+        self.valores[chave] = valores
+
+
+def _avaliar(toolbox: base.Toolbox, individuos: List, memo: Optional[_MemoAvaliacoes] = None) -> int:
+    """
+    Avalia (em paralelo) os indivíduos sem fitness válido e retorna quantos foram avaliados.
+    
+    Com memo (genomas canônicos), os indivíduos são canonizados antes da
+    avaliação e cada horário distinto é avaliado uma única vez: repetidos no
+    lote ou já presentes no memo reaproveitam o fitness calculado.
+    """
+    invalid_ind = [ind for ind in individuos if not ind.fitness.valid]
+    if memo is None:
+        fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
+        for ind, fit in zip(invalid_ind, fitnesses):
+            ind.fitness.values = fit
+        return len(invalid_ind)
+    
+    pendentes: Dict[str, List] = {}
+    for ind in invalid_ind:
+        toolbox.canonizar(ind)
+        chave = toolbox.hash_canonico(ind)
+        if chave in memo.valores:
+            ind.fitness.values = memo.valores[chave]
+            memo.reaproveitadas += 1
+        else:
+            pendentes.setdefault(chave, []).append(ind)
+    
+    fitnesses = toolbox.map(toolbox.evaluate, [grupo[0] for grupo in pendentes.values()])
+    for (chave, grupo), fit in zip(pendentes.items(), fitnesses):
+        memo.guardar(chave, fit)
+        for ind in grupo:
+            ind.fitness.values = fit
+        memo.reaproveitadas += len(grupo) - 1
+    return len(pendentes)
+
+
+def _resumo_convergencia(
+    best_fitness_history: List[float],
+    avaliacoes_por_geracao: List[int],
+    critica_history: Optional[List[float]] = None
+) -> Dict:
+    """
+    Geração e número de avaliações em que o melhor fitness final foi atingido.
+    
+    Com o histórico da penalidade crítica (fitness lexicográfico), o melhor é
+    o de menor penalidade crítica e, em empate, de maior pontuação.
+    """
+    if not best_fitness_history:
+        return {"geracao_melhor": 0, "avaliacoes_ate_melhor": 0}
+    if critica_history is None:
+        critica_history = [0] * len(best_fitness_history)
+    chaves = [(-critica, fit) for critica, fit in zip(critica_history, best_fitness_history)]
+    geracao = chaves.index(max(chaves))
+    return {
+        "geracao_melhor": geracao + 1,
+        "avaliacoes_ate_melhor": avaliacoes_por_geracao[geracao],
+    }
+
+
 def run_genetic_algorithm(
     toolbox: base.Toolbox,
     population_size: int = POPULATION_SIZE,
     num_generations: int = NUM_GENERATIONS,
     cxpb: float = CROSSOVER_PROB,
-    mutpb: float = MUTATION_PROB
-) -> Tuple[List[int], List[float], List[float], List, List[float]]:
+    mutpb: float = MUTATION_PROB,
+    hof_size: int = HALL_OF_FAME_SIZE,
+    distancia_minima: int = ELITE_DISTANCIA_MINIMA,
+    num_elites: int = ELITES_REINSERIDOS,
+    estrategia: str = ESTRATEGIA_SUBSTITUICAO,
+    num_filhos: Optional[int] = NUM_FILHOS,
+    filhos_steady_state: int = FILHOS_STEADY_STATE,
+    acao_diversidade: Optional[str] = DIVERSIDADE_ACAO,
+    diversidade_minima: float = DIVERSIDADE_MINIMA,
+    populacao_inicial: Optional[List] = None,
+    progresso: Optional[Callable[[Dict], None]] = None,
+    num_workers: Optional[int] = AVALIACAO_WORKERS,
+    verbose: bool = True
+) -> Tuple[List[int], List[float], List[float], List, List[float], Dict]:
     """
-    Executa o algoritmo genético e retorna o melhor indivíduo e os top 3.
+    Executa o algoritmo genético e retorna o melhor indivíduo e os top-k.
+    
+    Os melhores indivíduos são mantidos em um arquivo de elite com diversidade
+    (ver archive.py). A substituição da população segue a estratégia escolhida:
+    
+    - geracional: os filhos substituem a população; os num_elites melhores do
+      arquivo substituem os piores filhos
+    - mu_mais_lambda: os μ melhores entre pais e λ filhos sobrevivem
+    - mu_virgula_lambda: os μ melhores entre os λ filhos sobrevivem (λ ≥ μ)
+    - steady_state: a cada iteração, filhos_steady_state filhos disputam com a
+      população e os piores saem; uma geração tem μ / filhos_steady_state
+      iterações, para gerar o mesmo número de filhos das outras estratégias
+    
+    A cada DIVERSIDADE_INTERVALO gerações a diversidade da população é medida
+    (ver diversity.py); se estiver abaixo de diversidade_minima, acao_diversidade
+    (reinício parcial, hipermutação ou imigrantes) é aplicada à população,
+    respeitando DIVERSIDADE_CARENCIA gerações entre ações. O arquivo de elite
+    é preservado.
+    
+    populacao_inicial (ex.: semeada por warm_start.semear_populacao) substitui
+    a população aleatória. Se progresso for informado, é chamado ao fim de cada
+    geração com um dicionário (geracao, melhor, media, avaliacoes, tempo).
+    num_workers limita os processos de avaliação (None: todos os núcleos; 1:
+    avaliação no próprio processo, sem pool).
+    
+    Se o toolbox tiver genomas canônicos (setup_deap_toolbox com canonico),
+    cada indivíduo é canonizado após a variação, horários repetidos
+    reaproveitam o fitness já calculado e o arquivo de elite compara as formas
+    canônicas.
     
     Returns:
         Tupla contendo: melhor indivíduo, histórico de fitness máximo, histórico de fitness médio,
-                       lista com top 3 indivíduos, lista com top 3 fitnesses
+                       lista com top-k indivíduos, lista com top-k fitnesses e estatísticas
+                       da execução (avaliações por geração, convergência, diversidade e população final)
     """
+    if estrategia not in ESTRATEGIAS_SUBSTITUICAO:
+        raise ValueError(f"Estratégia de substituição desconhecida: {estrategia!r}. "
+                         f"Opções: {ESTRATEGIAS_SUBSTITUICAO}")
+    if acao_diversidade is not None and acao_diversidade not in ACOES_DIVERSIDADE:
+        raise ValueError(f"Ação de diversidade desconhecida: {acao_diversidade!r}. "
+                         f"Opções: {ACOES_DIVERSIDADE}")
+    lambda_ = num_filhos or population_size
+    if estrategia == "mu_virgula_lambda" and lambda_ < population_size:
+        raise ValueError(f"(μ,λ) exige λ >= μ: λ={lambda_}, μ={population_size}")
+    if estrategia == "steady_state" and filhos_steady_state < 1:
+        raise ValueError(f"FILHOS_STEADY_STATE deve ser positivo: {filhos_steady_state}")
+    
     # Inicializar população
-    population = toolbox.population(n=population_size)
+    if populacao_inicial is not None:
+        population = list(populacao_inicial)
+        population_size = len(population)
+    else:
+        population = toolbox.population(n=population_size)
+    
+    # Estatísticas: o melhor é escolhido pela comparação da classe de fitness
+    # (lexicográfica com limite crítico) e informado pela pontuação
+    lexicografico = isinstance(population[0].fitness, FitnessLexicografica)
+    stats = tools.Statistics(lambda ind: ind.fitness)
+    stats.register("avg", lambda x: sum(f.values[0] for f in x) / len(x))
+    stats.register("max", lambda x: max(x).values[0])
+    if lexicografico:
+        stats.register("critica", lambda x: max(x).values[1])
     
-    # Estatísticas
-    stats = tools.Statistics(lambda ind: ind.fitness.values)
-    stats.register("avg", lambda x: sum(v[0] for v in x) / len(x))
-    stats.register("max", lambda x: max(v[0] for v in x))
+    # Genomas canônicos: memo de avaliações pelo hash canônico
+    memo = _MemoAvaliacoes() if hasattr(toolbox, "canonizar") else None
     
-    # Hall da Fama - manter top 3 indivíduos
-    hof = tools.HallOfFame(3)
+    # Arquivo de elite - top-k indivíduos distintos entre si
+    hof = EliteArchive(hof_size, distancia_minima,
+                       forma=toolbox.forma_canonica if memo is not None else None)
     
-    # Histórico de fitness
+    # Histórico de fitness, de avaliações e de tempo (acumulados ao fim de cada geração)
     best_fitness_history = []
     avg_fitness_history = []
+    critica_history = []
+    avaliacoes_por_geracao = []
+    tempo_por_geracao = []
+    inicio = time.time()
+    
+    # Diversidade medida (geração, valor) e ações aplicadas
+    historico_diversidade = []
+    eventos_diversidade = []
+    fracoes = {
+        "reinicio_parcial": FRACAO_REINICIO,
+        "hipermutacao": FRACAO_HIPERMUTACAO,
+        "imigrantes": FRACAO_IMIGRANTES,
+    }
+    ultima_acao = -DIVERSIDADE_CARENCIA
     
     # Configurar Multiprocessing
-    # Usa todos os núcleos disponíveis da CPU
-    pool = multiprocessing.Pool()
-    toolbox.register("map", pool.map)
+    # Usa num_workers processos (None: todos os núcleos disponíveis da CPU)
+    if num_workers == 1:
+        pool = None
+        toolbox.register("map", map)
+    else:
+        pool = multiprocessing.Pool(num_workers)
+        toolbox.register("map", pool.map)
     
     try:
         # Avaliação inicial da população usando processamento paralelo
-        fitnesses = toolbox.map(toolbox.evaluate, population)
-        for ind, fit in zip(population, fitnesses):
-            ind.fitness.values = fit
+        avaliacoes = _avaliar(toolbox, population, memo)
         
         hof.update(population)
         
-        if HAS_RICH:
-            console.print("\n[bold cyan]Iniciando evolução (com processamento paralelo)...[/bold cyan]\n")
-        else:
-            print("\nIniciando evolução (com processamento paralelo)...\n")
+        if verbose:
+            if HAS_RICH:
+                console.print(f"\n[bold cyan]Iniciando evolução ({estrategia}, com processamento paralelo)...[/bold cyan]\n")
+            else:
+                print(f"\nIniciando evolução ({estrategia}, com processamento paralelo)...\n")
         
         for gen in range(1, num_generations + 1):
-            offspring = toolbox.select(population, len(population))
-            offspring = list(map(toolbox.clone, offspring))
-            
-            for child1, child2 in zip(offspring[::2], offspring[1::2]):
-                if random.random() < cxpb:
-                    toolbox.mate(child1, child2)
-                    del child1.fitness.values
-                    del child2.fitness.values
-            
-            for mutant in offspring:
-                if random.random() < mutpb:
-                    toolbox.mutate(mutant)
-                    del mutant.fitness.values
-            
-            invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-            
-            # Avaliação paralela dos novos indivíduos
-            fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-            for ind, fit in zip(invalid_ind, fitnesses):
-                ind.fitness.values = fit
+            if estrategia == "steady_state":
+                for _ in range(max(1, population_size // filhos_steady_state)):
+                    filhos = _variar(toolbox, population, filhos_steady_state, cxpb, mutpb)
+                    avaliacoes += _avaliar(toolbox, filhos, memo)
+                    population[:] = tools.selBest(population + filhos, population_size)
+                    hof.update(filhos)
+            else:
+                offspring = _variar(toolbox, population, lambda_, cxpb, mutpb)
+                
+                # Avaliação paralela dos novos indivíduos
+                avaliacoes += _avaliar(toolbox, offspring, memo)
+                
+                if estrategia == "mu_mais_lambda":
+                    population[:] = tools.selBest(population + offspring, population_size)
+                elif estrategia == "mu_virgula_lambda":
+                    population[:] = tools.selBest(offspring, population_size)
+                else:
+                    # Elitismo: os melhores do arquivo substituem os piores descendentes
+                    if num_elites > 0:
+                        offspring.sort(key=lambda ind: ind.fitness, reverse=True)
+                        elites = hof.elites(num_elites)
+                        offspring[len(offspring) - len(elites):] = elites
+                    population[:] = offspring
+                hof.update(population)
             
-            population[:] = offspring
-            hof.update(population)
+            if gen % DIVERSIDADE_INTERVALO == 0:
+                diversidade = diversidade_genotipica(population)
+                historico_diversidade.append((gen, diversidade))
+                if (acao_diversidade and diversidade < diversidade_minima
+                        and gen - ultima_acao >= DIVERSIDADE_CARENCIA):
+                    novos = injetar_diversidade(toolbox, population, acao_diversidade,
+                                                fracoes[acao_diversidade], HIPERMUTACAO_INDPB)
+                    avaliacoes += _avaliar(toolbox, novos, memo)
+                    hof.update(novos)
+                    ultima_acao = gen
+                    eventos_diversidade.append({
+                        "geracao": gen,
+                        "acao": acao_diversidade,
+                        "diversidade": diversidade,
+                        "individuos": len(novos),
+                    })
+                    if verbose:
+                        if HAS_RICH:
+                            console.print(f"[magenta]Geração {gen}: diversidade {diversidade:.3f} "
+                                          f"< {diversidade_minima} → {acao_diversidade} "
+                                          f"({len(novos)} indivíduos)[/magenta]")
+                        else:
+                            print(f"Geração {gen}: diversidade {diversidade:.3f} "
+                                  f"< {diversidade_minima} -> {acao_diversidade} ({len(novos)} indivíduos)")
             
             record = stats.compile(population)
             best_fitness_history.append(record['max'])
             avg_fitness_history.append(record['avg'])
+            if lexicografico:
+                critica_history.append(record['critica'])
+            avaliacoes_por_geracao.append(avaliacoes)
+            tempo_por_geracao.append(time.time() - inicio)
+            
+            if progresso is not None:
+                progresso({
+                    "geracao": gen,
+                    "melhor": record['max'],
+                    "media": record['avg'],
+                    "avaliacoes": avaliacoes,
+                    "tempo": tempo_por_geracao[-1],
+                })
             
-            if gen % 10 == 0 or gen == 1:
+            if verbose and (gen % 10 == 0 or gen == 1):
+                critica = f" (crítica {record['critica']:.0f})" if lexicografico else ""
                 if HAS_RICH:
                     console.print(
                         f"Geração {gen:3d}/{num_generations} | "
-                        f"Melhor: [bold green]{record['max']:.0f}[/bold green] | "
-                        f"Média: [yellow]{record['avg']:.0f}[/yellow]"
+                        f"Melhor: [bold green]{record['max']:.0f}[/bold green]{critica} | "
+                        f"Média: [yellow]{record['avg']:.0f}[/yellow] | "
+                        f"Avaliações: {avaliacoes}"
                     )
                 else:
                     print(f"Geração {gen:3d}/{num_generations} | "
-                          f"Melhor: {record['max']:.0f} | Média: {record['avg']:.0f}")
+                          f"Melhor: {record['max']:.0f}{critica} | Média: {record['avg']:.0f} | "
+                          f"Avaliações: {avaliacoes}")
     
     finally:
         # Garantir que o pool seja fechado ao final
-        pool.close()
-        pool.join()
+        if pool is not None:
+            pool.close()
+            pool.join()
     
-    best_individual = hof[0]
+    # Outras representações são devolvidas como cromossomos de slot_ids
+    decodificar = getattr(toolbox, "decodificar", None) or (lambda ind: ind[:])
+    best_individual = decodificar(hof[0])
     
-    # Extrair top 3 indivíduos e suas pontuações
-    top_individuals = [ind[:] for ind in hof]  # Copiar os indivíduos
+    # Extrair top-k indivíduos e suas pontuações
+    top_individuals = [decodificar(ind) for ind in hof]  # Copiar os indivíduos
     top_fitnesses = [ind.fitness.values[0] for ind in hof]
+    # Fitness lexicográfico: a ordem do arquivo segue a penalidade crítica,
+    # que é informada junto com a pontuação de cada indivíduo
+    top_criticas = [ind.fitness.values[1] for ind in hof] if lexicografico else None
     
-    if HAS_RICH:
-        console.print("\n[bold green]Evolução concluída![/bold green]\n")
-        console.print("[cyan]Top 3 soluções encontradas:[/cyan]")
-        for i, (ind, fit) in enumerate(zip(top_individuals, top_fitnesses), 1):
-            console.print(f"  {i}º lugar: [bold green]{fit:.0f}[/bold green] pontos")
-    else:
-        print("\nEvolução concluída!\n")
-        print("Top 3 soluções encontradas:")
-        for i, (ind, fit) in enumerate(zip(top_individuals, top_fitnesses), 1):
-            print(f"  {i}º lugar: {fit:.0f} pontos")
+    estatisticas = {
+        "estrategia": estrategia,
+        "avaliacoes": avaliacoes,
+        "avaliacoes_por_geracao": avaliacoes_por_geracao,
+        "tempo_por_geracao": tempo_por_geracao,
+        "diversidade": historico_diversidade,
+        "eventos_diversidade": eventos_diversidade,
+        "populacao_final": [decodificar(ind) for ind in population],
+        "avaliacoes_reaproveitadas": memo.reaproveitadas if memo is not None else 0,
+        **_resumo_convergencia(best_fitness_history, avaliacoes_por_geracao,
+                               critica_history if lexicografico else None),
+    }
+    if lexicografico:
+        estatisticas["penalidade_critica_por_geracao"] = critica_history
+        estatisticas["penalidades_criticas"] = top_criticas
+    
+    if verbose:
+        if HAS_RICH:
+            console.print("\n[bold green]Evolução concluída![/bold green]\n")
+            console.print(f"[cyan]Avaliações de fitness:[/cyan] {avaliacoes} "
+                          f"(melhor atingido com {estatisticas['avaliacoes_ate_melhor']})")
+            console.print(f"[cyan]Top {len(top_individuals)} soluções encontradas:[/cyan]")
+            for i, fit in enumerate(top_fitnesses, 1):
+                critica = f" (penalidade crítica {top_criticas[i - 1]:.0f})" if lexicografico else ""
+                console.print(f"  {i}º lugar: [bold green]{fit:.0f}[/bold green] pontos{critica}")
+        else:
+            print("\nEvolução concluída!\n")
+            print(f"Avaliações de fitness: {avaliacoes} "
+                  f"(melhor atingido com {estatisticas['avaliacoes_ate_melhor']})")
+            print(f"Top {len(top_individuals)} soluções encontradas:")
+            for i, fit in enumerate(top_fitnesses, 1):
+                critica = f" (penalidade crítica {top_criticas[i - 1]:.0f})" if lexicografico else ""
+                print(f"  {i}º lugar: {fit:.0f} pontos{critica}")
     
-    return best_individual, best_fitness_history, avg_fitness_history, top_individuals, top_fitnesses
+    return best_individual, best_fitness_history, avg_fitness_history, top_individuals, top_fitnesses, estatisticas
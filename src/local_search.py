@@ -0,0 +1,258 @@
+"""
+Busca local de trajetória única: Simulated Annealing e Busca Tabu.
+
+Para replanejamentos rápidos não é preciso manter uma população: uma única
+solução é alterada por movimentos (um gene para outro slot) e trocas (os slots
+de dois genes), e cada vizinho é avaliado incrementalmente pelo DeltaEvaluator
+(ver delta.py), com as mesmas penalidades de fitness.py.
+
+run_local_search retorna as mesmas saídas de run_genetic_algorithm (melhor
+indivíduo, históricos, top-k do arquivo de elite e estatísticas), de modo que
+main.py e OutputManager tratam os três métodos da mesma forma.
+"""
+
+import math
+import random
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from deap import base
+
+from .models import Disciplina, Slot
+from .delta import DeltaEvaluator
+from .archive import EliteArchive
+from .config import (
+    HALL_OF_FAME_SIZE,
+    ELITE_DISTANCIA_MINIMA,
+    BUSCA_REGISTRO,
+    BUSCA_PROB_TROCA,
+    SA_TEMPERATURA_INICIAL,
+    SA_TEMPERATURA_FINAL,
+    SA_ITERACOES,
+    TABU_ITERACOES,
+    TABU_VIZINHOS,
+    TABU_TENURE,
+    PESO_DESVIO
+)
+
+# Verificar se rich está disponível
+try:
+    from rich.console import Console
+    console = Console()
+    HAS_RICH = True
+except ImportError:
+    HAS_RICH = False
+
+METODOS_BUSCA = ("sa", "tabu")
+
+
+def _vizinho(delta: DeltaEvaluator, valid_slot_ids: List[int], prob_troca: float) -> Tuple:
+    """Sorteia um movimento: ("troca", i, j) ou ("move", i, slot_id)."""
+    n = len(delta.genes)
+    if random.random() < prob_troca:
+        i, j = random.sample(range(n), 2)
+        return ("troca", i, j)
+    return ("move", random.randrange(n), random.choice(valid_slot_ids))
+
+
+def _destinos(delta: DeltaEvaluator, movimento: Tuple) -> List[Tuple[int, int]]:
+    """Pares (gene, slot) que o movimento criaria."""
+    tipo, i, alvo = movimento
+    if tipo == "troca":
+        return [(i, delta.genes[alvo]), (alvo, delta.genes[i])]
+    return [(i, alvo)]
+
+
+def _aplicar(delta: DeltaEvaluator, movimento: Tuple) -> Tuple:
+    """Aplica o movimento e retorna o movimento que o desfaz."""
+    tipo, i, alvo = movimento
+    if tipo == "troca":
+        delta.swap(i, alvo)
+        return movimento
+    antigo = delta.genes[i]
+    delta.move(i, alvo)
+    return ("move", i, antigo)
+
+
+def run_local_search(
+    toolbox: base.Toolbox,
+    valid_slot_ids: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    metodo: str = "sa",
+    num_iteracoes: Optional[int] = None,
+    inicial: Optional[List[int]] = None,
+    referencia: Optional[List[Optional[int]]] = None,
+    peso_desvio: int = PESO_DESVIO,
+    temperatura_inicial: float = SA_TEMPERATURA_INICIAL,
+    progresso: Optional[Callable[[Dict], None]] = None,
+    hof_size: int = HALL_OF_FAME_SIZE,
+    distancia_minima: int = ELITE_DISTANCIA_MINIMA,
+    verbose: bool = True
+) -> Tuple[List[int], List[float], List[float], List, List[float], Dict]:
+    """
+    Executa Simulated Annealing ("sa") ou Busca Tabu ("tabu").
+    
+    - sa: aceita um vizinho pior com probabilidade exp(Δ/T); a temperatura
+      decai geometricamente de SA_TEMPERATURA_INICIAL a SA_TEMPERATURA_FINAL
+    - tabu: a cada iteração avalia TABU_VIZINHOS vizinhos e aplica o melhor
+      não-tabu (ou tabu que supere o melhor já encontrado); devolver um gene
+      ao slot de onde saiu fica proibido por TABU_TENURE iterações
+    
+    Args:
+        toolbox: Toolbox do AG (usado para criar o indivíduo inicial e os do ranking)
+        valid_slot_ids: Slots válidos para os movimentos
+        expanded_disciplines: Lista expandida de disciplinas
+        slot_mapping: Mapeamento de slot_id para Slot
+        metodo: "sa" ou "tabu"
+        num_iteracoes: Número de iterações (None: SA_ITERACOES ou TABU_ITERACOES)
+        inicial: Cromossomo inicial (None: aleatório; ver warm_start.py)
+        referencia: Horário de referência para a penalidade de desvio
+        peso_desvio: Peso da penalidade de desvio (0 = desativada)
+        temperatura_inicial: Temperatura inicial do SA (menor ao partir de um
+            horário anterior, para não se afastar dele logo no início)
+        progresso: Chamado a cada registro (BUSCA_REGISTRO iterações) com o
+            mesmo dicionário de run_genetic_algorithm
+    
+    Returns:
+        Mesma tupla de run_genetic_algorithm; cada "geração" dos históricos
+        corresponde a BUSCA_REGISTRO iterações, e a média é o fitness da
+        solução corrente
+    """
+    if metodo not in METODOS_BUSCA:
+        raise ValueError(f"Método de busca desconhecido: {metodo!r}. Opções: {METODOS_BUSCA}")
+    
+    if num_iteracoes is None:
+        num_iteracoes = SA_ITERACOES if metodo == "sa" else TABU_ITERACOES
+    
+    corrente = toolbox.individual()
+    if inicial is not None:
+        corrente[:] = inicial
+    delta = DeltaEvaluator(corrente, expanded_disciplines, slot_mapping, referencia, peso_desvio)
+    melhor = delta.score
+    hof = EliteArchive(hof_size, distancia_minima)
+    
+    def _registrar_elite():
+        if len(hof) < hof.capacidade or delta.score > hof[-1].fitness.values[0]:
+            ind = toolbox.clone(corrente)
+            ind[:] = delta.genes
+            ind.fitness.values = delta.fitness
+            hof.update([ind])
+    
+    _registrar_elite()
+    
+    best_fitness_history, avg_fitness_history = [], []
+    avaliacoes_por_geracao, tempo_por_geracao = [], []
+    avaliacoes = 1
+    inicio = time.time()
+    
+    # Simulated Annealing: fator de resfriamento por iteração
+    resfriamento = (SA_TEMPERATURA_FINAL / temperatura_inicial) ** (1 / max(1, num_iteracoes))
+    temperatura = temperatura_inicial
+    # Busca Tabu: (gene, slot) proibidos, com expiração
+    tabu = {}
+    fila_tabu = deque()
+    
+    if verbose:
+        nome = "Simulated Annealing" if metodo == "sa" else "Busca Tabu"
+        if HAS_RICH:
+            console.print(f"\n[bold cyan]Iniciando {nome} ({num_iteracoes} iterações)...[/bold cyan]\n")
+        else:
+            print(f"\nIniciando {nome} ({num_iteracoes} iterações)...\n")
+    
+    for it in range(1, num_iteracoes + 1):
+        if metodo == "sa":
+            antes = delta.score
+            desfazer = _aplicar(delta, _vizinho(delta, valid_slot_ids, BUSCA_PROB_TROCA))
+            avaliacoes += 1
+            diferenca = delta.score - antes
+            if diferenca < 0 and random.random() >= math.exp(diferenca / temperatura):
+                _aplicar(delta, desfazer)
+            temperatura *= resfriamento
+        else:
+            escolhido, escolhido_score = None, None
+            for _ in range(TABU_VIZINHOS):
+                movimento = _vizinho(delta, valid_slot_ids, BUSCA_PROB_TROCA)
+                desfazer = _aplicar(delta, movimento)
+                score = delta.score
+                _aplicar(delta, desfazer)
+                avaliacoes += 1
+                proibido = any(tabu.get(chave, 0) >= it for chave in _destinos(delta, movimento))
+                if proibido and score <= melhor:
+                    continue
+                if escolhido is None or score > escolhido_score:
+                    escolhido, escolhido_score = movimento, score
+            if escolhido is not None:
+                # Proíbe devolver os genes alterados aos slots de onde saíram
+                tipo, i, alvo = escolhido
+                genes = [i] if tipo == "move" else [i, alvo]
+                for gene in genes:
+                    chave = (gene, delta.genes[gene])
+                    tabu[chave] = it + TABU_TENURE
+                    fila_tabu.append(chave)
+                _aplicar(delta, escolhido)
+            # Remove entradas expiradas para manter o dicionário pequeno
+            while fila_tabu and tabu.get(fila_tabu[0], 0) < it:
+                tabu.pop(fila_tabu.popleft(), None)
+        
+        if delta.score > melhor:
+            melhor = delta.score
+        _registrar_elite()
+        
+        if it % BUSCA_REGISTRO == 0 or it == num_iteracoes:
+            best_fitness_history.append(melhor)
+            avg_fitness_history.append(delta.score)
+            avaliacoes_por_geracao.append(avaliacoes)
+            tempo_por_geracao.append(time.time() - inicio)
+            
+            registro = len(best_fitness_history)
+            if progresso is not None:
+                progresso({
+                    "geracao": registro,
+                    "melhor": melhor,
+                    "media": delta.score,
+                    "avaliacoes": avaliacoes,
+                    "tempo": tempo_por_geracao[-1],
+                })
+            if verbose and (registro % 10 == 0 or registro == 1):
+                if HAS_RICH:
+                    console.print(
+                        f"Iteração {it:7d}/{num_iteracoes} | "
+                        f"Melhor: [bold green]{melhor:.0f}[/bold green] | "
+                        f"Corrente: [yellow]{delta.score:.0f}[/yellow]"
+                    )
+                else:
+                    print(f"Iteração {it:7d}/{num_iteracoes} | "
+                          f"Melhor: {melhor:.0f} | Corrente: {delta.score:.0f}")
+    
+    top_individuals = [ind[:] for ind in hof]
+    top_fitnesses = [ind.fitness.values[0] for ind in hof]
+    geracao = best_fitness_history.index(max(best_fitness_history)) if best_fitness_history else 0
+    
+    estatisticas = {
+        "estrategia": metodo,
+        "avaliacoes": avaliacoes,
+        "avaliacoes_por_geracao": avaliacoes_por_geracao,
+        "tempo_por_geracao": tempo_por_geracao,
+        "diversidade": [],
+        "eventos_diversidade": [],
+        "geracao_melhor": geracao + 1,
+        "avaliacoes_ate_melhor": avaliacoes_por_geracao[geracao] if avaliacoes_por_geracao else 0,
+    }
+    
+    if verbose:
+        if HAS_RICH:
+            console.print("\n[bold green]Busca concluída![/bold green]\n")
+            console.print(f"[cyan]Avaliações incrementais:[/cyan] {avaliacoes}")
+            console.print(f"[cyan]Top {len(top_individuals)} soluções encontradas:[/cyan]")
+            for i, fit in enumerate(top_fitnesses, 1):
+                console.print(f"  {i}º lugar: [bold green]{fit:.0f}[/bold green] pontos")
+        else:
+            print("\nBusca concluída!\n")
+            print(f"Avaliações incrementais: {avaliacoes}")
+            print(f"Top {len(top_individuals)} soluções encontradas:")
+            for i, fit in enumerate(top_fitnesses, 1):
+                print(f"  {i}º lugar: {fit:.0f} pontos")
+    
+    return hof[0], best_fitness_history, avg_fitness_history, top_individuals, top_fitnesses, estatisticas
@@ -2,7 +2,8 @@
 Modelos de dados para o sistema de geração de horários.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Tuple
 
 
 @dataclass
@@ -14,6 +15,13 @@ class Disciplina:
     carga_horaria: int
     professor: str
     aulas_semanais: int
+    curso: str = ""
+    # Período com o namespace do curso: o período 1 de dois cursos são turmas
+    # distintas. Conflitos de período, lacunas e sobrecarga são agrupados por turma
+    turma: Tuple[str, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.turma = (self.curso, self.periodo)
 
 
 @dataclass
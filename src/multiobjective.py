@@ -0,0 +1,243 @@
+"""
+Modo multiobjetivo (NSGA-II / NSGA-III) usando DEAP.
+
+Em vez de somar todas as penalidades com os pesos PESO_*, cada grupo de
+qualidade (blocos, distribuição, lacunas) é um objetivo separado. Os conflitos
+de professor e de período continuam como restrição: uma solução viável sempre
+vence uma inviável, e entre inviáveis vence a de menor violação. Uma única
+execução produz a frente de Pareto, substituindo uma varredura de pesos.
+"""
+
+import random
+import multiprocessing
+from functools import partial
+from typing import List, Dict, Optional, Tuple
+
+from deap import base, creator, tools
+
+from .models import Disciplina, Slot
+from .fitness import OBJETIVOS, evaluate_objectives
+from .config import (
+    POPULATION_SIZE,
+    NUM_GENERATIONS,
+    CROSSOVER_PROB,
+    MUTATION_PROB,
+    MUTATION_INDPB,
+    NSGA3_DIVISOES,
+    AVALIACAO_WORKERS
+)
+
+# Verificar se rich está disponível
+try:
+    from rich.console import Console
+    console = Console()
+    HAS_RICH = True
+except ImportError:
+    HAS_RICH = False
+
+VARIANTES = ("nsga2", "nsga3")
+
+
+def setup_nsga_toolbox(
+    chromosome_size: int,
+    valid_slot_ids: List[int],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    disciplinas_unicas: List[Disciplina],
+    variante: str = "nsga2"
+) -> base.Toolbox:
+    """
+    Configura o toolbox do DEAP para o modo multiobjetivo.
+    
+    Usa a mesma representação e os mesmos operadores de variação do AG
+    mono-objetivo; muda apenas a avaliação e a seleção.
+    """
+    if variante not in VARIANTES:
+        raise ValueError(f"Variante multiobjetivo desconhecida: {variante!r}. Opções: {VARIANTES}")
+    
+    # Criar classes de fitness e indivíduo (apenas uma vez)
+    if not hasattr(creator, "FitnessMulti"):
+        creator.create("FitnessMulti", base.Fitness, weights=(-1.0,) * len(OBJETIVOS))
+    if not hasattr(creator, "IndividualMulti"):
+        creator.create("IndividualMulti", list, fitness=creator.FitnessMulti, violacao=0)
+    
+    toolbox = base.Toolbox()
+    
+    toolbox.register("attr_slot", random.choice, valid_slot_ids)
+    toolbox.register("individual", tools.initRepeat, creator.IndividualMulti, toolbox.attr_slot, n=chromosome_size)
+    toolbox.register("population", tools.initRepeat, list, toolbox.individual)
+    
+    toolbox.register("evaluate", evaluate_objectives,
+                     expanded_disciplines=expanded_disciplines,
+                     slot_mapping=slot_mapping,
+                     disciplinas_unicas=disciplinas_unicas)
+    toolbox.register("mate", tools.cxTwoPoint)
+    toolbox.register("mutate", tools.mutUniformInt,
+                     low=min(valid_slot_ids),
+                     up=max(valid_slot_ids),
+                     indpb=MUTATION_INDPB)
+    
+    if variante == "nsga3":
+        ref_points = tools.uniform_reference_points(len(OBJETIVOS), NSGA3_DIVISOES)
+        toolbox.register("select", sel_viabilidade, selector=partial(tools.selNSGA3, ref_points=ref_points))
+    else:
+        toolbox.register("select", sel_viabilidade, selector=tools.selNSGA2)
+    toolbox.register("select_parents", torneio_viabilidade)
+    
+    return toolbox
+
+
+def sel_viabilidade(individuals: List, k: int, selector=tools.selNSGA2) -> List:
+    """
+    Seleção ambiental com regra de viabilidade.
+    
+    Os indivíduos viáveis são selecionados pelo NSGA (frentes + crowding ou
+    pontos de referência). Se não houver viáveis suficientes, as vagas
+    restantes ficam com os inviáveis de menor violação.
+    """
+    viaveis = [ind for ind in individuals if ind.violacao == 0]
+    if len(viaveis) >= k:
+        return selector(viaveis, k)
+    
+    inviaveis = sorted((ind for ind in individuals if ind.violacao > 0), key=lambda ind: ind.violacao)
+    if viaveis:
+        # Atribui crowding distance aos viáveis (usada no torneio de pais)
+        viaveis = selector(viaveis, len(viaveis))
+    return viaveis + inviaveis[:k - len(viaveis)]
+
+
+def _melhor(a, b):
+    """Compara dois indivíduos pela dominância com restrições (regra de Deb)."""
+    if a.violacao != b.violacao:
+        return a if a.violacao < b.violacao else b
+    if a.fitness.dominates(b.fitness):
+        return a
+    if b.fitness.dominates(a.fitness):
+        return b
+    crowd_a = getattr(a.fitness, "crowding_dist", 0.0)
+    crowd_b = getattr(b.fitness, "crowding_dist", 0.0)
+    if crowd_a != crowd_b:
+        return a if crowd_a > crowd_b else b
+    return random.choice((a, b))
+
+
+def torneio_viabilidade(individuals: List, k: int) -> List:
+    """Seleção de pais por torneio binário com dominância com restrições."""
+    return [_melhor(*random.sample(individuals, 2)) for _ in range(k)]
+
+
+def _avaliar(toolbox: base.Toolbox, individuos: List) -> None:
+    """Avalia os indivíduos, separando a violação dos objetivos."""
+    resultados = toolbox.map(toolbox.evaluate, individuos)
+    for ind, res in zip(individuos, resultados):
+        ind.violacao = res[0]
+        ind.fitness.values = res[1:]
+
+
+def run_nsga(
+    toolbox: base.Toolbox,
+    population_size: int = POPULATION_SIZE,
+    num_generations: int = NUM_GENERATIONS,
+    cxpb: float = CROSSOVER_PROB,
+    mutpb: float = MUTATION_PROB,
+    num_workers: Optional[int] = AVALIACAO_WORKERS
+) -> Tuple[List, List[Dict]]:
+    """
+    Executa o NSGA (II ou III, conforme o toolbox) com substituição (μ+λ).
+    
+    num_workers limita os processos de avaliação (None: todos os núcleos; 1:
+    avaliação no próprio processo, sem pool).
+    
+    Returns:
+        Tupla contendo: frente de Pareto (indivíduos viáveis não dominados,
+        ou os de menor violação se nenhum viável for encontrado) e histórico
+        por geração (viáveis, tamanho da frente e melhor valor de cada objetivo)
+    """
+    population = toolbox.population(n=population_size)
+    
+    # Frente de Pareto acumulada (apenas soluções viáveis)
+    frente = tools.ParetoFront()
+    historico = []
+    
+    if num_workers == 1:
+        pool = None
+        toolbox.register("map", map)
+    else:
+        pool = multiprocessing.Pool(num_workers)
+        toolbox.register("map", pool.map)
+    
+    try:
+        _avaliar(toolbox, population)
+        population = toolbox.select(population, population_size)
+        frente.update([ind for ind in population if ind.violacao == 0])
+        
+        if HAS_RICH:
+            console.print("\n[bold cyan]Iniciando evolução multiobjetivo (com processamento paralelo)...[/bold cyan]\n")
+        else:
+            print("\nIniciando evolução multiobjetivo (com processamento paralelo)...\n")
+        
+        for gen in range(1, num_generations + 1):
+            offspring = toolbox.select_parents(population, len(population))
+            offspring = list(map(toolbox.clone, offspring))
+            
+            for child1, child2 in zip(offspring[::2], offspring[1::2]):
+                if random.random() < cxpb:
+                    toolbox.mate(child1, child2)
+                    del child1.fitness.values
+                    del child2.fitness.values
+            
+            for mutant in offspring:
+                if random.random() < mutpb:
+                    toolbox.mutate(mutant)
+                    del mutant.fitness.values
+            
+            invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
+            _avaliar(toolbox, invalid_ind)
+            
+            population = toolbox.select(population + offspring, population_size)
+            frente.update([ind for ind in population if ind.violacao == 0])
+            
+            viaveis = sum(1 for ind in population if ind.violacao == 0)
+            record = {
+                "viaveis": viaveis,
+                "tamanho_frente": len(frente),
+                "menor_violacao": min(ind.violacao for ind in population),
+            }
+            for i, nome in enumerate(OBJETIVOS):
+                record[f"min_{nome}"] = min(ind.fitness.values[i] for ind in population)
+            historico.append(record)
+            
+            if gen % 10 == 0 or gen == 1:
+                objetivos = " | ".join(f"{nome}: {record[f'min_{nome}']:.0f}" for nome in OBJETIVOS)
+                if HAS_RICH:
+                    console.print(
+                        f"Geração {gen:3d}/{num_generations} | "
+                        f"Viáveis: [bold green]{viaveis}[/bold green] | "
+                        f"Frente: [yellow]{len(frente)}[/yellow] | {objetivos}"
+                    )
+                else:
+                    print(f"Geração {gen:3d}/{num_generations} | Viáveis: {viaveis} | "
+                          f"Frente: {len(frente)} | {objetivos}")
+    
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    
+    if len(frente) > 0:
+        resultado = list(frente)
+    else:
+        # Nenhuma solução viável: retorna a primeira frente dos de menor violação
+        menor = min(ind.violacao for ind in population)
+        candidatos = [ind for ind in population if ind.violacao == menor]
+        resultado = tools.sortNondominated(candidatos, len(candidatos), first_front_only=True)[0]
+    
+    resultado.sort(key=lambda ind: ind.fitness.values)
+    
+    if HAS_RICH:
+        console.print(f"\n[bold green]Evolução concluída![/bold green] "
+                      f"Frente de Pareto com {len(resultado)} soluções.\n")
+    else:
+        print(f"\nEvolução concluída! Frente de Pareto com {len(resultado)} soluções.\n")
+    
+    return resultado, historico
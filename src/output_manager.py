@@ -7,7 +7,7 @@ import json
 import pickle
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 
 from .models import Disciplina, Slot
 
@@ -15,13 +15,20 @@ from .models import Disciplina, Slot
 class OutputManager:
     """Gerencia o salvamento de resultados do algoritmo genético."""
     
-    def __init__(self, output_dir: str = "outputs"):
+    def __init__(self, output_dir: str = "outputs", run_dir: Optional[Path] = None):
         """
         Inicializa o gerenciador de outputs.
         
         Args:
             output_dir: Diretório onde os outputs serão salvos
+            run_dir: Diretório de uma execução já existente (usado pelos
+                workers de exportação); se None, cria um novo com timestamp
         """
+        if run_dir is not None:
+            self.run_dir = Path(run_dir)
+            self.output_dir = self.run_dir.parent
+            return
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
@@ -29,7 +36,7 @@ class OutputManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.run_dir = self.output_dir / f"run_{timestamp}"
         self.run_dir.mkdir(exist_ok=True)
-        
+    
     def save_execution_data(
         self,
         top_individuals: List[Any],
@@ -40,14 +47,15 @@ class OutputManager:
         config: Dict[str, Any],
         expanded_disciplines: List[Disciplina],
         slot_mapping: Dict[int, Slot],
-        disciplinas_unicas: List[Disciplina]
+        disciplinas_unicas: List[Disciplina],
+        run_stats: Optional[Dict[str, Any]] = None
     ) -> None:
         """
         Salva todos os dados da execução do algoritmo.
         
         Args:
-            top_individuals: Lista com os 3 melhores indivíduos
-            top_fitnesses: Lista com as pontuações dos 3 melhores
+            top_individuals: Lista com os melhores indivíduos (arquivo de elite)
+            top_fitnesses: Lista com as pontuações dos melhores
             best_fitness_history: Histórico do melhor fitness por geração
             avg_fitness_history: Histórico do fitness médio por geração
             execution_time: Tempo de execução em segundos
@@ -55,6 +63,8 @@ class OutputManager:
             expanded_disciplines: Lista expandida de disciplinas
             slot_mapping: Mapeamento de slots
             disciplinas_unicas: Lista de disciplinas únicas
+            run_stats: Estatísticas retornadas por run_genetic_algorithm
+                (estratégia de substituição, avaliações e convergência)
         """
         # Salvar dados de execução em JSON
         execution_data = {
@@ -71,12 +81,29 @@ class OutputManager:
             "num_disciplines": len(disciplinas_unicas),
             "total_weekly_classes": sum(d.aulas_semanais for d in disciplinas_unicas),
         }
+        if run_stats:
+            execution_data["replacement_strategy"] = run_stats["estrategia"]
+            execution_data["total_evaluations"] = run_stats["avaliacoes"]
+            execution_data["evaluations_per_generation"] = run_stats["avaliacoes_por_geracao"]
+            execution_data["convergence_info"]["evaluations_to_best"] = run_stats["avaliacoes_ate_melhor"]
+            execution_data["diversity_per_generation"] = [
+                {"generation": gen, "diversity": float(d)} for gen, d in run_stats["diversidade"]
+            ]
+            execution_data["diversity_events"] = run_stats["eventos_diversidade"]
+            if run_stats.get("avaliacoes_reaproveitadas"):
+                execution_data["reused_evaluations"] = run_stats["avaliacoes_reaproveitadas"]
+            if "penalidades_criticas" in run_stats:
+                # Fitness lexicográfico: a ordem segue a penalidade crítica
+                execution_data["top_3_critical_penalties"] = [
+                    float(p) for p in run_stats["penalidades_criticas"]]
+                execution_data["best_critical_penalty_per_generation"] = [
+                    float(p) for p in run_stats["penalidade_critica_por_geracao"]]
         
         # Salvar JSON com informações gerais
         with open(self.run_dir / "execution_summary.json", "w", encoding="utf-8") as f:
             json.dump(execution_data, f, indent=2, ensure_ascii=False)
         
-        # Salvar os 3 melhores indivíduos com pickle (para análise posterior)
+        # Salvar os melhores indivíduos com pickle (para análise posterior)
         individuals_data = {
             "top_individuals": top_individuals,
             "top_fitnesses": top_fitnesses,
@@ -89,10 +116,13 @@ class OutputManager:
             pickle.dump(individuals_data, f)
         
         # Salvar históricos em formato CSV para fácil análise
-        self._save_fitness_history_csv(best_fitness_history, avg_fitness_history)
+        self._save_fitness_history_csv(
+            best_fitness_history, avg_fitness_history,
+            run_stats["avaliacoes_por_geracao"] if run_stats else None
+        )
         
         print(f"\n✓ Dados salvos em: {self.run_dir}")
-        
+    
     def save_schedule_details(
         self,
         rank: int,
@@ -129,18 +159,57 @@ class OutputManager:
         with open(self.run_dir / filename, "w", encoding="utf-8") as f:
             json.dump(schedule_data, f, indent=2, ensure_ascii=False)
     
+    def save_pareto_front(
+        self,
+        solutions: List[Dict[str, Any]],
+        history: List[Dict[str, Any]],
+        execution_time: float,
+        config: Dict[str, Any]
+    ) -> None:
+        """
+        Salva a frente de Pareto do modo multiobjetivo.
+        
+        Args:
+            solutions: Soluções da frente, cada uma com objetivos, violação,
+                fitness escalar (pesos atuais), cromossomo e horário decodificado
+            history: Histórico por geração (viáveis, tamanho da frente, objetivos)
+            execution_time: Tempo de execução em segundos
+            config: Configurações usadas no algoritmo
+        """
+        front_data = {
+            "timestamp": datetime.now().isoformat(),
+            "execution_time_seconds": execution_time,
+            "config": config,
+            "front_size": len(solutions),
+            "solutions": solutions,
+            "history": history,
+        }
+        
+        with open(self.run_dir / "pareto_front.json", "w", encoding="utf-8") as f:
+            json.dump(front_data, f, indent=2, ensure_ascii=False)
+        
+        print(f"\n✓ Frente de Pareto salva em: {self.run_dir / 'pareto_front.json'}")
+    
     def _save_fitness_history_csv(
         self,
         best_fitness_history: List[float],
-        avg_fitness_history: List[float]
+        avg_fitness_history: List[float],
+        avaliacoes_por_geracao: Optional[List[int]] = None
     ) -> None:
-        """Salva histórico de fitness em formato CSV."""
+        """Salva histórico de fitness (e avaliações acumuladas, se houver) em formato CSV."""
         csv_path = self.run_dir / "fitness_history.csv"
         
         with open(csv_path, "w", encoding="utf-8") as f:
-            f.write("generation,best_fitness,avg_fitness\n")
-            for gen, (best, avg) in enumerate(zip(best_fitness_history, avg_fitness_history), 1):
-                f.write(f"{gen},{best},{avg}\n")
+            if avaliacoes_por_geracao is None:
+                f.write("generation,best_fitness,avg_fitness\n")
+                for gen, (best, avg) in enumerate(zip(best_fitness_history, avg_fitness_history), 1):
+                    f.write(f"{gen},{best},{avg}\n")
+            else:
+                f.write("generation,best_fitness,avg_fitness,evaluations\n")
+                for gen, (best, avg, aval) in enumerate(
+                    zip(best_fitness_history, avg_fitness_history, avaliacoes_por_geracao), 1
+                ):
+                    f.write(f"{gen},{best},{avg},{aval}\n")
     
     def _analyze_convergence(self, best_fitness_history: List[float]) -> Dict[str, Any]:
         """
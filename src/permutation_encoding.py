@@ -0,0 +1,111 @@
+"""
+Codificação por permutação com decodificador guloso.
+
+O genoma é uma ordem de prioridade dos blocos de aulas (a partição de
+block_encoding.py). O decodificador, determinístico, percorre os blocos
+nessa ordem e coloca cada um na primeira posição (dia, horário de início)
+que não choca com as aulas já colocadas do mesmo professor nem do mesmo
+período. Entre as posições sem choque, prefere um dia ainda sem aulas da
+disciplina e em que o período não passe de MAX_AULAS_POR_DIA aulas.
+
+Só quando nenhuma posição livre existe o bloco fica na posição com menos
+choques; nesta instância isso não ocorre, e todo indivíduo é viável por
+construção: o AG busca apenas entre horários sem conflitos. Os operadores
+são os de permutação do DEAP (PMX, crossover ordenado e troca de posições).
+
+Com ocupacao_professor (horários já ocupados por professor, como máscaras de
+bits de bitset.py), as aulas de outra parte do horário contam como choques:
+é assim que a decomposição por período (decomposition.py) resolve um período
+sem conflitar com os professores compartilhados dos demais.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .bitset import bitsets_for
+from .block_encoding import BlockEncoding
+from .config import MAX_AULAS_POR_DIA
+from .models import Disciplina, Slot
+
+
+class PermutationEncoding:
+    """Decodificador guloso de permutações de blocos."""
+    
+    def __init__(
+        self,
+        expanded_disciplines: List[Disciplina],
+        slot_mapping: Dict[int, Slot],
+        max_aulas_dia: int = MAX_AULAS_POR_DIA,
+        ocupacao_professor: Optional[Dict[str, int]] = None
+    ):
+        self.blocos = BlockEncoding(expanded_disciplines, slot_mapping)
+        self.max_aulas_dia = max_aulas_dia
+        self.ocupacao_professor = dict(ocupacao_professor or {})
+        bit_slot = bitsets_for(expanded_disciplines, slot_mapping).bit_slot
+        
+        # Máscara de ocupação e dia de cada posição, por tamanho de bloco
+        self.mascaras: Dict[int, List[int]] = {}
+        self.dias: Dict[int, List[int]] = {}
+        for tamanho, posicoes in self.blocos.posicoes.items():
+            mascaras = []
+            for slots in posicoes:
+                mascara = 0
+                for slot_id in slots:
+                    mascara |= bit_slot[slot_id]
+                mascaras.append(mascara)
+            self.mascaras[tamanho] = mascaras
+            self.dias[tamanho] = [dia for dia, _ in self.blocos.inicios[tamanho]]
+        
+        # Chaves de professor, turma (curso, período) e disciplina de cada bloco
+        self.chaves: List[Tuple[str, Tuple[str, int], str]] = [
+            (disc.professor, disc.turma, disc.codigo) for disc in self.blocos.disciplinas
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.blocos)
+    
+    def posicionar(self, ordem: List[int]) -> List[int]:
+        """Cromossomo de blocos (posição de cada bloco) obtido da ordem de prioridade."""
+        tamanhos = self.blocos.tamanhos
+        professor: Dict[str, int] = dict(self.ocupacao_professor)
+        periodo: Dict[Tuple[str, int], int] = {}
+        dias_disciplina: Dict[str, int] = {}
+        carga: Dict[Tuple[Tuple[str, int], int], int] = {}
+        genes = [0] * len(self)
+        
+        for b in ordem:
+            tamanho = tamanhos[b]
+            prof, per, codigo = self.chaves[b]
+            ocupado_prof = professor.get(prof, 0)
+            ocupado_per = periodo.get(per, 0)
+            dias_usados = dias_disciplina.get(codigo, 0)
+            dias = self.dias[tamanho]
+            
+            livre, escolhida, menor = None, None, None
+            for p, mascara in enumerate(self.mascaras[tamanho]):
+                choques = (mascara & ocupado_prof).bit_count() + (mascara & ocupado_per).bit_count()
+                if choques:
+                    if menor is None or choques < menor[0]:
+                        menor = (choques, p)
+                    continue
+                dia = dias[p]
+                if not dias_usados >> dia & 1 and carga.get((per, dia), 0) + tamanho <= self.max_aulas_dia:
+                    escolhida = p
+                    break
+                if livre is None:
+                    livre = p
+            if escolhida is None:
+                escolhida = livre if livre is not None else menor[1]
+            
+            mascara = self.mascaras[tamanho][escolhida]
+            dia = dias[escolhida]
+            professor[prof] = ocupado_prof | mascara
+            periodo[per] = ocupado_per | mascara
+            dias_disciplina[codigo] = dias_usados | (1 << dia)
+            carga[(per, dia)] = carga.get((per, dia), 0) + tamanho
+            genes[b] = escolhida
+        
+        return genes
+    
+    def decodificar(self, ordem: List[int]) -> List[int]:
+        """Cromossomo de slot_ids (ordem de expanded_disciplines) de uma permutação."""
+        return self.blocos.decodificar(self.posicionar(ordem))
@@ -0,0 +1,120 @@
+"""
+Representação compilada de uma instância do problema.
+
+A instância compilada guarda, além das listas de disciplinas e slots, arrays
+numpy com os índices usados pela avaliação (disciplina, período e professor de
+cada gene). Ela é montada incrementalmente pelo ProblemBuilder, de forma que o
+leitor de CSV possa alimentá-la linha a linha.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .models import Disciplina, Slot
+from .time_grid import TimeGrid, time_grid_for
+
+
+@dataclass
+class CompiledProblem:
+    """Instância do problema compilada em arrays de índices."""
+    disciplinas: List[Disciplina]
+    slots: List[Slot]
+    periodos: List[Tuple[str, int]]     # turmas (curso, período) distintas, na ordem de aparição
+    professores: List[str]              # professores distintos, na ordem de aparição
+    gene_disciplina: np.ndarray         # índice da disciplina de cada gene
+    disciplina_periodo: np.ndarray      # índice (em periodos) da turma de cada disciplina
+    disciplina_professor: np.ndarray    # índice (em professores) do professor de cada disciplina
+    slot_ids: np.ndarray                # slot_id de cada slot, na ordem do CSV
+    _time_grid: Optional[TimeGrid] = field(default=None, repr=False, compare=False)
+    _expanded: Optional[List[Disciplina]] = field(default=None, repr=False, compare=False)
+    _slot_mapping: Optional[Dict[int, Slot]] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def chromosome_size(self) -> int:
+        """Número de genes do cromossomo (total de aulas semanais)."""
+        return int(self.gene_disciplina.size)
+    
+    @property
+    def expanded_disciplines(self) -> List[Disciplina]:
+        """
+        Lista expandida de disciplinas, na mesma ordem de build_chromosome_template.
+        
+        Construída uma única vez: time_grid_for, bitsets_for e day_patterns_for
+        reconhecem a instância pela identidade desta lista e de slot_mapping.
+        """
+        if self._expanded is None:
+            self._expanded = [self.disciplinas[i] for i in self.gene_disciplina]
+        return self._expanded
+    
+    @property
+    def slot_mapping(self) -> Dict[int, Slot]:
+        """Mapeamento slot_id -> Slot, como em create_slot_mapping (construído uma única vez)."""
+        if self._slot_mapping is None:
+            self._slot_mapping = {s.slot_id: s for s in self.slots}
+        return self._slot_mapping
+    
+    @property
+    def valid_slot_ids(self) -> List[int]:
+        """Lista de slot_ids válidos."""
+        return [int(s) for s in self.slot_ids]
+    
+    @property
+    def time_grid(self) -> TimeGrid:
+        """Grade de tempo (índices de dia e horário) dos slots."""
+        if self._time_grid is None:
+            self._time_grid = time_grid_for(self.slot_mapping)
+        return self._time_grid
+    
+    @property
+    def gene_periodo(self) -> np.ndarray:
+        """Índice da turma (curso, período) de cada gene."""
+        return self.disciplina_periodo[self.gene_disciplina]
+    
+    @property
+    def gene_professor(self) -> np.ndarray:
+        """Índice do professor de cada gene."""
+        return self.disciplina_professor[self.gene_disciplina]
+
+
+class ProblemBuilder:
+    """Monta um CompiledProblem a partir de disciplinas e slots recebidos um a um."""
+    
+    def __init__(self):
+        self.disciplinas: List[Disciplina] = []
+        self.slots: List[Slot] = []
+        self._periodo_idx: Dict[Tuple[str, int], int] = {}
+        self._professor_idx: Dict[str, int] = {}
+        self._gene_disciplina: List[int] = []
+        self._disciplina_periodo: List[int] = []
+        self._disciplina_professor: List[int] = []
+    
+    def add_disciplina(self, disc: Disciplina) -> None:
+        """Adiciona uma disciplina e expande seus genes."""
+        indice = len(self.disciplinas)
+        self.disciplinas.append(disc)
+        self._gene_disciplina.extend([indice] * disc.aulas_semanais)
+        self._disciplina_periodo.append(
+            self._periodo_idx.setdefault(disc.turma, len(self._periodo_idx))
+        )
+        self._disciplina_professor.append(
+            self._professor_idx.setdefault(disc.professor, len(self._professor_idx))
+        )
+    
+    def add_slot(self, slot: Slot) -> None:
+        """Adiciona um slot de horário."""
+        self.slots.append(slot)
+    
+    def build(self) -> CompiledProblem:
+        """Gera a instância compilada com os arrays de índices."""
+        return CompiledProblem(
+            disciplinas=self.disciplinas,
+            slots=self.slots,
+            periodos=list(self._periodo_idx),
+            professores=list(self._professor_idx),
+            gene_disciplina=np.array(self._gene_disciplina, dtype=np.int32),
+            disciplina_periodo=np.array(self._disciplina_periodo, dtype=np.int32),
+            disciplina_professor=np.array(self._disciplina_professor, dtype=np.int32),
+            slot_ids=np.array([s.slot_id for s in self.slots], dtype=np.int32),
+        )
@@ -0,0 +1,243 @@
+"""
+Reclassificação de execuções salvas com outros pesos.
+
+O fitness é o produto escalar do vetor de características de um horário
+(contagens brutas, ver vetor_caracteristicas em fitness.py) com os pesos de
+config.py. Cada execução grava em features.npz os vetores do arquivo de elite
+e da população final; com eles, um novo conjunto de pesos reclassifica todos
+os horários da execução em milissegundos, sem reexecutar o AG nem reavaliar
+horários.
+
+Apenas os pesos (PESO_*) podem ser alterados: limites como
+MAX_AULAS_SEQUENCIAIS_IDEAL, THRESHOLD_SALTO_TEMPORAL e MAX_AULAS_POR_DIA
+mudam as próprias contagens e exigem reavaliar os horários.
+
+Uso:
+    python -m src.reweight outputs/run_X PESO_LACUNA=60 PESO_FRAGMENTACAO=250 --top 10
+"""
+
+import argparse
+import json
+import pickle
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .models import Disciplina, Slot
+from .fitness import (
+    BASE_SCORE,
+    CARACTERISTICAS,
+    RAZOES,
+    PESOS_PADRAO,
+    nomes_caracteristicas,
+    vetor_caracteristicas
+)
+
+# Verificar se rich está disponível
+try:
+    from rich.console import Console
+    console = Console()
+    HAS_RICH = True
+except ImportError:
+    HAS_RICH = False
+
+ARQUIVO_CARACTERISTICAS = "features.npz"
+
+
+def matriz_caracteristicas(
+    individuos: List[List[int]],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot]
+) -> np.ndarray:
+    """Vetores de características dos indivíduos, um por linha."""
+    largura = len(nomes_caracteristicas(expanded_disciplines))
+    if not individuos:
+        return np.zeros((0, largura))
+    return np.array([vetor_caracteristicas(ind, expanded_disciplines, slot_mapping)
+                     for ind in individuos], dtype=np.float64)
+
+
+def pontuar_lote(matriz: np.ndarray, pesos: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Fitness de cada linha de uma matriz de características (vetorizado).
+    
+    Mesmo resultado de pontuar (fitness.py) linha a linha; pesos ausentes
+    usam PESOS_PADRAO.
+    """
+    pesos = {**PESOS_PADRAO, **(pesos or {})}
+    n = len(CARACTERISTICAS)
+    num_disciplinas = (matriz.shape[1] - n) // len(RAZOES)
+    
+    lineares = np.array([sinal * pesos[peso] for _, peso, sinal in CARACTERISTICAS], dtype=np.float64)
+    scores = BASE_SCORE + matriz[:, :n] @ lineares
+    for k, (_, peso) in enumerate(RAZOES):
+        razoes = matriz[:, n + k * num_disciplinas:n + (k + 1) * num_disciplinas]
+        # int() das razões positivas, disciplina a disciplina
+        scores -= np.trunc(razoes * pesos[peso]).sum(axis=1)
+    return scores
+
+
+def _cromossomos(individuos: List[List[int]], tamanho: int) -> np.ndarray:
+    """Cromossomos como matriz de inteiros (vazia para modos sem população)."""
+    return np.array(individuos, dtype=np.int64).reshape(len(individuos), tamanho)
+
+
+def salvar_caracteristicas(
+    run_dir: Path,
+    elite: List[List[int]],
+    populacao: List[List[int]],
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    pesos: Optional[Dict[str, float]] = None,
+    elite_vetores: Optional[List[tuple]] = None
+) -> Path:
+    """
+    Grava features.npz com os vetores do arquivo de elite e da população.
+    
+    Modos sem população (sa, tabu, cpsat, decomposicao) gravam a população
+    vazia; o arquivo de elite basta para reclassificar a execução.
+    
+    elite_vetores reaproveita os vetores do arquivo de elite já calculados
+    (os mesmos usados no detalhamento dos ranks exportados).
+    
+    Returns:
+        Caminho do arquivo gravado
+    """
+    pesos = {**PESOS_PADRAO, **(pesos or {})}
+    if elite_vetores is None:
+        matriz_elite = matriz_caracteristicas(elite, expanded_disciplines, slot_mapping)
+    else:
+        matriz_elite = np.array(elite_vetores, dtype=np.float64).reshape(
+            len(elite_vetores), len(nomes_caracteristicas(expanded_disciplines)))
+    caminho = Path(run_dir) / ARQUIVO_CARACTERISTICAS
+    np.savez_compressed(
+        caminho,
+        nomes=np.array(nomes_caracteristicas(expanded_disciplines)),
+        pesos_nomes=np.array(list(pesos)),
+        pesos_valores=np.array(list(pesos.values()), dtype=np.float64),
+        elite=_cromossomos(elite, len(expanded_disciplines)),
+        elite_vetores=matriz_elite,
+        populacao=_cromossomos(populacao, len(expanded_disciplines)),
+        populacao_vetores=matriz_caracteristicas(populacao, expanded_disciplines, slot_mapping),
+    )
+    return caminho
+
+
+def carregar_caracteristicas(caminho: Path) -> Dict[str, np.ndarray]:
+    """
+    Lê os vetores de uma execução (diretório, features.npz ou top_individuals.pkl).
+    
+    Execuções sem features.npz (anteriores a ele) têm os vetores do arquivo
+    de elite calculados a partir de top_individuals.pkl, sem a população.
+    """
+    caminho = Path(caminho)
+    if caminho.is_dir():
+        npz = caminho / ARQUIVO_CARACTERISTICAS
+        caminho = npz if npz.exists() else caminho / "top_individuals.pkl"
+    
+    if caminho.suffix == ".npz":
+        with np.load(caminho, allow_pickle=False) as dados:
+            return {chave: dados[chave] for chave in dados.files}
+    
+    with open(caminho, "rb") as f:
+        dados = pickle.load(f)
+    elite = [list(ind) for ind in dados["top_individuals"]]
+    return {
+        "nomes": np.array(nomes_caracteristicas(dados["expanded_disciplines"])),
+        "pesos_nomes": np.array(list(PESOS_PADRAO)),
+        "pesos_valores": np.array(list(PESOS_PADRAO.values()), dtype=np.float64),
+        "elite": np.array(elite, dtype=np.int64).reshape(len(elite), -1),
+        "elite_vetores": matriz_caracteristicas(elite, dados["expanded_disciplines"], dados["slot_mapping"]),
+        "populacao": np.zeros((0, len(elite[0]) if elite else 0), dtype=np.int64),
+        "populacao_vetores": np.zeros((0, len(nomes_caracteristicas(dados["expanded_disciplines"])))),
+    }
+
+
+def reranquear(caminho: Path, pesos: Dict[str, float]) -> List[Dict]:
+    """
+    Reclassifica os horários de uma execução salva com novos pesos.
+    
+    Args:
+        caminho: Diretório da execução, features.npz ou top_individuals.pkl
+        pesos: Pesos alterados (nome da constante -> valor); os demais usam
+            os pesos gravados na execução
+    
+    Returns:
+        Horários em ordem decrescente do novo fitness, cada um com origem
+        ("elite" ou "populacao"), posição na origem, fitness original,
+        novo fitness e cromossomo
+    """
+    desconhecidos = set(pesos) - set(PESOS_PADRAO)
+    if desconhecidos:
+        raise ValueError(f"Pesos desconhecidos: {sorted(desconhecidos)}. Opções: {list(PESOS_PADRAO)}")
+    
+    dados = carregar_caracteristicas(caminho)
+    originais = dict(zip(dados["pesos_nomes"].tolist(), dados["pesos_valores"].tolist()))
+    novos = {**originais, **pesos}
+    
+    resultado = []
+    for origem in ("elite", "populacao"):
+        vetores = dados[f"{origem}_vetores"]
+        if not len(vetores):
+            continue
+        antes = pontuar_lote(vetores, originais)
+        depois = pontuar_lote(vetores, novos)
+        for i, cromossomo in enumerate(dados[origem]):
+            resultado.append({
+                "origem": origem,
+                "indice": i,
+                "fitness_original": float(antes[i]),
+                "fitness": float(depois[i]),
+                "chromosome": cromossomo.tolist(),
+            })
+    
+    resultado.sort(key=lambda r: r["fitness"], reverse=True)
+    return resultado
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Reclassifica uma execução salva com outros pesos")
+    parser.add_argument("execucao", type=Path,
+                        help="Diretório da execução (outputs/run_*), features.npz ou top_individuals.pkl")
+    parser.add_argument("pesos", nargs="*", metavar="PESO=VALOR",
+                        help=f"Pesos alterados, ex.: PESO_LACUNA=60 (opções: {', '.join(PESOS_PADRAO)})")
+    parser.add_argument("--top", type=int, default=10, help="Horários exibidos (padrão: 10)")
+    parser.add_argument("--json", type=Path, default=None, help="Grava a classificação completa em JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    """Reclassifica uma execução e exibe os melhores horários."""
+    args = _parse_args(argv)
+    pesos = {}
+    for item in args.pesos:
+        nome, _, valor = item.partition("=")
+        try:
+            pesos[nome.strip()] = float(valor)
+        except ValueError:
+            sys.exit(f"Peso inválido: {item!r} (use NOME=VALOR)")
+    
+    try:
+        classificacao = reranquear(args.execucao, pesos)
+    except (ValueError, FileNotFoundError) as e:
+        sys.exit(str(e))
+    
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"pesos": pesos, "classificacao": classificacao}, f, indent=2, ensure_ascii=False)
+    
+    titulo = f"Reclassificação de {args.execucao} ({len(classificacao)} horários)"
+    if HAS_RICH:
+        console.print(f"[bold cyan]{titulo}[/bold cyan]")
+    else:
+        print(titulo)
+    for posicao, item in enumerate(classificacao[:args.top], 1):
+        print(f"  {posicao:3d}. {item['origem']:<9} #{item['indice']:<4} "
+              f"fitness {item['fitness']:.0f} (original {item['fitness_original']:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+Escalonador de jobs de otimização com orçamento global de workers.
+
+Vários main.py executados ao mesmo tempo disputam a máquina: cada um cria um
+multiprocessing.Pool com todos os núcleos, e a contenção derruba a vazão
+total. O JobScheduler recebe vários jobs e divide entre eles um orçamento fixo
+de processos de avaliação (ORCAMENTO_WORKERS):
+
+- cada job do AG recebe WORKERS_POR_JOB workers (padrão: orçamento dividido
+  por SERVIDOR_JOBS_SIMULTANEOS); jobs de busca local usam um único processo
+- um job só inicia quando seus workers cabem no orçamento livre; a soma dos
+  workers em execução nunca passa do orçamento
+- a fila é ordenada por prioridade (maior primeiro) e, no empate, por ordem de
+  chegada; o primeiro da fila não é ultrapassado por jobs menores, para que
+  jobs grandes não esperem indefinidamente
+- jobs na fila são cancelados imediatamente; jobs em execução são
+  interrompidos na próxima geração (o pool de avaliação é fechado normalmente)
+- cada job registra o tempo de espera na fila e o tempo de execução
+
+Cada job executa em um processo próprio; progresso e resultado chegam por uma
+fila entre processos. O escalonador é usado pelo serviço HTTP (server.py) e
+pelo benchmark de concorrência (benchmark.py jobs).
+"""
+
+import asyncio
+import heapq
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from . import config
+
+MODOS_SOLVE = ("ga", "sa", "tabu")
+
+# Segundos aguardados após o pedido de cancelamento antes de encerrar o processo
+CARENCIA_CANCELAMENTO = 10.0
+
+
+class JobCancelado(Exception):
+    """Interrompe a otimização de um job cancelado (levantada no callback de progresso)."""
+
+
+@dataclass
+class Job:
+    """Job de otimização submetido ao escalonador."""
+    id: str
+    instancia: str
+    problem_path: str
+    parametros: Dict[str, Any]
+    prioridade: int = 0
+    workers: int = 1
+    status: str = "na_fila"          # na_fila, executando, concluido, erro, cancelado
+    criado: float = field(default_factory=time.time)
+    inicio: Optional[float] = None
+    fim: Optional[float] = None
+    eventos: List[Dict] = field(default_factory=list)
+    resultado: Optional[Dict] = None
+    erro: Optional[str] = None
+    # Sinal trocado a cada mudança, para quem acompanha o progresso
+    sinal: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _processo: Any = field(default=None, repr=False)
+    _cancelar: Any = field(default=None, repr=False)
+    _final: Optional[Dict] = field(default=None, repr=False)
+    _final_recebido: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    
+    @property
+    def terminado(self) -> bool:
+        return self.status in ("concluido", "erro", "cancelado")
+    
+    @property
+    def tempo_espera(self) -> Optional[float]:
+        """Segundos na fila (até o início ou, se cancelado na fila, até o cancelamento)."""
+        fim_espera = self.inicio if self.inicio is not None else self.fim
+        return None if fim_espera is None else fim_espera - self.criado
+    
+    @property
+    def tempo_execucao(self) -> Optional[float]:
+        if self.inicio is None:
+            return None
+        return (self.fim if self.fim is not None else time.time()) - self.inicio
+    
+    def notificar(self) -> None:
+        """Acorda quem aguarda uma mudança do job."""
+        self.sinal.set()
+        self.sinal = asyncio.Event()
+    
+    def resumo(self) -> Dict[str, Any]:
+        """Estado do job (sem o resultado)."""
+        return {
+            "job_id": self.id,
+            "instance": self.instancia,
+            "parameters": self.parametros,
+            "priority": self.prioridade,
+            "workers": self.workers,
+            "status": self.status,
+            "created": self.criado,
+            "started": self.inicio,
+            "finished": self.fim,
+            "queue_wait_seconds": self.tempo_espera,
+            "run_seconds": self.tempo_execucao,
+            "generations_done": len(self.eventos),
+            "last_progress": self.eventos[-1] if self.eventos else None,
+            "error": self.erro,
+        }
+
+
+def _executar_job(job_id: str, problem_path: str, parametros: Dict[str, Any],
+                  num_workers: int, fila, cancelar) -> None:
+    """Executa um job em um processo próprio, enviando progresso e resultado pela fila."""
+    import random
+    from pathlib import Path
+    import numpy as np
+    from .cache import load_problem
+    from .decoder import decode_schedule, get_fitness_details
+    from .genetic_algorithm import setup_deap_toolbox, run_genetic_algorithm
+    from .local_search import run_local_search
+    
+    def progresso(evento: Dict) -> None:
+        fila.put(("progresso", job_id, evento))
+        if cancelar.is_set():
+            raise JobCancelado()
+    
+    try:
+        problem = load_problem(Path(problem_path))
+        seed = parametros.get("seed", config.RANDOM_SEED)
+        random.seed(seed)
+        np.random.seed(seed)
+        
+        toolbox = setup_deap_toolbox(
+            chromosome_size=problem.chromosome_size,
+            valid_slot_ids=problem.valid_slot_ids,
+            expanded_disciplines=problem.expanded_disciplines,
+            slot_mapping=problem.slot_mapping,
+            disciplinas_unicas=problem.disciplinas,
+            problem_path=Path(problem_path),
+            limite_critico=(None if parametros["mode"] in ("sa", "tabu")
+                            else config.LIMITE_PENALIDADE_CRITICA),
+            representacao="slots" if parametros["mode"] in ("sa", "tabu") else config.REPRESENTACAO
+        )
+        
+        inicio = time.time()
+        if parametros["mode"] in ("sa", "tabu"):
+            _, best_hist, _, top_individuals, top_fitnesses, stats = run_local_search(
+                toolbox,
+                valid_slot_ids=problem.valid_slot_ids,
+                expanded_disciplines=problem.expanded_disciplines,
+                slot_mapping=problem.slot_mapping,
+                metodo=parametros["mode"],
+                num_iteracoes=parametros.get("iterations"),
+                progresso=progresso,
+                verbose=False
+            )
+        else:
+            _, best_hist, _, top_individuals, top_fitnesses, stats = run_genetic_algorithm(
+                toolbox,
+                population_size=parametros.get("population") or config.POPULATION_SIZE,
+                num_generations=parametros.get("generations") or config.NUM_GENERATIONS,
+                estrategia=parametros.get("replacement") or config.ESTRATEGIA_SUBSTITUICAO,
+                progresso=progresso,
+                num_workers=num_workers,
+                verbose=False
+            )
+        tempo = time.time() - inicio
+        
+        melhor = [int(g) for g in top_individuals[0]]
+        fila.put(("concluido", job_id, {
+            "fitness": top_fitnesses[0],
+            "chromosome": melhor,
+            "fitness_details": get_fitness_details(melhor, problem.expanded_disciplines,
+                                                   problem.slot_mapping, problem.disciplinas),
+            "schedule": decode_schedule(melhor, problem.expanded_disciplines, problem.slot_mapping),
+            "top_fitnesses": top_fitnesses,
+            "top_individuals": [[int(g) for g in ind] for ind in top_individuals],
+            "best_fitness_history": best_hist,
+            "total_evaluations": stats["avaliacoes"],
+            "generation_of_best": stats["geracao_melhor"],
+            "execution_time_seconds": tempo,
+        }))
+    except JobCancelado:
+        fila.put(("cancelado", job_id, None))
+    except Exception as e:
+        fila.put(("erro", job_id, f"{type(e).__name__}: {e}"))
+
+
+class JobScheduler:
+    """
+    Fila de jobs com prioridades, cancelamento e orçamento global de workers.
+    
+    Uso (dentro de um event loop):
+        escalonador = JobScheduler(orcamento=8)
+        await escalonador.iniciar()
+        job = escalonador.submeter("inst", problem_path, {"mode": "ga"}, prioridade=1)
+        await escalonador.aguardar(job.id)
+        await escalonador.encerrar()
+    """
+    
+    def __init__(
+        self,
+        orcamento: Optional[int] = config.ORCAMENTO_WORKERS,
+        workers_por_job: Optional[int] = config.WORKERS_POR_JOB,
+        jobs_simultaneos: int = config.SERVIDOR_JOBS_SIMULTANEOS,
+        fila_maxima: int = config.SERVIDOR_FILA_MAXIMA
+    ):
+        self.orcamento = orcamento or os.cpu_count() or 1
+        self.workers_por_job = min(self.orcamento,
+                                   workers_por_job or max(1, self.orcamento // max(1, jobs_simultaneos)))
+        self.fila_maxima = fila_maxima
+        self.em_uso = 0
+        self._jobs: Dict[str, Job] = {}
+        # (-prioridade, ordem de chegada, id do job); cancelados são descartados ao sair
+        self._fila: List[tuple] = []
+        self._ordem = itertools.count()
+        self._mensagens = None
+        self._leitor: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tarefas = set()
+    
+    @property
+    def jobs(self) -> List[Job]:
+        return list(self._jobs.values())
+    
+    @property
+    def na_fila(self) -> int:
+        return sum(job.status == "na_fila" for job in self._jobs.values())
+    
+    @property
+    def executando(self) -> int:
+        return sum(job.status == "executando" for job in self._jobs.values())
+    
+    def job(self, job_id: str) -> Job:
+        """Job pelo id (KeyError se não existir)."""
+        return self._jobs[job_id]
+    
+    async def iniciar(self) -> None:
+        """Inicia a leitura das mensagens dos processos de job."""
+        self._loop = asyncio.get_running_loop()
+        self._mensagens = multiprocessing.Queue()
+        self._leitor = threading.Thread(target=self._ler_mensagens, daemon=True)
+        self._leitor.start()
+    
+    async def encerrar(self) -> None:
+        """Cancela os jobs pendentes e em execução e encerra a leitura das mensagens."""
+        for job in self.jobs:
+            if not job.terminado:
+                self.cancelar(job.id)
+        if self._tarefas:
+            await asyncio.gather(*self._tarefas, return_exceptions=True)
+        self._mensagens.put(None)
+    
+    def submeter(
+        self,
+        instancia: str,
+        problem_path: str,
+        parametros: Dict[str, Any],
+        prioridade: int = 0,
+        workers: Optional[int] = None
+    ) -> Job:
+        """
+        Enfileira um job e inicia os que couberem no orçamento.
+        
+        Raises:
+            ValueError: modo desconhecido
+            OverflowError: fila cheia (fila_maxima jobs aguardando)
+        """
+        if parametros.get("mode") not in MODOS_SOLVE:
+            raise ValueError(f"mode deve ser um de {MODOS_SOLVE}")
+        if self.na_fila >= self.fila_maxima:
+            raise OverflowError(f"Fila cheia ({self.fila_maxima} jobs aguardando)")
+        
+        if parametros["mode"] != "ga":
+            workers = 1
+        workers = min(self.orcamento, max(1, workers or self.workers_por_job))
+        job = Job(id=uuid.uuid4().hex[:12], instancia=instancia, problem_path=str(problem_path),
+                  parametros=parametros, prioridade=prioridade, workers=workers)
+        self._jobs[job.id] = job
+        heapq.heappush(self._fila, (-prioridade, next(self._ordem), job.id))
+        self._despachar()
+        return job
+    
+    def posicao(self, job_id: str) -> Optional[int]:
+        """Posição do job na fila (1 = próximo), ou None se não estiver na fila."""
+        ordem = sorted(e for e in self._fila if self._jobs[e[2]].status == "na_fila")
+        ids = [e[2] for e in ordem]
+        return ids.index(job_id) + 1 if job_id in ids else None
+    
+    def cancelar(self, job_id: str) -> Job:
+        """Cancela um job na fila (imediato) ou em execução (na próxima geração)."""
+        job = self._jobs[job_id]
+        if job.status == "na_fila":
+            job.status = "cancelado"
+            job.fim = time.time()
+            job.notificar()
+            # O job cancelado pode ser o que bloqueava o início dos seguintes
+            self._despachar()
+        elif job.status == "executando" and not job._cancelar.is_set():
+            job._cancelar.set()
+            tarefa = asyncio.ensure_future(self._forcar_cancelamento(job))
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(self._tarefas.discard)
+        return job
+    
+    async def aguardar(self, job_id: str) -> Job:
+        """Aguarda o término do job."""
+        job = self._jobs[job_id]
+        while not job.terminado:
+            await job.sinal.wait()
+        return job
+    
+    def _despachar(self) -> None:
+        """Inicia jobs em ordem de prioridade enquanto couberem no orçamento."""
+        while self._fila:
+            _, _, job_id = self._fila[0]
+            job = self._jobs[job_id]
+            if job.status != "na_fila":
+                heapq.heappop(self._fila)
+                continue
+            if job.workers > self.orcamento - self.em_uso:
+                break
+            heapq.heappop(self._fila)
+            self._iniciar(job)
+    
+    def _iniciar(self, job: Job) -> None:
+        self.em_uso += job.workers
+        job._cancelar = multiprocessing.Event()
+        job._processo = multiprocessing.Process(
+            target=_executar_job,
+            args=(job.id, job.problem_path, job.parametros, job.workers, self._mensagens, job._cancelar)
+        )
+        job.status = "executando"
+        job.inicio = time.time()
+        job._processo.start()
+        job.notificar()
+        tarefa = asyncio.ensure_future(self._acompanhar(job))
+        self._tarefas.add(tarefa)
+        tarefa.add_done_callback(self._tarefas.discard)
+    
+    async def _acompanhar(self, job: Job) -> None:
+        """Aguarda o processo do job, registra o desfecho e libera os workers."""
+        await self._loop.run_in_executor(None, job._processo.join)
+        # A mensagem final pode chegar logo depois do fim do processo
+        try:
+            await asyncio.wait_for(job._final_recebido.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            pass
+        
+        final = job._final or {"tipo": None, "dados": None}
+        tipo, dados = final["tipo"], final["dados"]
+        if job._final is None:
+            job.status = "cancelado" if job._cancelar.is_set() else "erro"
+            job.erro = f"Processo encerrado com código {job._processo.exitcode}"
+        elif tipo == "concluido":
+            job.status, job.resultado = "concluido", dados
+        elif tipo == "cancelado":
+            job.status = "cancelado"
+        else:
+            job.status, job.erro = "erro", dados
+        job.fim = time.time()
+        self.em_uso -= job.workers
+        job.notificar()
+        self._despachar()
+    
+    async def _forcar_cancelamento(self, job: Job) -> None:
+        """Encerra o processo se ele não atender ao cancelamento a tempo."""
+        limite = time.time() + CARENCIA_CANCELAMENTO
+        while time.time() < limite:
+            if job.terminado:
+                return
+            await asyncio.sleep(0.1)
+        if job._processo.is_alive():
+            job._processo.terminate()
+    
+    def _registrar(self, tipo: str, job_id: str, dados: Any) -> None:
+        """Recebe uma mensagem de um processo de job (no event loop)."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        if tipo == "progresso":
+            job.eventos.append(dados)
+        else:
+            job._final = {"tipo": tipo, "dados": dados}
+            job._final_recebido.set()
+        job.notificar()
+    
+    def _ler_mensagens(self) -> None:
+        """Thread que repassa ao event loop as mensagens dos processos."""
+        while True:
+            item = self._mensagens.get()
+            if item is None:
+                break
+            self._loop.call_soon_threadsafe(self._registrar, *item)
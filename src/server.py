@@ -0,0 +1,494 @@
+"""
+Serviço HTTP local (asyncio) para otimização, avaliação e edição de horários.
+
+Ferramentas internas enviam instâncias e acompanham os resultados sem passar
+por main.py e pelos arquivos de outputs/. O servidor usa apenas a biblioteca
+padrão e atende somente conexões locais (SERVIDOR_HOST), sem serviços externos.
+
+Endpoints (JSON; cada conexão atende uma requisição):
+
+    GET    /health                     estado do servidor e da fila
+    POST   /instances                  compila uma instância (csv_dir ou
+                                       disciplinas_csv + horarios_csv) e
+                                       retorna seu id; compilações ficam em cache
+    POST   /solve                      enfileira um job (mode ga/sa/tabu,
+                                       generations, population, iterations,
+                                       replacement, seed, instance, priority,
+                                       workers)
+    GET    /jobs                       lista os jobs
+    GET    /jobs/<id>                  estado do job, tempos de fila e de
+                                       execução (e o resultado, se concluído)
+    DELETE /jobs/<id>                  cancela o job (na fila ou em execução)
+    GET    /jobs/<id>/progress         progresso por geração (NDJSON em streaming)
+    GET    /jobs/<id>/result           resultado do job concluído
+    POST   /evaluate                   fitness, detalhamento e vetor de
+                                       características de um cromossomo
+    POST   /sessions                   abre uma sessão what-if (ver session.py)
+    GET    /sessions/<id>              detalhamento e cromossomo atuais
+    POST   /sessions/<id>/move         {"gene", "slot"}
+    POST   /sessions/<id>/swap         {"g1", "g2"}
+    POST   /sessions/<id>/undo
+    DELETE /sessions/<id>
+
+A avaliação e as sessões recalculam o fitness em threads (run_in_executor),
+sem bloquear as demais conexões. Até SERVIDOR_SESSOES_MAXIMAS sessões ficam
+abertas; ao abrir outra, a usada há mais tempo é fechada.
+
+Os jobs são executados pelo JobScheduler (ver scheduler.py), que divide um
+orçamento global de workers (ORCAMENTO_WORKERS) entre os jobs em execução;
+os demais aguardam, por prioridade, em uma fila de até SERVIDOR_FILA_MAXIMA
+jobs. O progresso de cada geração chega ao servidor por uma fila entre
+processos.
+
+Uso:
+    python -m src.server --port 8765 --jobs 2 --budget 8
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import uuid
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import config
+from .problem import CompiledProblem
+from .scheduler import MODOS_SOLVE, Job, JobScheduler
+
+# Verificar se rich está disponível
+try:
+    from rich.console import Console
+    console = Console()
+    HAS_RICH = True
+except ImportError:
+    HAS_RICH = False
+
+
+class ErroHTTP(Exception):
+    """Erro de requisição, respondido com o status e a mensagem em JSON."""
+    
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+def _json_default(valor):
+    """Converte escalares numpy e outros valores não serializáveis."""
+    if hasattr(valor, "item"):
+        return valor.item()
+    if hasattr(valor, "__dict__"):
+        return vars(valor)
+    raise TypeError(f"Valor não serializável: {valor!r}")
+
+
+def _codificar(dados: Any) -> bytes:
+    return json.dumps(dados, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _avaliar(problem: CompiledProblem, cromossomo: List[int]) -> Dict:
+    """Fitness, detalhamento, vetor de características e horário de um cromossomo."""
+    from .fitness import nomes_caracteristicas, pontuar, vetor_caracteristicas
+    from .decoder import decode_schedule, get_fitness_details
+    
+    args = (cromossomo, problem.expanded_disciplines, problem.slot_mapping)
+    vetor = vetor_caracteristicas(*args)
+    return {
+        "fitness": pontuar(vetor),
+        "fitness_details": get_fitness_details(*args, problem.disciplinas),
+        "features": dict(zip(nomes_caracteristicas(problem.expanded_disciplines), vetor)),
+        "schedule": decode_schedule(*args),
+    }
+
+
+class ScheduleServer:
+    """Servidor HTTP com fila de jobs, instâncias compiladas em cache e sessões what-if."""
+    
+    MOTIVOS = {200: "OK", 201: "Created", 202: "Accepted", 400: "Bad Request",
+               404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+               413: "Payload Too Large", 500: "Internal Server Error",
+               503: "Service Unavailable"}
+    
+    def __init__(
+        self,
+        host: str = config.SERVIDOR_HOST,
+        porta: int = config.SERVIDOR_PORTA,
+        jobs_simultaneos: int = config.SERVIDOR_JOBS_SIMULTANEOS,
+        fila_maxima: int = config.SERVIDOR_FILA_MAXIMA,
+        orcamento: Optional[int] = config.ORCAMENTO_WORKERS,
+        csv_dir: Path = Path("CSVs"),
+        sessoes_maximas: int = config.SERVIDOR_SESSOES_MAXIMAS
+    ):
+        self.host = host
+        self.porta = porta
+        self.csv_dir = Path(csv_dir)
+        self.escalonador = JobScheduler(orcamento=orcamento, jobs_simultaneos=jobs_simultaneos,
+                                        fila_maxima=fila_maxima)
+        
+        # id da instância -> (instância compilada, caminho do cache)
+        self._instancias: Dict[str, Tuple[CompiledProblem, Path]] = {}
+        self._instancia_padrao: Optional[str] = None
+        # id da sessão -> (sessão, instância, trava), da usada há mais tempo à mais recente
+        self._sessoes: "OrderedDict[str, Tuple[Any, str, asyncio.Lock]]" = OrderedDict()
+        self.sessoes_maximas = sessoes_maximas
+        # Sinalizado quando o servidor passa a aceitar conexões (com porta 0,
+        # self.porta recebe a porta escolhida pelo sistema)
+        self.pronto = asyncio.Event()
+    
+    @staticmethod
+    async def _em_thread(funcao, *args):
+        """Executa funcao(*args) no executor padrão, sem bloquear o laço de eventos."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(funcao, *args))
+    
+    # ------------------------------------------------------------------
+    # Instâncias compiladas
+    # ------------------------------------------------------------------
+    
+    async def _compilar(self, csv_dir: Path) -> str:
+        """Compila (ou abre do cache) a instância de csv_dir e retorna seu id."""
+        from .cache import load_cached_problem
+        
+        loop = asyncio.get_running_loop()
+        problem, path, _ = await loop.run_in_executor(None, load_cached_problem, Path(csv_dir))
+        instancia = path.name
+        self._instancias.setdefault(instancia, (problem, path))
+        return instancia
+    
+    async def _instancia(self, dados: Dict) -> Tuple[str, CompiledProblem, Path]:
+        """Instância indicada na requisição (padrão: os CSVs do servidor)."""
+        instancia = dados.get("instance")
+        if instancia is None:
+            if self._instancia_padrao is None:
+                self._instancia_padrao = await self._compilar(self.csv_dir)
+            instancia = self._instancia_padrao
+        if instancia not in self._instancias:
+            raise ErroHTTP(404, f"Instância desconhecida: {instancia}")
+        problem, path = self._instancias[instancia]
+        return instancia, problem, path
+    
+    async def _criar_instancia(self, dados: Dict) -> Dict:
+        if "disciplinas_csv" in dados or "horarios_csv" in dados:
+            try:
+                conteudos = {"disciplinas.csv": dados["disciplinas_csv"],
+                             "horarios.csv": dados["horarios_csv"]}
+            except KeyError as e:
+                raise ErroHTTP(400, f"Campo obrigatório ausente: {e.args[0]}")
+            # Os CSVs enviados são gravados em um diretório identificado pelo conteúdo
+            h = hashlib.sha256()
+            for nome in sorted(conteudos):
+                h.update(nome.encode("utf-8"))
+                h.update(conteudos[nome].encode("utf-8"))
+            csv_dir = Path(config.CACHE_DIR) / "entradas" / h.hexdigest()[:16]
+            csv_dir.mkdir(parents=True, exist_ok=True)
+            for nome, conteudo in conteudos.items():
+                (csv_dir / nome).write_text(conteudo, encoding="utf-8")
+        else:
+            csv_dir = Path(dados.get("csv_dir", self.csv_dir))
+            if not csv_dir.is_dir():
+                raise ErroHTTP(400, f"Diretório de CSVs inexistente: {csv_dir}")
+        
+        try:
+            instancia = await self._compilar(csv_dir)
+        except (ValueError, KeyError, FileNotFoundError) as e:
+            raise ErroHTTP(400, f"Instância inválida: {e}")
+        problem, _ = self._instancias[instancia]
+        return {
+            "instance": instancia,
+            "disciplinas": len(problem.disciplinas),
+            "slots": len(problem.slots),
+            "genes": problem.chromosome_size,
+        }
+    
+    @staticmethod
+    def _cromossomo(dados: Dict, problem: CompiledProblem) -> List[int]:
+        cromossomo = dados.get("chromosome")
+        if (not isinstance(cromossomo, list) or len(cromossomo) != problem.chromosome_size
+                or not all(isinstance(g, int) for g in cromossomo)):
+            raise ErroHTTP(400, f"chromosome deve ser uma lista de {problem.chromosome_size} inteiros")
+        invalidos = sorted(set(cromossomo) - set(problem.valid_slot_ids))
+        if invalidos:
+            raise ErroHTTP(400, f"chromosome contém slot_ids inexistentes: {invalidos}")
+        return cromossomo
+    
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+    
+    async def _submeter(self, dados: Dict) -> Dict:
+        from .genetic_algorithm import ESTRATEGIAS_SUBSTITUICAO
+        
+        modo = dados.get("mode", "ga")
+        if modo not in MODOS_SOLVE:
+            raise ErroHTTP(400, f"mode deve ser um de {MODOS_SOLVE}")
+        replacement = dados.get("replacement")
+        if replacement is not None and replacement not in ESTRATEGIAS_SUBSTITUICAO:
+            raise ErroHTTP(400, f"replacement deve ser um de {ESTRATEGIAS_SUBSTITUICAO}")
+        parametros = {"mode": modo}
+        for chave in ("generations", "population", "iterations", "seed"):
+            valor = dados.get(chave)
+            if valor is not None:
+                if not isinstance(valor, int) or (valor <= 0 and chave != "seed"):
+                    raise ErroHTTP(400, f"{chave} deve ser um inteiro positivo")
+                parametros[chave] = valor
+        if replacement is not None:
+            parametros["replacement"] = replacement
+        prioridade = dados.get("priority", 0)
+        workers = dados.get("workers")
+        if not isinstance(prioridade, int):
+            raise ErroHTTP(400, "priority deve ser um inteiro")
+        if workers is not None and (not isinstance(workers, int) or workers <= 0):
+            raise ErroHTTP(400, "workers deve ser um inteiro positivo")
+        
+        instancia, _, path = await self._instancia(dados)
+        try:
+            job = self.escalonador.submeter(instancia, str(path), parametros,
+                                            prioridade=prioridade, workers=workers)
+        except OverflowError as e:
+            raise ErroHTTP(503, str(e))
+        return {"job_id": job.id, "status": job.status, "priority": job.prioridade,
+                "workers": job.workers, "queue_position": self.escalonador.posicao(job.id)}
+    
+    def _job(self, job_id: str) -> Job:
+        try:
+            return self.escalonador.job(job_id)
+        except KeyError:
+            raise ErroHTTP(404, f"Job desconhecido: {job_id}")
+    
+    async def _transmitir_progresso(self, writer: asyncio.StreamWriter, job: Job) -> None:
+        """Envia os eventos do job em NDJSON (chunked) até ele terminar."""
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                     b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+        enviados = 0
+        while True:
+            sinal = job.sinal
+            terminado = job.terminado
+            for evento in job.eventos[enviados:]:
+                linha = _codificar(evento) + b"\n"
+                writer.write(f"{len(linha):x}\r\n".encode() + linha + b"\r\n")
+            enviados = len(job.eventos)
+            if terminado:
+                linha = _codificar({"status": job.status, "error": job.erro}) + b"\n"
+                writer.write(f"{len(linha):x}\r\n".encode() + linha + b"\r\n0\r\n\r\n")
+                await writer.drain()
+                return
+            await writer.drain()
+            await sinal.wait()
+    
+    # ------------------------------------------------------------------
+    # Sessões what-if
+    # ------------------------------------------------------------------
+    
+    def _sessao(self, sessao_id: str) -> Tuple[Any, asyncio.Lock]:
+        if sessao_id not in self._sessoes:
+            raise ErroHTTP(404, f"Sessão desconhecida: {sessao_id}")
+        self._sessoes.move_to_end(sessao_id)
+        sessao, _, trava = self._sessoes[sessao_id]
+        return sessao, trava
+    
+    @staticmethod
+    def _estado_sessao(sessao_id: str, sessao, detalhes: Dict) -> Dict:
+        return {"session_id": sessao_id, "score": sessao.score, "fitness_details": detalhes,
+                "chromosome": sessao.chromosome, "undo_available": len(sessao)}
+    
+    async def _rota_sessoes(self, metodo: str, partes: List[str], dados: Dict) -> Tuple[int, Dict]:
+        from .session import ScheduleSession
+        
+        if len(partes) == 1:
+            if metodo != "POST":
+                raise ErroHTTP(405, "Use POST /sessions")
+            instancia, problem, _ = await self._instancia(dados)
+            sessao = await self._em_thread(ScheduleSession, self._cromossomo(dados, problem),
+                                           problem.expanded_disciplines, problem.slot_mapping)
+            detalhes = await self._em_thread(sessao.details)
+            # Fecha a sessão usada há mais tempo
+            while len(self._sessoes) >= self.sessoes_maximas:
+                self._sessoes.popitem(last=False)
+            sessao_id = uuid.uuid4().hex[:12]
+            self._sessoes[sessao_id] = (sessao, instancia, asyncio.Lock())
+            return 201, self._estado_sessao(sessao_id, sessao, detalhes)
+        
+        sessao_id = partes[1]
+        sessao, trava = self._sessao(sessao_id)
+        acao = partes[2] if len(partes) > 2 else None
+        try:
+            if acao is None and metodo == "GET":
+                operacao = sessao.details
+            elif acao is None and metodo == "DELETE":
+                del self._sessoes[sessao_id]
+                return 200, {"session_id": sessao_id, "deleted": True}
+            elif acao == "move" and metodo == "POST":
+                operacao = partial(sessao.move, int(dados["gene"]), int(dados["slot"]))
+            elif acao == "swap" and metodo == "POST":
+                operacao = partial(sessao.swap, int(dados["g1"]), int(dados["g2"]))
+            elif acao == "undo" and metodo == "POST":
+                operacao = sessao.undo
+            else:
+                raise ErroHTTP(404, "Rota desconhecida")
+            # A trava ordena as requisições concorrentes de uma mesma sessão
+            async with trava:
+                detalhes = await self._em_thread(operacao)
+                return 200, self._estado_sessao(sessao_id, sessao, detalhes)
+        except KeyError as e:
+            raise ErroHTTP(400, f"Campo obrigatório ausente: {e.args[0]}")
+        except (IndexError, ValueError, TypeError) as e:
+            raise ErroHTTP(400, str(e))
+    
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    
+    async def _rotear(self, metodo: str, partes: List[str], dados: Dict,
+                      writer: asyncio.StreamWriter) -> Optional[Tuple[int, Any]]:
+        """Executa a rota; retorna (status, corpo) ou None se a resposta já foi enviada."""
+        rota = partes[0] if partes else ""
+        
+        if rota == "health" and metodo == "GET":
+            escalonador = self.escalonador
+            return 200, {"status": "ok", "queued": escalonador.na_fila,
+                         "running": escalonador.executando,
+                         "worker_budget": escalonador.orcamento,
+                         "workers_in_use": escalonador.em_uso,
+                         "workers_per_job": escalonador.workers_por_job,
+                         "instances": sorted(self._instancias)}
+        
+        if rota == "instances" and metodo == "POST" and len(partes) == 1:
+            return 201, await self._criar_instancia(dados)
+        
+        if rota == "solve" and metodo == "POST" and len(partes) == 1:
+            return 202, await self._submeter(dados)
+        
+        if rota == "jobs" and metodo == "DELETE" and len(partes) == 2:
+            job = self.escalonador.cancelar(self._job(partes[1]).id)
+            return 200, job.resumo()
+        
+        if rota == "jobs" and metodo == "GET":
+            if len(partes) == 1:
+                return 200, [job.resumo() for job in self.escalonador.jobs]
+            job = self._job(partes[1])
+            if len(partes) == 2:
+                corpo = job.resumo()
+                if job.status == "concluido":
+                    corpo["result"] = job.resultado
+                return 200, corpo
+            if partes[2] == "result":
+                if job.status != "concluido":
+                    raise ErroHTTP(409, f"Job {job.id} ainda não concluído ({job.status})")
+                return 200, job.resultado
+            if partes[2] == "progress":
+                await self._transmitir_progresso(writer, job)
+                return None
+        
+        if rota == "evaluate" and metodo == "POST" and len(partes) == 1:
+            _, problem, _ = await self._instancia(dados)
+            cromossomo = self._cromossomo(dados, problem)
+            return 200, await self._em_thread(_avaliar, problem, cromossomo)
+        
+        if rota == "sessions":
+            return await self._rota_sessoes(metodo, partes, dados)
+        
+        raise ErroHTTP(404, f"Rota desconhecida: {metodo} /{'/'.join(partes)}")
+    
+    async def _responder(self, writer: asyncio.StreamWriter, status: int, corpo: Any) -> None:
+        dados = _codificar(corpo)
+        writer.write(
+            f"HTTP/1.1 {status} {self.MOTIVOS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(dados)}\r\nConnection: close\r\n\r\n".encode("latin-1") + dados
+        )
+        await writer.drain()
+    
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Lê uma requisição HTTP/1.1, executa a rota e responde."""
+        try:
+            linha = await reader.readline()
+            if not linha:
+                return
+            try:
+                metodo, alvo, _ = linha.decode("latin-1").split(" ", 2)
+                cabecalhos = {}
+                while True:
+                    linha = await reader.readline()
+                    if linha in (b"\r\n", b"\n", b""):
+                        break
+                    nome, _, valor = linha.decode("latin-1").partition(":")
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+                tamanho = int(cabecalhos.get("content-length", 0))
+                if tamanho > config.SERVIDOR_CORPO_MAXIMO:
+                    raise ErroHTTP(413, f"Corpo maior que {config.SERVIDOR_CORPO_MAXIMO} bytes")
+                corpo = await reader.readexactly(tamanho) if tamanho else b""
+                dados = json.loads(corpo) if corpo else {}
+                if not isinstance(dados, dict):
+                    raise ErroHTTP(400, "O corpo deve ser um objeto JSON")
+            except (ValueError, asyncio.IncompleteReadError) as e:
+                raise ErroHTTP(400, f"Requisição inválida: {e}")
+            
+            partes = [p for p in alvo.split("?", 1)[0].split("/") if p]
+            resposta = await self._rotear(metodo.upper(), partes, dados, writer)
+            if resposta is not None:
+                await self._responder(writer, *resposta)
+        except ErroHTTP as e:
+            await self._responder(writer, e.status, {"error": e.mensagem})
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            await self._responder(writer, 500, {"error": f"{type(e).__name__}: {e}"})
+        finally:
+            writer.close()
+    
+    async def executar(self) -> None:
+        """Inicia o escalonador e o servidor, e atende até ser interrompido."""
+        await self.escalonador.iniciar()
+        servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = servidor.sockets[0].getsockname()[1]
+        escalonador = self.escalonador
+        mensagem = (f"Servidor em http://{self.host}:{self.porta} "
+                    f"(orçamento de {escalonador.orcamento} workers, {escalonador.workers_por_job} "
+                    f"por job, fila de {escalonador.fila_maxima})")
+        if HAS_RICH:
+            console.print(f"[bold cyan]{mensagem}[/bold cyan]")
+        else:
+            print(mensagem)
+        
+        try:
+            async with servidor:
+                self.pronto.set()
+                await servidor.serve_forever()
+        finally:
+            await escalonador.encerrar()
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Serviço HTTP local do gerador de horários")
+    parser.add_argument("--host", default=config.SERVIDOR_HOST, help="Endereço de escuta")
+    parser.add_argument("--port", type=int, default=config.SERVIDOR_PORTA, help="Porta de escuta")
+    parser.add_argument("--jobs", type=int, default=config.SERVIDOR_JOBS_SIMULTANEOS,
+                        help="Jobs que dividem o orçamento de workers (padrão de workers por job)")
+    parser.add_argument("--budget", type=int, default=config.ORCAMENTO_WORKERS,
+                        help="Processos de avaliação somados entre todos os jobs (padrão: número de CPUs)")
+    parser.add_argument("--queue", type=int, default=config.SERVIDOR_FILA_MAXIMA,
+                        help="Jobs aguardando execução antes de recusar novos (HTTP 503)")
+    parser.add_argument("--csv-dir", default="CSVs", help="Instância padrão (diretório dos CSVs)")
+    parser.add_argument("--sessions", type=int, default=config.SERVIDOR_SESSOES_MAXIMAS,
+                        help="Sessões what-if abertas (ao abrir outra, fecha a usada há mais tempo)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    """Executa o servidor até Ctrl+C."""
+    args = _parse_args(argv)
+    servidor = ScheduleServer(host=args.host, porta=args.port, jobs_simultaneos=args.jobs,
+                              fila_maxima=args.queue, orcamento=args.budget,
+                              csv_dir=Path(args.csv_dir), sessoes_maximas=args.sessions)
+    try:
+        asyncio.run(servidor.executar())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
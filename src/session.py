@@ -0,0 +1,126 @@
+"""
+Sessão de edição interativa de um horário (what-if).
+
+Para que a coordenação arraste uma aula para outro slot e veja o impacto no
+fitness imediatamente, a sessão mantém os índices de ocupação de um
+cromossomo (via DeltaEvaluator, ver delta.py) e devolve, a cada movimento ou
+troca, o detalhamento com as mesmas chaves de get_fitness_details, sem
+reavaliar o horário inteiro. Cada alteração pode ser desfeita.
+
+Uso:
+    sessao = ScheduleSession(individual, expanded_disciplines, slot_mapping)
+    detalhes = sessao.move(3, 17)     # gene 3 para o slot 17
+    detalhes = sessao.swap(3, 40)     # troca os slots dos genes 3 e 40
+    detalhes = sessao.undo()          # desfaz a troca
+"""
+
+from typing import Dict, List, Tuple
+
+from .models import Disciplina, Slot
+from .delta import COMPONENTES_DISCIPLINA, DeltaEvaluator
+from .config import BASE_SCORE
+
+
+class ScheduleSession:
+    """
+    Horário editável com avaliação incremental e histórico de desfazer.
+    
+    O detalhamento reproduz get_fitness_details (decoder.py), inclusive o
+    campo 'fitness', que não inclui a sobrecarga diária; o fitness usado
+    pela otimização (evaluate_fitness) está em score.
+    """
+    
+    def __init__(
+        self,
+        individual: List[int],
+        expanded_disciplines: List[Disciplina],
+        slot_mapping: Dict[int, Slot]
+    ):
+        self._delta = DeltaEvaluator(individual, expanded_disciplines, slot_mapping)
+        self._slot_mapping = slot_mapping
+        # Movimentos que desfazem cada alteração, do mais antigo ao mais recente
+        self._historico: List[Tuple] = []
+    
+    @property
+    def chromosome(self) -> List[int]:
+        """Cromossomo atual (cópia)."""
+        return list(self._delta.genes)
+    
+    @property
+    def score(self) -> int:
+        """Fitness atual, igual a evaluate_fitness do cromossomo."""
+        return self._delta.score
+    
+    def __len__(self) -> int:
+        """Número de alterações que podem ser desfeitas."""
+        return len(self._historico)
+    
+    def details(self) -> Dict:
+        """Detalhamento do fitness atual, com as chaves de get_fitness_details."""
+        totais = [sum(valores) for valores in zip(*self._delta.componentes_codigo.values())]
+        if not totais:
+            totais = [0] * len(COMPONENTES_DISCIPLINA)
+        detalhes = dict(zip(COMPONENTES_DISCIPLINA, totais))
+        
+        pen_lac = self._delta.pen_lacuna
+        fitness = (BASE_SCORE
+                   - self._delta.pen_professor
+                   - self._delta.pen_periodo
+                   - detalhes['penalidade_fragmentacao']
+                   - detalhes['penalidade_pulverizacao']
+                   - detalhes['penalidade_salto_temporal']
+                   - detalhes['penalidade_concentracao']
+                   - pen_lac
+                   - detalhes['penalidade_overload']
+                   - detalhes['penalidade_blocos_incompletos']
+                   + detalhes['bonificacao_sequencial'])
+        
+        return {
+            'fitness': fitness,
+            'base_score': BASE_SCORE,
+            'penalidade_professor': self._delta.pen_professor,
+            'penalidade_periodo': self._delta.pen_periodo,
+            'penalidade_fragmentacao': detalhes['penalidade_fragmentacao'],
+            'penalidade_pulverizacao': detalhes['penalidade_pulverizacao'],
+            'penalidade_salto_temporal': detalhes['penalidade_salto_temporal'],
+            'penalidade_concentracao': detalhes['penalidade_concentracao'],
+            'penalidade_lacuna': pen_lac,
+            'penalidade_overload': detalhes['penalidade_overload'],
+            'penalidade_blocos_incompletos': detalhes['penalidade_blocos_incompletos'],
+            'bonificacao_sequencial': detalhes['bonificacao_sequencial'],
+            'blocos_ideais': detalhes['blocos_ideais'],
+            'blocos_overload': detalhes['blocos_overload'],
+            'aulas_isoladas': detalhes['aulas_isoladas']
+        }
+    
+    def _validar_gene(self, gene: int) -> None:
+        if not 0 <= gene < len(self._delta.genes):
+            raise IndexError(f"Gene {gene} fora do cromossomo (0 a {len(self._delta.genes) - 1})")
+    
+    def move(self, gene: int, slot_id: int) -> Dict:
+        """Move a aula do gene para slot_id e retorna o novo detalhamento."""
+        self._validar_gene(gene)
+        if slot_id not in self._slot_mapping:
+            raise ValueError(f"Slot {slot_id} inexistente")
+        self._historico.append(("move", gene, self._delta.genes[gene]))
+        self._delta.move(gene, slot_id)
+        return self.details()
+    
+    def swap(self, g1: int, g2: int) -> Dict:
+        """Troca os slots das aulas g1 e g2 e retorna o novo detalhamento."""
+        self._validar_gene(g1)
+        self._validar_gene(g2)
+        self._historico.append(("swap", g1, g2))
+        self._delta.swap(g1, g2)
+        return self.details()
+    
+    def undo(self) -> Dict:
+        """Desfaz a última alteração e retorna o detalhamento resultante."""
+        if not self._historico:
+            raise IndexError("Nenhuma alteração para desfazer")
+        tipo, i, alvo = self._historico.pop()
+        if tipo == "swap":
+            self._delta.swap(i, alvo)
+        else:
+            self._delta.move(i, alvo)
+        return self.details()
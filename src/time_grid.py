@@ -0,0 +1,157 @@
+"""
+Grade de tempo indexada, derivada de horarios.csv.
+
+Converte cada slot em (índice do dia, índice do horário) uma única vez, para
+que penalidades e visualizações não dependam de listas fixas de dias e
+horários nem de buscas lineares por gene.
+
+A ordem dos horários vem dos próprios slots, ordenados pelo horário de início
+(como tempo, não como texto). Um intervalo entre o fim de um horário e o início
+do seguinte maior que INTERVALO_MAXIMO_SEQUENCIA é uma quebra de sequência: a
+grade reserva um índice vago para ele, rotulado com o horário em que o
+intervalo começa (ex.: 09:10), de modo que as aulas antes e depois dele não
+contam como consecutivas.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from . import config
+from .models import Slot
+
+# Nomes por extenso usados na exportação (dias ausentes usam o próprio código)
+NOMES_DIAS = {
+    'SEG': 'Segunda', 'TER': 'Terça', 'QUA': 'Quarta', 'QUI': 'Quinta',
+    'SEX': 'Sexta', 'SAB': 'Sábado', 'DOM': 'Domingo'
+}
+
+
+@dataclass
+class TimeGrid:
+    """Índices de dia e horário de cada slot."""
+    dias: List[str]                  # dias na ordem em que aparecem em horarios.csv
+    horarios: List[str]              # horários de início; a posição é o índice do horário
+    slot_dia: Dict[int, str]         # slot_id -> dia
+    slot_dia_idx: Dict[int, int]     # slot_id -> índice do dia
+    slot_hora_idx: Dict[int, int]    # slot_id -> índice do horário
+    dia_array: np.ndarray            # índice do dia por slot_id (-1 para ids inexistentes)
+    hora_array: np.ndarray           # índice do horário por slot_id (-1 para ids inexistentes)
+    
+    @property
+    def num_horarios(self) -> int:
+        """Quantidade de índices de horário por dia."""
+        return len(self.horarios)
+
+
+def minutos(horario: str) -> int:
+    """Converte HH:MM (ou H:MM) em minutos desde 00:00."""
+    hh, _, mm = horario.partition(':')
+    return int(hh) * 60 + int(mm)
+
+
+def derivar_ordem_horarios(
+    slots: Iterable[Slot],
+    intervalo_maximo: int = config.INTERVALO_MAXIMO_SEQUENCIA
+) -> List[str]:
+    """
+    Ordem dos horários de início derivada dos slots, com as quebras de sequência.
+    
+    Os horários de início distintos são ordenados como tempo. Quando o
+    intervalo entre o fim de um horário e o início do seguinte passa de
+    intervalo_maximo minutos, um índice vago (rotulado com o fim do horário
+    anterior) é inserido entre eles.
+    """
+    fim_por_inicio: Dict[str, str] = {}
+    for slot in slots:
+        atual = fim_por_inicio.get(slot.inicio)
+        if atual is None or minutos(slot.fim) > minutos(atual):
+            fim_por_inicio[slot.inicio] = slot.fim
+    
+    ordem: List[str] = []
+    fim_anterior = None
+    for inicio in sorted(fim_por_inicio, key=minutos):
+        if fim_anterior is not None and minutos(inicio) - minutos(fim_anterior) > intervalo_maximo:
+            ordem.append(fim_anterior)
+        ordem.append(inicio)
+        fim_anterior = fim_por_inicio[inicio]
+    return ordem
+
+
+def build_time_grid(slots: Iterable[Slot], ordem_horarios: Optional[List[str]] = None) -> TimeGrid:
+    """
+    Constrói a grade de tempo a partir dos slots.
+    
+    Args:
+        slots: Slots de horário (ordem de horarios.csv)
+        ordem_horarios: Ordem explícita dos horários de início. Se None, usa
+            config.ORDEM_HORARIOS; se esta também for None (padrão), a ordem
+            é derivada dos slots (ver derivar_ordem_horarios)
+    
+    Returns:
+        Grade de tempo indexada
+    
+    Raises:
+        ValueError: Se algum slot começar em um horário fora da ordem configurada
+    """
+    slots = list(slots)
+    if ordem_horarios is None:
+        ordem_horarios = config.ORDEM_HORARIOS
+    if ordem_horarios is None:
+        ordem_horarios = derivar_ordem_horarios(slots)
+    
+    hora_pos = {h: i for i, h in enumerate(ordem_horarios)}
+    dias: List[str] = []
+    dia_pos: Dict[str, int] = {}
+    slot_dia, slot_dia_idx, slot_hora_idx = {}, {}, {}
+    
+    for slot in slots:
+        if slot.inicio not in hora_pos:
+            raise ValueError(
+                f"Slot {slot.slot_id} ({slot.dia} {slot.inicio}) começa em um horário "
+                f"fora de ORDEM_HORARIOS: {list(ordem_horarios)}"
+            )
+        if slot.dia not in dia_pos:
+            dia_pos[slot.dia] = len(dias)
+            dias.append(slot.dia)
+        slot_dia[slot.slot_id] = slot.dia
+        slot_dia_idx[slot.slot_id] = dia_pos[slot.dia]
+        slot_hora_idx[slot.slot_id] = hora_pos[slot.inicio]
+    
+    tamanho = max(slot_dia, default=-1) + 1
+    dia_array = np.full(max(tamanho, 0), -1, dtype=np.int16)
+    hora_array = np.full(max(tamanho, 0), -1, dtype=np.int16)
+    for slot_id in slot_dia:
+        if slot_id >= 0:
+            dia_array[slot_id] = slot_dia_idx[slot_id]
+            hora_array[slot_id] = slot_hora_idx[slot_id]
+    
+    return TimeGrid(
+        dias=dias,
+        horarios=list(ordem_horarios),
+        slot_dia=slot_dia,
+        slot_dia_idx=slot_dia_idx,
+        slot_hora_idx=slot_hora_idx,
+        dia_array=dia_array,
+        hora_array=hora_array,
+    )
+
+
+# Grades já construídas, indexadas pela identidade do slot_mapping. O próprio
+# mapeamento é guardado junto para que seu id não seja reutilizado.
+_GRID_CACHE: Dict[int, Tuple[Dict[int, Slot], TimeGrid]] = {}
+
+
+def time_grid_for(slot_mapping: Dict[int, Slot]) -> TimeGrid:
+    """Retorna a grade de tempo de um slot_mapping, construindo-a apenas uma vez."""
+    entry = _GRID_CACHE.get(id(slot_mapping))
+    if entry is not None and entry[0] is slot_mapping:
+        return entry[1]
+    
+    grade = build_time_grid(slot_mapping.values())
+    if len(_GRID_CACHE) >= 8:
+        # Descarta apenas a entrada mais antiga
+        _GRID_CACHE.pop(next(iter(_GRID_CACHE)))
+    _GRID_CACHE[id(slot_mapping)] = (slot_mapping, grade)
+    return grade
@@ -2,29 +2,27 @@
 Funções de visualização e exportação de horários.
 """
 
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-# Verificar bibliotecas opcionais
-try:
-    from tabulate import tabulate
-    HAS_TABULATE = True
-except ImportError:
-    HAS_TABULATE = False
+from .time_grid import NOMES_DIAS, TimeGrid
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    console = Console()
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
+# Verificar bibliotecas opcionais sem importá-las: tabulate e matplotlib só
+# são carregadas no momento da renderização
+HAS_TABULATE = find_spec("tabulate") is not None
+HAS_MATPLOTLIB = find_spec("matplotlib") is not None
+
+
+def _turma(item: Dict) -> tuple:
+    """Turma (curso, período) de uma aula; horários antigos não têm curso."""
+    return item.get('curso', ''), item['periodo']
 
-try:
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+
+def _titulo_turma(turma: tuple) -> str:
+    """Título da grade de uma turma ("Período 1" ou "CC - Período 1")."""
+    curso, periodo = turma
+    return f"{curso} - Período {periodo}" if curso else f"Período {periodo}"
 
 
 def print_schedule(schedule: List[Dict], fitness_info: Dict):
@@ -61,13 +59,13 @@ def print_schedule(schedule: List[Dict], fitness_info: Dict):
     print(f"   - Aulas Isoladas: {fitness_info['aulas_isoladas']}")
     print("\n")
     
-    periodos = sorted(set(item['periodo'] for item in schedule))
+    periodos = sorted(set(_turma(item) for item in schedule))
     
     for periodo in periodos:
-        period_schedule = [s for s in schedule if s['periodo'] == periodo]
+        period_schedule = [s for s in schedule if _turma(s) == periodo]
         
         print(f"\n{'─' * 80}")
-        print(f"PERÍODO {periodo}")
+        print(_titulo_turma(periodo).upper())
         print(f"{'─' * 80}\n")
         
         table_data = [
@@ -83,6 +81,7 @@ def print_schedule(schedule: List[Dict], fitness_info: Dict):
         headers = ["Dia", "Horário", "Disciplina", "Professor"]
         
         if HAS_TABULATE:
+            from tabulate import tabulate
             print(tabulate(table_data, headers=headers, tablefmt="grid"))
         else:
             print(f"{'Dia':<5} | {'Horário':<13} | {'Disciplina':<27} | {'Professor':<28}")
@@ -91,15 +90,33 @@ def print_schedule(schedule: List[Dict], fitness_info: Dict):
                 print(f"{row[0]:<5} | {row[1]:<13} | {row[2]:<27} | {row[3]:<28}")
 
 
-def export_html(schedule: List[Dict], output_path: Path = Path("horario_final.html")):
-    """Exporta a grade horária para um arquivo HTML em formato de grade."""
+def export_html(
+    schedule: List[Dict],
+    output_path: Path = Path("horario_final.html"),
+    grade: Optional[TimeGrid] = None,
+    verbose: bool = True
+):
+    """
+    Exporta a grade horária para um arquivo HTML em formato de grade.
+    
+    A ordem de dias e horários vem da grade de tempo (derivada de horarios.csv);
+    sem ela, é usada a ordem em que aparecem no próprio horário.
+    """
     
     # Criar estrutura de dados organizada por período, dia e horário
-    dias_ordem = ['SEG', 'TER', 'QUA', 'QUI', 'SEX']
-    periodos = sorted(set(item['periodo'] for item in schedule))
+    periodos = sorted(set(_turma(item) for item in schedule))
+    if grade is not None:
+        dias_ordem = list(grade.dias)
+        ordem_hora = {h: i for i, h in enumerate(grade.horarios)}
+    else:
+        dias_ordem = list(dict.fromkeys(item['dia'] for item in schedule))
+        ordem_hora = {}
     
     # Obter todos os horários únicos ordenados
-    horarios_unicos = sorted(set((item['inicio'], item['fim']) for item in schedule))
+    horarios_unicos = sorted(
+        set((item['inicio'], item['fim']) for item in schedule),
+        key=lambda h: (ordem_hora.get(h[0], len(ordem_hora)), h)
+    )
     
     html_content = """<!DOCTYPE html>
 <html lang="pt-BR">
@@ -183,20 +200,20 @@ def export_html(schedule: List[Dict], output_path: Path = Path("horario_final.ht
 <body>
     <h1>Horário - Ciência da Computação UTFPR Santa Helena</h1>
 """
-    
+
     # Gerar grade para cada período
     for periodo in periodos:
-        period_schedule = [s for s in schedule if s['periodo'] == periodo]
+        period_schedule = [s for s in schedule if _turma(s) == periodo]
         
         # Criar mapeamento (horário, dia) -> disciplina
-        grade = {}
+        celulas = {}
         for item in period_schedule:
             key = ((item['inicio'], item['fim']), item['dia'])
-            if key not in grade:
-                grade[key] = []
-            grade[key].append(item)
+            if key not in celulas:
+                celulas[key] = []
+            celulas[key].append(item)
         
-        html_content += f"\n    <h2>Período {periodo}</h2>\n"
+        html_content += f"\n    <h2>{_titulo_turma(periodo)}</h2>\n"
         html_content += '    <div class="grade-container">\n'
         html_content += "    <table>\n"
         
@@ -204,8 +221,7 @@ def export_html(schedule: List[Dict], output_path: Path = Path("horario_final.ht
         html_content += "        <tr>\n"
         html_content += '            <th class="horario-col">Horário</th>\n'
         for dia in dias_ordem:
-            dia_nome = {'SEG': 'Segunda', 'TER': 'Terça', 'QUA': 'Quarta', 
-                       'QUI': 'Quinta', 'SEX': 'Sexta'}[dia]
+            dia_nome = NOMES_DIAS.get(dia, dia)
             html_content += f'            <th>{dia_nome}</th>\n'
         html_content += "        </tr>\n"
         
@@ -216,8 +232,8 @@ def export_html(schedule: List[Dict], output_path: Path = Path("horario_final.ht
             
             for dia in dias_ordem:
                 key = ((inicio, fim), dia)
-                if key in grade:
-                    disciplinas = grade[key]
+                if key in celulas:
+                    disciplinas = celulas[key]
                     cell_content = '<br><br>'.join([
                         f'<span class="disciplina-nome">{d["disciplina"]}</span><br>'
                         f'<span class="professor-nome">{d["professor"]}</span>' 
@@ -237,13 +253,15 @@ def export_html(schedule: List[Dict], output_path: Path = Path("horario_final.ht
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(html_content)
     
-    print(f"\nHorário exportado para: {output_path}")
+    if verbose:
+        print(f"\nHorário exportado para: {output_path}")
 
 
 def plot_fitness_evolution(
     best_fitness: List[float],
     avg_fitness: List[float],
-    output_path: Path = Path("fitness_evolution.png")
+    output_path: Path = Path("fitness_evolution.png"),
+    verbose: bool = True
 ):
     """
     Plota a evolução do fitness ao longo das gerações.
@@ -252,6 +270,10 @@ def plot_fitness_evolution(
         print("Matplotlib não disponível. Gráfico não será gerado.")
         return
     
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    
     generations = list(range(1, len(best_fitness) + 1))
     
     plt.figure(figsize=(12, 6))
@@ -266,5 +288,6 @@ def plot_fitness_evolution(
     plt.tight_layout()
     
     plt.savefig(output_path, dpi=300)
-    print(f"Gráfico salvo em: {output_path}")
+    if verbose:
+        print(f"Gráfico salvo em: {output_path}")
     plt.close()
@@ -0,0 +1,123 @@
+"""
+Replanejamento a partir de uma execução anterior (warm start).
+
+Carrega o horário de uma execução anterior (top_individuals.pkl ou
+schedule_rank_N.json em outputs/run_*) e o mapeia para a instância atual pelo
+código da disciplina e pelo horário (dia, início, fim) de cada aula, de modo
+que o mapeamento continua válido quando disciplinas, professores ou slots
+mudam entre as execuções:
+
+- aulas cujo horário ainda existe ficam no mesmo slot (referência)
+- aulas novas, de disciplinas novas ou de horários removidos recebem um slot
+  válido aleatório e ficam sem referência (None)
+- aulas de disciplinas removidas (ou excedentes) são descartadas
+
+A população inicial é formada pelo horário mapeado e por perturbações dele;
+opcionalmente a avaliação penaliza aulas deslocadas (ver penalidade_desvio em
+fitness.py e PESO_DESVIO em config.py).
+"""
+
+import json
+import pickle
+import random
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from deap import base
+
+from .models import Disciplina, Slot
+from .decoder import decode_schedule
+from .config import WARM_START_INDPB
+
+# Horário anterior: código da disciplina -> horários (dia, início, fim) das aulas
+HorarioAnterior = Dict[str, List[Tuple[str, str, str]]]
+
+
+def carregar_horario_anterior(caminho: Path, rank: int = 1) -> HorarioAnterior:
+    """
+    Lê o horário de uma execução anterior.
+    
+    Args:
+        caminho: top_individuals.pkl, schedule_rank_N.json ou o diretório da
+            execução (usa schedule_rank_{rank}.json, ou o pkl se não existir)
+        rank: Posição do horário no pkl (1 = melhor); ignorado para JSON
+    
+    Returns:
+        Horários das aulas agrupados por código da disciplina
+    """
+    caminho = Path(caminho)
+    if caminho.is_dir():
+        json_rank = caminho / f"schedule_rank_{rank}.json"
+        caminho = json_rank if json_rank.exists() else caminho / "top_individuals.pkl"
+    
+    if caminho.suffix == ".pkl":
+        with open(caminho, "rb") as f:
+            dados = pickle.load(f)
+        individuos = dados["top_individuals"]
+        if not 1 <= rank <= len(individuos):
+            raise ValueError(f"Rank {rank} inexistente em {caminho} ({len(individuos)} indivíduos)")
+        aulas = decode_schedule(individuos[rank - 1], dados["expanded_disciplines"], dados["slot_mapping"])
+    else:
+        with open(caminho, encoding="utf-8") as f:
+            aulas = json.load(f)["schedule"]
+    
+    anterior: HorarioAnterior = defaultdict(list)
+    for aula in aulas:
+        anterior[aula["codigo"]].append((aula["dia"], aula["inicio"], aula["fim"]))
+    return dict(anterior)
+
+
+def mapear_para_instancia(
+    anterior: HorarioAnterior,
+    expanded_disciplines: List[Disciplina],
+    slot_mapping: Dict[int, Slot],
+    valid_slot_ids: List[int]
+) -> Tuple[List[int], List[Optional[int]], int]:
+    """
+    Mapeia o horário anterior para o cromossomo da instância atual.
+    
+    Returns:
+        Tupla (cromossomo, referência, aulas mapeadas): a referência tem o slot
+        anterior de cada gene, ou None para genes sem correspondência (que
+        recebem um slot aleatório no cromossomo)
+    """
+    slot_por_horario = {(s.dia, s.inicio, s.fim): sid for sid, s in slot_mapping.items()}
+    pendentes = {
+        codigo: [slot_por_horario.get(h) for h in horarios]
+        for codigo, horarios in anterior.items()
+    }
+    
+    referencia: List[Optional[int]] = []
+    for disc in expanded_disciplines:
+        fila = pendentes.get(disc.codigo)
+        referencia.append(fila.pop(0) if fila else None)
+    
+    cromossomo = [ref if ref is not None else random.choice(valid_slot_ids) for ref in referencia]
+    mapeadas = sum(ref is not None for ref in referencia)
+    return cromossomo, referencia, mapeadas
+
+
+def semear_populacao(
+    toolbox: base.Toolbox,
+    cromossomo: List[int],
+    referencia: List[Optional[int]],
+    tamanho: int,
+    indpb: float = WARM_START_INDPB
+) -> List:
+    """
+    População inicial: o horário mapeado e tamanho - 1 perturbações dele.
+    
+    Cada perturbação muda cada gene com probabilidade indpb; genes sem
+    referência são sempre sorteados, já que não há horário anterior a manter.
+    """
+    base_ind = toolbox.individual()
+    base_ind[:] = cromossomo
+    populacao = [base_ind]
+    for _ in range(tamanho - 1):
+        ind = toolbox.clone(base_ind)
+        for i, ref in enumerate(referencia):
+            if ref is None or random.random() < indpb:
+                ind[i] = toolbox.attr_slot()
+        populacao.append(ind)
+    return populacao
@@ -0,0 +1,39 @@
+"""
+Fixtures compartilhadas pelos testes: a instância de CSVs/ e cromossomos
+aleatórios (com conflitos, blocos e lacunas variados).
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.data_loader import load_compiled_problem  # noqa: E402
+
+NUM_CROMOSSOMOS = 60
+
+
+@pytest.fixture(scope="session")
+def problem():
+    return load_compiled_problem(RAIZ / "CSVs")
+
+
+@pytest.fixture(scope="session")
+def cromossomos(problem):
+    """Cromossomos aleatórios; metade concentra as aulas em poucos dias."""
+    rng = random.Random(7)
+    ids = problem.valid_slot_ids
+    dias = sorted({slot.dia for slot in problem.slot_mapping.values()})
+    resultado = []
+    for k in range(NUM_CROMOSSOMOS):
+        if k % 2:
+            escolhidos = set(rng.sample(dias, 2))
+            candidatos = [s for s in ids if problem.slot_mapping[s].dia in escolhidos]
+        else:
+            candidatos = ids
+        resultado.append([rng.choice(candidatos) for _ in range(problem.chromosome_size)])
+    return resultado
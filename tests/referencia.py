@@ -0,0 +1,76 @@
+"""
+Recontagens diretas sobre o horário, sem bitsets, padrões diários nem vetor
+de características: a referência dos testes de paridade dos caminhos rápidos.
+"""
+
+from collections import defaultdict
+from itertools import combinations
+
+from src.config import (
+    PESO_CONFLITO_PERIODO,
+    PESO_CONFLITO_PROFESSOR,
+    PESO_LACUNA,
+    PESO_SOBRECARGA_DIARIA,
+)
+from src.fitness import (
+    BASE_SCORE,
+    bonificacao_aulas_sequenciais,
+    compute_discipline_daily_spread,
+    compute_temporal_jump_penalty,
+    contar_ocupacao_periodos,
+    count_consecutive_blocks,
+    get_daily_distribution,
+    penalidade_blocos_incompletos,
+    penalidade_concentracao,
+    penalidade_fragmentacao_disciplina,
+    penalidade_overload_sequencial,
+    penalidade_pulverizacao_semanal,
+    penalidade_salto_temporal,
+)
+
+
+def pares_em_conflito(individual, expanded_disciplines, slot_mapping, grupo):
+    """Pares de disciplinas distintas do mesmo grupo no mesmo horário."""
+    ocupacao = defaultdict(set)
+    for gene, disc in zip(individual, expanded_disciplines):
+        slot = slot_mapping[gene]
+        ocupacao[(grupo(disc), slot.dia, slot.inicio, slot.fim)].add(disc.codigo)
+    return sum(len(list(combinations(codigos, 2))) for codigos in ocupacao.values())
+
+
+def componentes_referencia(individual, expanded_disciplines, slot_mapping):
+    """Componentes de DayPatterns.totais pelas funções com dicionários."""
+    distribuicao = get_daily_distribution(individual, expanded_disciplines, slot_mapping)
+    blocos = count_consecutive_blocks(distribuicao)
+    spread = compute_discipline_daily_spread(distribuicao)
+    saltos = compute_temporal_jump_penalty(distribuicao)
+    return (
+        penalidade_fragmentacao_disciplina(spread),
+        penalidade_pulverizacao_semanal(spread),
+        penalidade_salto_temporal(saltos),
+        penalidade_concentracao(distribuicao),
+        penalidade_overload_sequencial(blocos),
+        penalidade_blocos_incompletos(blocos),
+        bonificacao_aulas_sequenciais(blocos),
+        sum(info['blocos_ideais'] for info in blocos.values()),
+        sum(info['blocos_overload'] for info in blocos.values()),
+        sum(info['aulas_isoladas'] for info in blocos.values()),
+    )
+
+
+def fitness_referencia(individual, expanded_disciplines, slot_mapping):
+    """evaluate_fitness recalculado sem bitsets, padrões diários nem vetor."""
+    pares_professor = pares_em_conflito(individual, expanded_disciplines, slot_mapping,
+                                        lambda disc: disc.professor)
+    pares_periodo = pares_em_conflito(individual, expanded_disciplines, slot_mapping,
+                                      lambda disc: disc.turma)
+    (frag, pulv, salto, conc, overload, incompletos,
+     bonus) = componentes_referencia(individual, expanded_disciplines, slot_mapping)[:7]
+    lacunas, excesso = contar_ocupacao_periodos(individual, expanded_disciplines, slot_mapping)
+    return (BASE_SCORE
+            - pares_professor * PESO_CONFLITO_PROFESSOR
+            - pares_periodo * PESO_CONFLITO_PERIODO
+            - frag - pulv - salto - conc - overload - incompletos
+            - lacunas * PESO_LACUNA
+            - excesso * PESO_SOBRECARGA_DIARIA
+            + bonus)
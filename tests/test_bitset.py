@@ -0,0 +1,18 @@
+"""Paridade dos conflitos em bitsets (bitset.py) com a contagem direta."""
+
+from src.bitset import bitsets_for
+from src.config import PESO_CONFLITO_PERIODO, PESO_CONFLITO_PROFESSOR
+from src.fitness import penalidade_conflito_periodo, penalidade_conflito_professor
+
+from referencia import pares_em_conflito
+
+
+def test_conflitos(problem, cromossomos):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    bitsets = bitsets_for(exp, sm)
+    for ind in cromossomos:
+        pares_professor = pares_em_conflito(ind, exp, sm, lambda disc: disc.professor)
+        pares_periodo = pares_em_conflito(ind, exp, sm, lambda disc: disc.turma)
+        assert bitsets.conflitos(ind) == (pares_professor, pares_periodo)
+        assert penalidade_conflito_professor(ind, exp, sm) == pares_professor * PESO_CONFLITO_PROFESSOR
+        assert penalidade_conflito_periodo(ind, exp, sm) == pares_periodo * PESO_CONFLITO_PERIODO
@@ -0,0 +1,43 @@
+"""
+Codificação por blocos (block_encoding.py): partição das aulas e
+decodificação apenas em horários consecutivos, sem atravessar intervalos.
+"""
+
+import random
+
+import pytest
+
+from src.block_encoding import BlockEncoding, particionar_aulas
+from src.config import INTERVALO_MAXIMO_SEQUENCIA
+from src.time_grid import minutos
+
+
+@pytest.mark.parametrize("aulas, blocos", [
+    (0, []), (1, [1]), (3, [3]), (4, [2, 2]), (5, [3, 2]), (6, [3, 3]), (7, [3, 2, 2]),
+])
+def test_particionar_aulas(aulas, blocos):
+    assert particionar_aulas(aulas) == blocos
+
+
+def test_blocos_em_horarios_consecutivos(problem):
+    codificacao = BlockEncoding(problem.expanded_disciplines, problem.slot_mapping)
+    grade = problem.time_grid
+    slots = problem.slot_mapping
+    assert sum(codificacao.tamanhos) == problem.chromosome_size
+    
+    rng = random.Random(3)
+    for _ in range(200):
+        individuo = [rng.randrange(n) for n in codificacao.num_posicoes]
+        cromossomo = codificacao.decodificar(individuo)
+        assert len(cromossomo) == problem.chromosome_size
+        for tamanho, inicio, disciplina in zip(
+            codificacao.tamanhos, codificacao.inicio_gene, codificacao.disciplinas
+        ):
+            assert all(d == disciplina for d in problem.expanded_disciplines[inicio:inicio + tamanho])
+            bloco = cromossomo[inicio:inicio + tamanho]
+            for anterior, seguinte in zip(bloco, bloco[1:]):
+                assert grade.slot_dia[seguinte] == grade.slot_dia[anterior]
+                assert grade.slot_hora_idx[seguinte] == grade.slot_hora_idx[anterior] + 1
+                # O índice vago do intervalo da manhã (09:10) separa as sequências
+                intervalo = minutos(slots[seguinte].inicio) - minutos(slots[anterior].fim)
+                assert intervalo <= INTERVALO_MAXIMO_SEQUENCIA
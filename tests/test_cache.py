@@ -0,0 +1,61 @@
+"""
+Cache de instâncias compiladas (cache.py): ida e volta pelos arquivos .npy e
+invalidação do hash quando os CSVs ou as configurações relevantes mudam.
+"""
+
+import shutil
+
+import numpy as np
+
+from conftest import RAIZ
+from src import config
+from src.cache import instance_hash, load_cached_problem, load_problem, save_problem
+from src.fitness import evaluate_fitness
+
+
+def _avaliar(problem, cromossomo):
+    return evaluate_fitness(
+        cromossomo, problem.expanded_disciplines, problem.slot_mapping, problem.disciplinas
+    )
+
+
+def test_ida_e_volta(problem, cromossomos, tmp_path):
+    save_problem(problem, tmp_path / "instancia")
+    carregado = load_problem(tmp_path / "instancia")
+    
+    assert carregado.disciplinas == problem.disciplinas
+    assert carregado.slots == problem.slots
+    assert carregado.periodos == problem.periodos
+    assert carregado.professores == problem.professores
+    for nome in ("gene_disciplina", "disciplina_periodo", "disciplina_professor", "slot_ids"):
+        assert np.array_equal(getattr(carregado, nome), getattr(problem, nome)), nome
+    assert carregado.valid_slot_ids == problem.valid_slot_ids
+    for cromossomo in cromossomos:
+        assert _avaliar(carregado, cromossomo) == _avaliar(problem, cromossomo)
+
+
+def test_load_cached_problem(tmp_path):
+    cache_dir = tmp_path / "cache"
+    _, caminho, acerto = load_cached_problem(RAIZ / "CSVs", cache_dir)
+    assert not acerto and caminho.is_dir()
+    _, caminho_2, acerto = load_cached_problem(RAIZ / "CSVs", cache_dir)
+    assert acerto and caminho_2 == caminho
+
+
+def test_hash_muda_com_os_csvs(tmp_path):
+    csv_dir = tmp_path / "CSVs"
+    shutil.copytree(RAIZ / "CSVs", csv_dir)
+    original = instance_hash(csv_dir)
+    assert instance_hash(csv_dir) == original
+    
+    horarios = csv_dir / "horarios.csv"
+    conteudo = bytearray(horarios.read_bytes())
+    conteudo[-2] = ord("9") if conteudo[-2] != ord("9") else ord("8")
+    horarios.write_bytes(bytes(conteudo))
+    assert instance_hash(csv_dir) != original
+
+
+def test_hash_muda_com_ordem_horarios(monkeypatch):
+    original = instance_hash(RAIZ / "CSVs")
+    monkeypatch.setattr(config, "ORDEM_HORARIOS", ["07:30", "08:20"])
+    assert instance_hash(RAIZ / "CSVs") != original
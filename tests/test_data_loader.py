@@ -0,0 +1,97 @@
+"""
+Carga dos CSVs (data_loader.py): validação por linha no leitor em streaming
+e instâncias com vários cursos (disciplinas_<CURSO>.csv).
+"""
+
+import re
+
+import pytest
+
+from src.bitset import bitsets_for
+from src.data_loader import arquivos_disciplinas, load_compiled_problem
+
+HORARIOS = """slot_id,dia,inicio,fim
+1,SEG,07:30,08:20
+2,SEG,08:20,09:10
+3,TER,07:30,08:20
+"""
+
+CABECALHO_DISCIPLINAS = "periodo,codigo,nome,carga_horaria,professor,aulas_semanais\n"
+
+
+def _instancia(diretorio, disciplinas, horarios=HORARIOS):
+    """Grava horarios.csv e os arquivos de disciplinas ({nome do arquivo: linhas})."""
+    diretorio.mkdir(exist_ok=True)
+    (diretorio / "horarios.csv").write_text(horarios, encoding="utf-8")
+    for nome, linhas in disciplinas.items():
+        (diretorio / nome).write_text(CABECALHO_DISCIPLINAS + linhas, encoding="utf-8")
+    return diretorio
+
+
+def test_carga_em_streaming(tmp_path):
+    csv_dir = _instancia(tmp_path, {"disciplinas.csv": "1,A1,Álgebra,30,Ana,2\n1,B1,Banco,30,Bia,1\n"})
+    problem = load_compiled_problem(csv_dir, engine="csv")
+    assert [d.codigo for d in problem.disciplinas] == ["A1", "B1"]
+    assert problem.chromosome_size == 3
+    assert sorted(problem.slot_mapping) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("arquivo, conteudo, mensagem", [
+    ("disciplinas.csv", "1,A1,Álgebra,30,Ana,2\n1,B1,Banco,trinta,Bia,1\n",
+     "disciplinas.csv, linha 3: valor inválido para 'carga_horaria'"),
+    ("disciplinas.csv", "1,A1,Álgebra,30,Ana,0\n",
+     "disciplinas.csv, linha 2: 'aulas_semanais' deve ser >= 1"),
+    ("horarios.csv", HORARIOS + "4,TER,8h20,09:10\n",
+     "horarios.csv, linha 5: horário inválido em 'inicio'"),
+    ("horarios.csv", HORARIOS + "2,TER,08:20,09:10\n",
+     "horarios.csv, linha 5: slot_id 2 duplicado (já definido na linha 3)"),
+], ids=["inteiro", "minimo", "horario", "slot_duplicado"])
+def test_erro_com_numero_da_linha(tmp_path, arquivo, conteudo, mensagem):
+    csv_dir = _instancia(tmp_path, {"disciplinas.csv": "1,A1,Álgebra,30,Ana,2\n"})
+    if arquivo == "horarios.csv":
+        (csv_dir / arquivo).write_text(conteudo, encoding="utf-8")
+    else:
+        (csv_dir / arquivo).write_text(CABECALHO_DISCIPLINAS + conteudo, encoding="utf-8")
+    with pytest.raises(ValueError, match=re.escape(mensagem)):
+        load_compiled_problem(csv_dir, engine="csv")
+
+
+def test_varios_cursos(tmp_path):
+    # Mesmo período 1 nos dois cursos; Caio leciona em ambos
+    csv_dir = _instancia(tmp_path, {
+        "disciplinas_CC.csv": "1,CC1,Cálculo,30,Ana,1\n1,CC2,Circuitos,30,Caio,1\n",
+        "disciplinas_SI.csv": "1,SI1,Sistemas,30,Bia,1\n1,SI2,Segurança,30,Caio,1\n",
+        "disciplinas_.csv": "1,XX1,Ignorado,30,Zé,1\n",
+    })
+    problem = load_compiled_problem(csv_dir)
+    assert arquivos_disciplinas(csv_dir) == [("CC", csv_dir / "disciplinas_CC.csv"),
+                                             ("SI", csv_dir / "disciplinas_SI.csv")]
+    turmas = {d.codigo: d.turma for d in problem.disciplinas}
+    assert turmas == {"CC1": ("CC", 1), "CC2": ("CC", 1), "SI1": ("SI", 1), "SI2": ("SI", 1)}
+    
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    bitsets = bitsets_for(exp, sm)
+    gene = {d.codigo: i for i, d in enumerate(exp)}
+    
+    def conflitos(slots):
+        individual = [0] * len(exp)
+        for codigo, slot in slots.items():
+            individual[gene[codigo]] = slot
+        return bitsets.conflitos(individual)
+    
+    # Períodos de cursos diferentes no mesmo horário: sem conflito de período
+    assert conflitos({"CC1": 1, "SI1": 1, "CC2": 2, "SI2": 3}) == (0, 0)
+    # Mesmo curso e período no mesmo horário: um conflito de período
+    assert conflitos({"CC1": 1, "CC2": 1, "SI1": 2, "SI2": 3}) == (0, 1)
+    # O professor é comum aos cursos: Caio em CC2 e SI2 ao mesmo tempo
+    assert conflitos({"CC1": 1, "CC2": 2, "SI1": 3, "SI2": 2}) == (1, 0)
+
+
+def test_codigo_repetido_entre_cursos(tmp_path):
+    csv_dir = _instancia(tmp_path, {
+        "disciplinas_CC.csv": "1,ALG,Algoritmos,30,Ana,1\n",
+        "disciplinas_SI.csv": "1,ALG,Algoritmos,30,Bia,1\n",
+    })
+    for engine in ("csv", "pandas"):
+        with pytest.raises(ValueError, match="'ALG' repetido nos cursos 'CC' e 'SI'"):
+            load_compiled_problem(csv_dir, engine=engine)
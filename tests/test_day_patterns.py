@@ -0,0 +1,25 @@
+"""Paridade da tabela de padrões diários (day_patterns.py) com as funções de dicionários."""
+
+import pytest
+
+from src.day_patterns import day_patterns_for
+from src.fitness import compute_discipline_daily_spread, get_daily_distribution
+
+from referencia import componentes_referencia
+
+
+def test_totais(problem, cromossomos):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    padroes = day_patterns_for(exp, sm)
+    for ind in cromossomos:
+        assert padroes.totais(ind) == componentes_referencia(ind, exp, sm)
+
+
+def test_contagens(problem, cromossomos):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    padroes = day_patterns_for(exp, sm)
+    codigos = list(dict.fromkeys(disc.codigo for disc in exp))
+    for ind in cromossomos:
+        spread = compute_discipline_daily_spread(get_daily_distribution(ind, exp, sm))
+        for codigo, contagens in zip(codigos, padroes.contagens(ind)):
+            assert contagens[0] == pytest.approx(spread[codigo]['fragmentacao_por_dia'])
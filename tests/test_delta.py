@@ -0,0 +1,22 @@
+"""Avaliação incremental (delta.py) contra a avaliação completa."""
+
+import random
+
+from src.delta import DeltaEvaluator
+from src.fitness import evaluate_fitness
+
+
+def test_move_swap(problem, cromossomos):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    rng = random.Random(11)
+    ids = problem.valid_slot_ids
+    for ind in cromossomos[:10]:
+        delta = DeltaEvaluator(ind, exp, sm)
+        assert delta.fitness == evaluate_fitness(ind, exp, sm, problem.disciplinas)
+        for _ in range(40):
+            i = rng.randrange(len(ind))
+            if rng.random() < 0.5:
+                score = delta.move(i, rng.choice(ids))
+            else:
+                score = delta.swap(i, rng.randrange(len(ind)))
+            assert score == evaluate_fitness(delta.genes, exp, sm, problem.disciplinas)[0]
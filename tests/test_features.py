@@ -0,0 +1,20 @@
+"""Fitness como produto escalar do vetor de características com os pesos."""
+
+from src.decoder import detalhes_do_vetor, get_fitness_details
+from src.fitness import evaluate_fitness, pontuar, vetor_caracteristicas
+
+from referencia import fitness_referencia
+
+
+def test_evaluate_fitness(problem, cromossomos):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    for ind in cromossomos:
+        assert evaluate_fitness(ind, exp, sm, problem.disciplinas) == (fitness_referencia(ind, exp, sm),)
+
+
+def test_detalhes_do_vetor(problem, cromossomos):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    for ind in cromossomos:
+        vetor = vetor_caracteristicas(ind, exp, sm)
+        assert detalhes_do_vetor(vetor) == get_fitness_details(ind, exp, sm, problem.disciplinas)
+        assert pontuar(vetor) == evaluate_fitness(ind, exp, sm, problem.disciplinas)[0]
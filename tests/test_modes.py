@@ -0,0 +1,46 @@
+"""
+Execução curta de cada --mode de main.py, com os outputs em um diretório
+temporário: o processo deve terminar com código 0 e gravar os arquivos da
+execução (frente de Pareto nos modos multiobjetivo; resumo, características
+e horário do melhor resultado nos demais).
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Argumentos mínimos por modo (poucas gerações/iterações, um processo)
+ARGUMENTOS = {
+    "ga": ["--generations", "3", "--population", "12", "--workers", "1"],
+    "nsga2": ["--generations", "3", "--population", "12", "--workers", "1"],
+    "nsga3": ["--generations", "3", "--population", "12", "--workers", "1"],
+    "sa": ["--iterations", "200"],
+    "tabu": ["--iterations", "50"],
+    "decomposicao": ["--generations", "2", "--population", "8", "--workers", "1"],
+    "cpsat": ["--time-limit", "5"],
+}
+
+
+@pytest.mark.parametrize("modo", list(ARGUMENTOS))
+def test_modo(modo, tmp_path):
+    if modo == "cpsat":
+        pytest.importorskip("ortools")
+    resultado = subprocess.run(
+        [sys.executable, str(RAIZ / "main.py"), "--mode", modo, *ARGUMENTOS[modo],
+         "--csv-dir", str(RAIZ / "CSVs"), "--no-cache"],
+        cwd=tmp_path, capture_output=True, text=True, timeout=600
+    )
+    assert resultado.returncode == 0, resultado.stdout[-2000:] + resultado.stderr[-2000:]
+    
+    execucoes = list((tmp_path / "outputs").glob("run_*"))
+    assert len(execucoes) == 1
+    run_dir = execucoes[0]
+    if modo in ("nsga2", "nsga3"):
+        assert (run_dir / "pareto_front.json").exists()
+    else:
+        for arquivo in ("execution_summary.json", "features.npz", "schedule_rank_1.json"):
+            assert (run_dir / arquivo).exists(), arquivo
@@ -0,0 +1,46 @@
+"""
+Codificação por permutação (permutation_encoding.py): o decodificador guloso
+só produz horários sem conflitos nesta instância.
+"""
+
+import random
+
+from src.bitset import bitsets_for
+from src.permutation_encoding import PermutationEncoding
+
+from referencia import pares_em_conflito
+
+NUM_PERMUTACOES = 300
+
+
+def test_permutacoes_sem_conflitos(problem):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    codificacao = PermutationEncoding(exp, sm)
+    bitsets = bitsets_for(exp, sm)
+    rng = random.Random(11)
+    ordem = list(range(len(codificacao)))
+    for _ in range(NUM_PERMUTACOES):
+        rng.shuffle(ordem)
+        cromossomo = codificacao.decodificar(ordem)
+        assert codificacao.decodificar(ordem) == cromossomo
+        assert bitsets.conflitos(cromossomo) == (0, 0)
+        assert pares_em_conflito(cromossomo, exp, sm, lambda disc: disc.professor) == 0
+        assert pares_em_conflito(cromossomo, exp, sm, lambda disc: disc.turma) == 0
+
+
+def test_ocupacao_professor(problem):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    bit_slot = bitsets_for(exp, sm).bit_slot
+    professor = exp[0].professor
+    bloqueados = {s for s in problem.valid_slot_ids if sm[s].dia == sm[problem.valid_slot_ids[0]].dia}
+    mascara = 0
+    for slot_id in bloqueados:
+        mascara |= bit_slot[slot_id]
+    
+    codificacao = PermutationEncoding(exp, sm, ocupacao_professor={professor: mascara})
+    rng = random.Random(5)
+    ordem = list(range(len(codificacao)))
+    for _ in range(20):
+        rng.shuffle(ordem)
+        cromossomo = codificacao.decodificar(ordem)
+        assert not {s for s, disc in zip(cromossomo, exp) if disc.professor == professor} & bloqueados
@@ -0,0 +1,77 @@
+"""
+Escalonador de jobs (scheduler.py): divisão do orçamento de workers, fila
+com prioridade e limite, e cancelamento de jobs na fila e em execução.
+"""
+
+import asyncio
+
+import pytest
+
+from src.cache import save_problem
+from src.scheduler import JobScheduler
+
+TEMPO_MAXIMO = 120
+LONGO_GA = {"mode": "ga", "generations": 100000, "population": 10}
+LONGO_SA = {"mode": "sa", "iterations": 10 ** 8}
+
+
+@pytest.fixture
+def problem_path(problem, tmp_path):
+    path = tmp_path / "instancia"
+    save_problem(problem, path)
+    return str(path)
+
+
+async def _aguardar(condicao):
+    for _ in range(TEMPO_MAXIMO * 10):
+        if condicao():
+            return
+        await asyncio.sleep(0.1)
+    pytest.fail("Condição não atingida")
+
+
+def test_workers_por_job():
+    assert JobScheduler(orcamento=8, jobs_simultaneos=3).workers_por_job == 2
+    assert JobScheduler(orcamento=8, workers_por_job=16).workers_por_job == 8
+    assert JobScheduler(orcamento=1, jobs_simultaneos=4).workers_por_job == 1
+
+
+def test_orcamento_fila_e_cancelamento(problem_path):
+    async def cenario():
+        escalonador = JobScheduler(orcamento=3, workers_por_job=2, fila_maxima=2)
+        await escalonador.iniciar()
+        try:
+            with pytest.raises(ValueError):
+                escalonador.submeter("inst", problem_path, {"mode": "nsga2"})
+            
+            a = escalonador.submeter("inst", problem_path, LONGO_GA)
+            assert a.status == "executando" and escalonador.em_uso == 2
+            
+            # b (2 workers) não cabe no orçamento livre; c (1 worker) caberia,
+            # mas não ultrapassa b, que tem prioridade maior
+            b = escalonador.submeter("inst", problem_path, LONGO_GA, prioridade=5)
+            c = escalonador.submeter("inst", problem_path, LONGO_SA)
+            assert (b.status, c.status) == ("na_fila", "na_fila")
+            assert (escalonador.posicao(b.id), escalonador.posicao(c.id)) == (1, 2)
+            
+            with pytest.raises(OverflowError):
+                escalonador.submeter("inst", problem_path, LONGO_SA)
+            
+            # Cancelar b (na fila) é imediato e libera a vez de c
+            escalonador.cancelar(b.id)
+            assert b.status == "cancelado" and b.tempo_espera is not None
+            assert c.status == "executando"
+            assert escalonador.em_uso == 3 <= escalonador.orcamento
+            
+            # Jobs em execução são interrompidos e devolvem os workers
+            await _aguardar(lambda: a.eventos and c.eventos)
+            for job in (a, c):
+                escalonador.cancelar(job.id)
+            for job in (a, c):
+                await asyncio.wait_for(escalonador.aguardar(job.id), TEMPO_MAXIMO)
+                assert job.status == "cancelado"
+            assert escalonador.em_uso == 0
+        finally:
+            await escalonador.encerrar()
+    
+    asyncio.run(cenario())
@@ -0,0 +1,182 @@
+"""
+Serviço HTTP (server.py) em uma porta livre: saúde, jobs com progresso em
+NDJSON, resultado, cancelamento, avaliação e sessões what-if.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.fitness import evaluate_fitness
+from src.server import ScheduleServer
+
+from conftest import RAIZ
+
+TEMPO_MAXIMO = 120
+
+
+async def _requisitar(porta, metodo, caminho, corpo=None):
+    """
+    Envia uma requisição e retorna (status, corpo bruto).
+    
+    O corpo é lido pelo Content-Length ou até o último bloco (chunked), como
+    fazem os clientes HTTP, sem esperar o fechamento da conexão.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    dados = json.dumps(corpo).encode("utf-8") if corpo is not None else b""
+    writer.write(f"{metodo} {caminho} HTTP/1.1\r\nHost: localhost\r\n"
+                 f"Content-Length: {len(dados)}\r\n\r\n".encode("latin-1") + dados)
+    await writer.drain()
+    
+    async def ler():
+        cabecalho = await reader.readuntil(b"\r\n\r\n")
+        status = int(cabecalho.split(b" ", 2)[1])
+        cabecalhos = dict(linha.decode("latin-1").lower().split(": ", 1)
+                          for linha in cabecalho.split(b"\r\n")[1:] if linha)
+        if cabecalhos.get("transfer-encoding") == "chunked":
+            partes = []
+            while True:
+                tamanho = int(await reader.readline(), 16)
+                if tamanho == 0:
+                    return status, b"".join(partes)
+                partes.append(await reader.readexactly(tamanho))
+                await reader.readline()
+        return status, await reader.readexactly(int(cabecalhos["content-length"]))
+    
+    try:
+        return await asyncio.wait_for(ler(), TEMPO_MAXIMO)
+    finally:
+        writer.close()
+
+
+async def _json(porta, metodo, caminho, corpo=None):
+    status, conteudo = await _requisitar(porta, metodo, caminho, corpo)
+    return status, json.loads(conteudo)
+
+
+async def _aguardar_status(porta, job_id, status):
+    for _ in range(TEMPO_MAXIMO * 10):
+        _, job = await _json(porta, "GET", f"/jobs/{job_id}")
+        if job["status"] == status:
+            return job
+        await asyncio.sleep(0.1)
+    pytest.fail(f"Job {job_id} não chegou a {status}")
+
+
+def _executar(servidor, cenario):
+    """Inicia o servidor, executa o cenário com a porta e encerra o servidor."""
+    async def principal():
+        tarefa = asyncio.create_task(servidor.executar())
+        await asyncio.wait_for(servidor.pronto.wait(), TEMPO_MAXIMO)
+        try:
+            await cenario(servidor.porta)
+        finally:
+            tarefa.cancel()
+            await asyncio.gather(tarefa, return_exceptions=True)
+    asyncio.run(principal())
+
+
+@pytest.fixture
+def servidor(tmp_path, monkeypatch):
+    # Cache das instâncias compiladas no diretório temporário
+    monkeypatch.chdir(tmp_path)
+    return ScheduleServer(porta=0, jobs_simultaneos=1, fila_maxima=1, orcamento=1,
+                          csv_dir=RAIZ / "CSVs", sessoes_maximas=2)
+
+
+def test_jobs(servidor):
+    async def cenario(porta):
+        status, saude = await _json(porta, "GET", "/health")
+        assert status == 200 and saude["status"] == "ok" and saude["worker_budget"] == 1
+        
+        status, job = await _json(porta, "POST", "/solve",
+                                  {"mode": "ga", "generations": 3, "population": 10})
+        assert status == 202
+        job_id = job["job_id"]
+        
+        # Progresso: uma linha por geração e o estado final
+        status, conteudo = await _requisitar(porta, "GET", f"/jobs/{job_id}/progress")
+        linhas = [json.loads(linha) for linha in conteudo.decode("utf-8").splitlines()]
+        assert status == 200
+        assert [evento["geracao"] for evento in linhas[:-1]] == [1, 2, 3]
+        assert linhas[-1]["status"] == "concluido"
+        
+        status, resultado = await _json(porta, "GET", f"/jobs/{job_id}/result")
+        assert status == 200
+        assert resultado["fitness"] == resultado["top_fitnesses"][0]
+        assert len(resultado["chromosome"]) == len(resultado["schedule"])
+        
+        status, erro = await _json(porta, "GET", "/jobs/inexistente")
+        assert status == 404 and "error" in erro
+    
+    _executar(servidor, cenario)
+
+
+def test_cancelamento_e_fila_cheia(servidor):
+    async def cenario(porta):
+        longo = {"mode": "ga", "generations": 100000, "population": 10}
+        _, executando = await _json(porta, "POST", "/solve", longo)
+        _, na_fila = await _json(porta, "POST", "/solve", longo)
+        assert na_fila["status"] == "na_fila" and na_fila["queue_position"] == 1
+        
+        # Orçamento de 1 worker e fila de 1 job: o terceiro é recusado
+        status, erro = await _json(porta, "POST", "/solve", longo)
+        assert status == 503 and "error" in erro
+        
+        # Job na fila: cancelado imediatamente
+        status, job = await _json(porta, "DELETE", f"/jobs/{na_fila['job_id']}")
+        assert status == 200 and job["status"] == "cancelado"
+        
+        # Job em execução: interrompido na geração seguinte
+        await _aguardar_status(porta, executando["job_id"], "executando")
+        status, _ = await _json(porta, "DELETE", f"/jobs/{executando['job_id']}")
+        assert status == 200
+        await _aguardar_status(porta, executando["job_id"], "cancelado")
+        status, _ = await _json(porta, "GET", f"/jobs/{executando['job_id']}/result")
+        assert status == 409
+    
+    _executar(servidor, cenario)
+
+
+def test_avaliacao_e_sessoes(servidor, problem, cromossomos):
+    ind = cromossomos[0]
+    
+    async def cenario(porta):
+        status, avaliacao = await _json(porta, "POST", "/evaluate", {"chromosome": ind})
+        assert status == 200
+        assert avaliacao["fitness"] == evaluate_fitness(ind, problem.expanded_disciplines,
+                                                        problem.slot_mapping, problem.disciplinas)[0]
+        
+        # Cromossomos inválidos: tamanho errado e slot inexistente
+        status, _ = await _json(porta, "POST", "/evaluate", {"chromosome": ind[1:]})
+        assert status == 400
+        status, erro = await _json(porta, "POST", "/evaluate", {"chromosome": [99999] + ind[1:]})
+        assert status == 400 and "99999" in erro["error"]
+        
+        status, sessao = await _json(porta, "POST", "/sessions", {"chromosome": ind})
+        assert status == 201 and sessao["score"] == avaliacao["fitness"]
+        sessao_id = sessao["session_id"]
+        
+        slot = next(s for s in problem.valid_slot_ids if s != ind[0])
+        status, movida = await _json(porta, "POST", f"/sessions/{sessao_id}/move",
+                                     {"gene": 0, "slot": slot})
+        assert status == 200 and movida["chromosome"][0] == slot and movida["undo_available"] == 1
+        status, _ = await _json(porta, "POST", f"/sessions/{sessao_id}/move", {"gene": 0})
+        assert status == 400
+        status, desfeita = await _json(porta, "POST", f"/sessions/{sessao_id}/undo")
+        assert status == 200 and desfeita["chromosome"] == ind
+        
+        # Com até 2 sessões abertas, a terceira fecha a usada há mais tempo
+        _, outra = await _json(porta, "POST", "/sessions", {"chromosome": ind})
+        await _json(porta, "GET", f"/sessions/{sessao_id}")
+        await _json(porta, "POST", "/sessions", {"chromosome": ind})
+        status, _ = await _json(porta, "GET", f"/sessions/{outra['session_id']}")
+        assert status == 404
+        
+        status, _ = await _json(porta, "DELETE", f"/sessions/{sessao_id}")
+        assert status == 200
+        status, _ = await _json(porta, "GET", f"/sessions/{sessao_id}")
+        assert status == 404
+    
+    _executar(servidor, cenario)
@@ -0,0 +1,27 @@
+"""Sessão de edição (session.py): pontuação, detalhamento e desfazer."""
+
+import random
+
+from src.decoder import get_fitness_details
+from src.fitness import evaluate_fitness
+from src.session import ScheduleSession
+
+
+def test_edicao_e_desfazer(problem, cromossomos):
+    exp, sm = problem.expanded_disciplines, problem.slot_mapping
+    rng = random.Random(13)
+    ids = problem.valid_slot_ids
+    ind = cromossomos[0]
+    sessao = ScheduleSession(ind, exp, sm)
+    for _ in range(30):
+        if rng.random() < 0.5:
+            sessao.move(rng.randrange(len(ind)), rng.choice(ids))
+        else:
+            sessao.swap(rng.randrange(len(ind)), rng.randrange(len(ind)))
+        cromossomo = sessao.chromosome
+        assert sessao.score == evaluate_fitness(cromossomo, exp, sm, problem.disciplinas)[0]
+        assert sessao.details() == get_fitness_details(cromossomo, exp, sm, problem.disciplinas)
+    while len(sessao):
+        sessao.undo()
+    assert sessao.chromosome == ind
+    assert sessao.details() == get_fitness_details(ind, exp, sm, problem.disciplinas)